@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""批量操作基准
+
+生成一个混合操作文件（单条表现记录、团队事件、每周工作量排名、类别状态切换），
+分别统计 --dry-run 校验和实际执行的耗时，并检查执行后汇总表与明细一致。
+
+用法：
+    python benchmarks/bench_batch.py [--employees 200] [--operations 50000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tabulate import tabulate
+
+from src.core.tracker import PerformanceTracker
+
+CATEGORIES = ['技术能力', '团队协作', '创新贡献', '质量保障', '知识分享']
+
+
+def operations(employees, count):
+    """生成操作：每 1000 个操作中 1 个工作量排名、1 个类别切换，每 10 个中 1 个团队事件"""
+    for i in range(count):
+        category = CATEGORIES[i % len(CATEGORIES)]
+        if i % 1000 == 0:
+            ranked = [f'user{(i + j) % employees}' for j in range(min(employees, 20))]
+            yield {'op': 'workload', 'year': 2024, 'week': i // 1000 % 52 + 1, 'employees': ranked}
+        elif i % 1000 == 1:
+            yield {'op': 'toggle', 'category': CATEGORIES[-1], 'active': i % 2000 != 1}
+        elif i % 10 == 0:
+            yield {'op': 'event', 'category': CATEGORIES[0], 'description': f'团队事件 {i}',
+                   'employees': [f'user{(i + j) % employees}' for j in range(5)], 'score': 2}
+        else:
+            if category == CATEGORIES[-1]:
+                category = CATEGORIES[1]
+            yield {'op': 'record', 'employee': f'user{i % employees}', 'category': category,
+                   'score': i % 7 - 3, 'description': f'批量记录 {i}', 'date': f'2024-{i % 12 + 1:02d}-15'}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='批量操作基准')
+    parser.add_argument('--employees', type=int, default=200, help='员工数')
+    parser.add_argument('--operations', type=int, default=50000, help='操作数')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tracker = PerformanceTracker(os.path.join(tmp, 'bench.db'))
+        for category in CATEGORIES:
+            tracker.add_category(category, category)
+        with tracker.db.transaction() as conn:
+            conn.executemany(
+                "INSERT INTO employees (name, domain_account, department) VALUES (?, ?, '研发部')",
+                [(f'员工{i}', f'user{i}') for i in range(args.employees)]
+            )
+        tracker.dimensions.invalidate()
+
+        path = os.path.join(tmp, 'operations.jsonl')
+        with open(path, 'w', encoding='utf-8') as f:
+            for operation in operations(args.employees, args.operations):
+                f.write(json.dumps(operation, ensure_ascii=False) + '\n')
+
+        rows = []
+        for label, dry_run in (('batch --dry-run', True), ('batch', False)):
+            start = time.perf_counter()
+            steps, errors = tracker.apply_batch(path, dry_run=dry_run)
+            elapsed = time.perf_counter() - start
+            assert errors == [], errors[:5]
+            rows.append([label, args.operations, len(steps), f'{elapsed:.2f}', f'{args.operations / elapsed:,.0f}'])
+
+        assert tracker.check_score_aggregates() == []
+        tracker.db.close()
+
+    print(tabulate(rows, headers=['方式', '操作数', '变更步骤数', '耗时(s)', '操作/秒'], tablefmt='simple'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""表格渲染基准
+
+以 rec list 的行格式生成若干行（含着色分值和中文描述），比较三种渲染方式：
+
+- tabulate：全部行交给 tabulate 一次渲染（拆分分页之前的做法）；
+- 逐页 tabulate：每页单独交给 tabulate 渲染；
+- stream_table：列宽由第一页确定，之后逐行输出。
+
+统计第一行输出前的耗时和总耗时；指定 --memory 时再各渲染一遍，统计 tracemalloc 记录的峰值内存
+（tracemalloc 会使渲染慢很多倍，因此与计时分开进行）。
+
+用法：
+    python benchmarks/bench_render.py [--rows 50000] [--page-size 100] [--memory]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from itertools import islice
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import click
+from tabulate import tabulate
+
+from src.cli.common import stream_table
+
+HEADERS = ['记录ID', '员工', '部门', '类别', '分值', '描述', '记录日期']
+
+
+def rows(count):
+    """按 rec list 的格式逐行生成记录"""
+    for i in range(count):
+        score = i % 7 - 3
+        yield [
+            i + 1, f'员工{i % 500}', '研发部', '技术能力',
+            click.style(f'{score:>+6.2f}', fg='green' if score > 0 else 'red'),
+            f'完成第 {i} 项任务' + '，并补充文档' * (i % 3), f'2024-{i % 12 + 1:02d}-15',
+        ]
+
+
+def render_all(count, page_size):
+    yield tabulate(list(rows(count)), headers=HEADERS, tablefmt='simple') + '\n'
+
+
+def render_pages(count, page_size):
+    records = rows(count)
+    for page in iter(lambda: list(islice(records, page_size)), []):
+        yield tabulate(page, headers=HEADERS, tablefmt='simple') + '\n\n'
+
+
+def render_stream(count, page_size):
+    return stream_table(rows(count), HEADERS, 'simple', page_size)
+
+
+def measure(render, count, page_size):
+    """消费渲染结果，返回 (第一段输出前的秒数, 总秒数)"""
+    start = time.perf_counter()
+    first = None
+    for chunk in render(count, page_size):
+        if first is None:
+            first = time.perf_counter() - start
+    return first, time.perf_counter() - start
+
+
+def peak_memory(render, count, page_size):
+    """消费渲染结果，返回 tracemalloc 记录的峰值内存（MB）"""
+    tracemalloc.start()
+    for chunk in render(count, page_size):
+        pass
+    peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='表格渲染基准')
+    parser.add_argument('--rows', type=int, default=50000, help='行数')
+    parser.add_argument('--page-size', type=int, default=100, help='每页行数')
+    parser.add_argument('--memory', action='store_true', help='同时统计峰值内存')
+    args = parser.parse_args()
+
+    table = []
+    headers = ['方式', '首行输出(ms)', '总耗时(s)']
+    for name, render in (('tabulate', render_all), ('逐页 tabulate', render_pages), ('stream_table', render_stream)):
+        first, total = measure(render, args.rows, args.page_size)
+        table.append([name, f'{first * 1000:.1f}', f'{total:.2f}'])
+        if args.memory:
+            table[-1].append(f'{peak_memory(render, args.rows, args.page_size):.1f}')
+    if args.memory:
+        headers.append('峰值内存(MB)')
+
+    print(tabulate(table, headers=headers, tablefmt='simple'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""命令行冷启动基准
+
+对若干常用命令分别启动新的解释器进程，统计：
+
+- 进程总耗时（含解释器启动，取多次中的最短值）；
+- python -X importtime 报告的导入总耗时，以及其中最耗时的顶层模块。
+
+只显示帮助的调用有导入耗时预算（--budget，毫秒），超出时标记并以退出码 1 结束。
+耗时随机器负载波动，因此预算只在基准中检查；测试 tests/test_startup.py 只检查这些调用不加载重型模块。
+
+用法：
+    python benchmarks/bench_startup.py [--repeat 5] [--top 5] [--budget 100]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from tabulate import tabulate
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+INVOCATIONS = [
+    ['--help'],
+    ['emp', '--help'],
+    ['rec', 'search', '--help'],
+    ['import', '--help'],
+    ['export', '--help'],
+    ['emp', 'list'],
+    ['cat', 'list'],
+    ['rec', 'list'],
+    ['show', 'perf'],
+]
+
+# 只显示帮助的调用的导入耗时预算（毫秒，python -X importtime 统计）
+IMPORT_BUDGET_MS = 100
+
+RUNNER = "import sys; from src.cli.commands import cli; cli(sys.argv[1:], prog_name='perf')"
+
+
+def run(args, env, importtime=False):
+    """在新进程中执行一次命令
+
+    Returns:
+        tuple: (进程耗时秒数, stderr 文本)
+    """
+    command = [sys.executable]
+    if importtime:
+        command += ['-X', 'importtime']
+    command += ['-c', RUNNER, *args]
+    start = time.perf_counter()
+    result = subprocess.run(command, cwd=ROOT, env=env, capture_output=True, text=True)
+    return time.perf_counter() - start, result.stderr
+
+
+def parse_importtime(stderr):
+    """解析 -X importtime 输出
+
+    Returns:
+        tuple: (导入总耗时微秒, [(顶层模块, 累计耗时微秒)])
+    """
+    total, top_level = 0, []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative, name = line[len('import time:'):].split('|')
+        total += int(self_us)
+        if not name.startswith('  '):
+            top_level.append((name.strip(), int(cumulative)))
+    return total, top_level
+
+
+def main():
+    parser = argparse.ArgumentParser(description='命令行冷启动基准')
+    parser.add_argument('--repeat', type=int, default=5, help='每个命令重复次数（取最短耗时）')
+    parser.add_argument('--top', type=int, default=3, help='显示最耗时的顶层模块数')
+    parser.add_argument('--budget', type=float, default=IMPORT_BUDGET_MS, help='显示帮助的导入耗时预算（毫秒）')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, PERF_DB_PATH=os.path.join(tmp, 'bench.db'))
+        run(['set', 'perf', '--cycle', 'monthly'], env)
+
+        rows, over_budget = [], []
+        for invocation in INVOCATIONS:
+            wall = min(run(invocation, env)[0] for _ in range(args.repeat))
+            total, top_level = parse_importtime(run(invocation, env, importtime=True)[1])
+            heaviest = sorted(top_level, key=lambda item: item[1], reverse=True)[:args.top]
+            over = invocation[-1] == '--help' and total / 1000 > args.budget
+            if over:
+                over_budget.append(invocation)
+            rows.append([
+                'perf ' + ' '.join(invocation),
+                f'{wall * 1000:.0f}',
+                f'{total / 1000:.0f}' + (' (超出预算)' if over else ''),
+                ', '.join(f'{name} {cumulative / 1000:.0f}' for name, cumulative in heaviest),
+            ])
+
+    print(tabulate(rows, headers=['命令', '进程耗时(ms)', '导入耗时(ms)', '最耗时的顶层模块(ms)'], tablefmt='simple'))
+    if over_budget:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
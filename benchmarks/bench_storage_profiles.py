@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""存储配置的读写混合吞吐基准
+
+每个存储配置使用一个新的临时数据库，写线程持续添加表现记录，
+读线程持续查询绩效汇总，统计固定时长内的操作数和 "database is locked" 错误数。
+
+用法：
+    python benchmarks/bench_storage_profiles.py [--seconds 3] [--readers 4] [--writers 1]
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tabulate import tabulate
+
+from src.core.tracker import PerformanceTracker
+from src.db.database import STORAGE_PROFILES
+
+EMPLOYEES = 200
+CYCLE = ('2024-01-01', '2024-03-31')
+
+
+def prepare(db_path, profile):
+    """建立包含员工和类别的基准数据库"""
+    tracker = PerformanceTracker(db_path, profile=profile)
+    with tracker.db.transaction():
+        for i in range(EMPLOYEES):
+            tracker.add_employee(f'员工{i}', f'user{i}', '男', '北京', '大学', '计算机',
+                                 f'138{i:08d}', f'1101011990{i:08d}', '研发部', 'P3-1', '2023-01-01')
+        tracker.add_category('技术能力', '技术实现质量与效率')
+    return tracker
+
+
+def run_profile(profile, seconds, readers, writers):
+    """在指定存储配置下运行读写混合负载"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'bench.db')
+        tracker = prepare(db_path, profile)
+        counts = {'read': 0, 'write': 0, 'locked': 0}
+        lock = threading.Lock()
+        deadline = time.perf_counter() + seconds
+
+        def count(key):
+            with lock:
+                counts[key] += 1
+
+        def writer(offset):
+            i = offset
+            while time.perf_counter() < deadline:
+                try:
+                    tracker.add_performance_record(i % EMPLOYEES + 1, '技术能力', '基准测试', 1.0)
+                    count('write')
+                except sqlite3.OperationalError:
+                    count('locked')
+                i += writers
+
+        def reader():
+            while time.perf_counter() < deadline:
+                try:
+                    tracker.get_performance_summary(*CYCLE)
+                    count('read')
+                except sqlite3.OperationalError:
+                    count('locked')
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(writers)]
+        threads += [threading.Thread(target=reader) for _ in range(readers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        tracker.db.close()
+
+    return [
+        profile,
+        f"{counts['write'] / seconds:.0f}",
+        f"{counts['read'] / seconds:.0f}",
+        counts['locked'],
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='存储配置读写混合吞吐基准')
+    parser.add_argument('--seconds', type=float, default=3.0, help='每个配置的运行时长（秒）')
+    parser.add_argument('--readers', type=int, default=4, help='读线程数')
+    parser.add_argument('--writers', type=int, default=1, help='写线程数')
+    args = parser.parse_args()
+
+    rows = [run_profile(profile, args.seconds, args.readers, args.writers) for profile in STORAGE_PROFILES]
+    print(tabulate(rows, headers=['存储配置', '写入/秒', '汇总查询/秒', '锁冲突']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""绩效统计的计算与渲染基准
+
+在一个临时数据库中生成员工、类别、周工作量和表现记录，对比：
+
+- 旧实现：按类别动态拼接 CASE 列的单条透视 SQL，逐单元格调用 click.style 着色；
+- 新实现：ScoringEngine 一次读取汇总结果并以 NumPy 数组计算，使用预生成的着色模板。
+
+分别统计非整月范围（读取明细记录）和整月范围（读取月汇总表）的耗时，
+以及数据未变化时重复查询命中周期缓存的耗时。
+
+用法：
+    python benchmarks/bench_summary_engine.py [--employees 10000] [--records 1000000] [--repeat 3]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import click
+from tabulate import tabulate
+
+from src.core.tracker import PerformanceTracker
+from src.utils.dates import iso_week_start
+
+CATEGORIES = ['技术能力', '团队协作', '创新贡献', '质量保障', '知识分享']
+YEAR = 2024
+CYCLES = {
+    '非整月（明细）': ('2024-01-05', '2024-06-20'),
+    '整月（汇总表）': ('2024-01-01', '2024-06-30'),
+}
+
+# 旧实现的透视查询（周范围条件已按 week_start 改写，其余保持原样）
+LEGACY_SQL = """
+WITH WorkloadScores AS (
+    SELECT
+        employee_id,
+        ROUND(SUM(score), 2) as workload_score
+    FROM workload_scores
+    WHERE week_start BETWEEN date(?, '-3 days') AND date(?, '-3 days')
+    GROUP BY employee_id
+),
+CategoryScores AS (
+    SELECT
+        pr.employee_id,
+        pc.name as category,
+        ROUND(SUM(pr.score), 2) as category_score
+    FROM performance_records pr
+    JOIN performance_categories pc ON pr.category_id = pc.id
+    WHERE pr.record_date BETWEEN ? AND ?
+    GROUP BY pr.employee_id, pc.name
+)
+SELECT
+    e.id,
+    e.name,
+    e.department,
+    COALESCE(ws.workload_score, 0) as workload_score,
+    {category_columns},
+    ROUND(
+        COALESCE(ws.workload_score, 0) +
+        COALESCE(SUM(cs.category_score), 0)
+    , 2) as total_score
+FROM employees e
+LEFT JOIN WorkloadScores ws ON e.id = ws.employee_id
+LEFT JOIN CategoryScores cs ON e.id = cs.employee_id
+WHERE e.is_active = 1
+GROUP BY e.id, e.name, e.department
+ORDER BY total_score DESC
+"""
+
+
+def prepare(db_path, employees, records):
+    """生成基准数据，直接批量写入以缩短准备时间"""
+    tracker = PerformanceTracker(db_path)
+    rng = random.Random(42)
+    start = date(YEAR, 1, 1)
+    with tracker.db.transaction() as conn:
+        conn.executemany(
+            """
+            INSERT INTO employees (
+                name, domain_account, gender, hometown, university, major, phone,
+                id_card, department, position, join_date
+            ) VALUES (?, ?, '男', '北京', '大学', '计算机', ?, ?, ?, 'P3-1', '2023-01-01')
+            """,
+            ((f'员工{i}', f'user{i}', f'138{i:08d}', f'1101011990{i:08d}', f'部门{i % 20}')
+             for i in range(employees))
+        )
+        conn.executemany(
+            "INSERT INTO performance_categories (name, description) VALUES (?, ?)",
+            ((name, name) for name in CATEGORIES)
+        )
+        conn.executemany(
+            """
+            INSERT INTO workload_scores (
+                employee_id, week_number, year, week_start, ranking_percentage, score, description
+            ) VALUES (?, ?, ?, ?, 0, ?, '基准测试')
+            """,
+            ((employee_id, week, YEAR, iso_week_start(YEAR, week), rng.choice((7, 8, 10)))
+             for week in range(1, 27) for employee_id in range(1, employees + 1))
+        )
+        conn.executemany(
+            """
+            INSERT INTO performance_records (employee_id, category_id, description, score, record_date)
+            VALUES (?, ?, '基准测试', ?, ?)
+            """,
+            ((rng.randint(1, employees), rng.randint(1, len(CATEGORIES)),
+              rng.choice((-2.0, 1.0, 2.0, 3.0)), (start + timedelta(days=rng.randrange(182))).isoformat())
+             for _ in range(records))
+        )
+    tracker.dimensions.invalidate()
+    return tracker
+
+
+def legacy_summary(tracker, start_date, end_date):
+    """旧实现：动态透视 SQL"""
+    conn = tracker.db.connection()
+    categories = [row[0] for row in conn.execute(
+        "SELECT name FROM performance_categories WHERE is_active = 1 ORDER BY name"
+    )]
+    category_columns = ',\n'.join(
+        f"COALESCE(MAX(CASE WHEN cs.category = '{cat}' THEN cs.category_score END), 0) as {cat.replace(' ', '_')}_score"
+        for cat in categories
+    )
+    sql = LEGACY_SQL.format(category_columns=category_columns)
+    return conn.execute(sql, (start_date, end_date, start_date, end_date)).fetchall(), categories
+
+
+def legacy_render(summary_data, categories):
+    """旧实现：逐单元格调用 click.style"""
+    table_data = []
+    for row in summary_data:
+        category_scores = [
+            click.style(f"{row[4 + i]:>6.2f}", fg='green' if row[4 + i] > 0 else 'red')
+            for i in range(len(categories))
+        ]
+        table_data.append([
+            row[0], row[1], row[2], click.style(f"{row[3]:>6.2f}", fg='blue'),
+            *category_scores, click.style(f"{row[-1]:>6.2f}", fg='yellow', bold=True)
+        ])
+    return table_data
+
+
+def engine_render(summary_data):
+    """新实现：预生成着色模板"""
+    workload_style = click.style('{:>6.2f}', fg='blue')
+    positive_style = click.style('{:>6.2f}', fg='green')
+    negative_style = click.style('{:>6.2f}', fg='red')
+    total_style = click.style('{:>6.2f}', fg='yellow', bold=True)
+    return [
+        [row[0], row[1], row[2], workload_style.format(row[3]),
+         *[(positive_style if score > 0 else negative_style).format(score) for score in row[4:-1]],
+         total_style.format(row[-1])]
+        for row in summary_data
+    ]
+
+
+def best_of(repeat, func):
+    """返回多次运行中的最短耗时（毫秒）和最后一次的结果"""
+    best, result = None, None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = (time.perf_counter() - started) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='绩效统计的计算与渲染基准')
+    parser.add_argument('--employees', type=int, default=10000, help='员工数')
+    parser.add_argument('--records', type=int, default=1000000, help='表现记录数')
+    parser.add_argument('--repeat', type=int, default=3, help='每项重复次数（取最短耗时）')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        started = time.perf_counter()
+        tracker = prepare(os.path.join(tmp, 'bench.db'), args.employees, args.records)
+        print(f'准备数据：{args.employees} 名员工，{args.records} 条表现记录，'
+              f'耗时 {time.perf_counter() - started:.1f}s')
+
+        rows = []
+        for label, (start_date, end_date) in CYCLES.items():
+            legacy_query, (legacy_data, categories) = best_of(
+                args.repeat, lambda: legacy_summary(tracker, start_date, end_date))
+            legacy_format, _ = best_of(args.repeat, lambda: legacy_render(legacy_data, categories))
+
+            def cold():
+                tracker.scoring._cycles.clear()
+                return tracker.get_performance_summary(start_date, end_date)
+
+            engine_query, (engine_data, _) = best_of(args.repeat, cold)
+            cached_query, _ = best_of(args.repeat, lambda: tracker.get_performance_summary(start_date, end_date))
+            engine_format, _ = best_of(args.repeat, lambda: engine_render(engine_data))
+
+            rows.append([label, '旧实现', f'{legacy_query:.1f}', f'{legacy_format:.1f}',
+                         f'{legacy_query + legacy_format:.1f}'])
+            rows.append([label, 'ScoringEngine', f'{engine_query:.1f}', f'{engine_format:.1f}',
+                         f'{engine_query + engine_format:.1f}'])
+            rows.append([label, 'ScoringEngine（缓存命中）', f'{cached_query:.1f}', f'{engine_format:.1f}',
+                         f'{cached_query + engine_format:.1f}'])
+        tracker.db.close()
+
+    print(tabulate(rows, headers=['范围', '实现', '计算(ms)', '着色(ms)', '合计(ms)'], tablefmt='simple'))
+
+
+if __name__ == '__main__':
+    main()
@@ -2,7 +2,6 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from datetime import datetime
-import sqlite3
 import os
 import traceback
 from typing import Optional
@@ -19,9 +18,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-from src.db.database import PerformanceDB
+from src.core.tracker import PerformanceTracker
 
-db = PerformanceDB()
+tracker = PerformanceTracker()
 
 class Employee(BaseModel):
     name: str
@@ -39,23 +38,30 @@ class Employee(BaseModel):
 async def create_employee(employee: Employee):
     """创建新员工"""
     try:
-        with sqlite3.connect(db.db_path) as conn:
-            # 获取全局配置的默认部门
-            cursor = conn.execute("SELECT value FROM global_settings WHERE key = 'default_department'")
-            default_department = cursor.fetchone()
-            department = default_department[0] if default_department else None
-            
-            conn.execute(
-                "INSERT INTO employees (name, domain_account, gender, hometown, university, major, phone, department, position, join_date, id_card) "
-                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                (employee.name, employee.domain_account, employee.gender, employee.hometown, 
-                 employee.university, employee.major, employee.phone, department, 
-                 employee.position, employee.join_date, employee.id_card)
-            )
+        # 默认部门来自跟踪器缓存的全局设置，设置变更后自动刷新
+        department = tracker.get_settings().default_department
+        tracker.add_employee(
+            employee.name, employee.domain_account, employee.gender, employee.hometown,
+            employee.university, employee.major, employee.phone, employee.id_card,
+            department, employee.position, employee.join_date
+        )
         return {"status": "success", "message": "员工信息添加成功"}
     except Exception as e:
         error_detail = {
             "error": str(e),
             "traceback": traceback.format_exc()
         }
-        raise HTTPException(status_code=500, detail=error_detail)
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=error_detail)
+
+@app.get('/api/employees/{employee_id}/rank')
+async def get_employee_rank(employee_id: int, start_date: Optional[str] = None, end_date: Optional[str] = None):
+    """获取员工在绩效周期内的排名，默认为当前绩效周期"""
+    cycle = (start_date, end_date) if start_date and end_date else None
+    try:
+        standing = tracker.get_employee_rank(employee_id, cycle)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if standing is None:
+        raise HTTPException(status_code=404, detail="员工不存在或未激活")
+    rank, count, percentile, tier, gap = standing
+    return {"rank": rank, "count": count, "percentile": percentile, "tier": tier, "gap_to_next_tier": gap}
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""批量操作命令 (perf batch)"""
+
+from collections import Counter
+
+import click
+from src.cli.common import get_tracker
+from src.core.batch import STEP_LABELS
+
+@click.command('batch')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False, allow_dash=True))
+@click.option('--dry-run', is_flag=True, help='只校验并列出将要进行的变更，不写入数据库')
+@click.pass_context
+def batch(ctx, path, dry_run):
+    """从 JSONL 或 YAML 文件批量执行操作
+
+    每行（YAML 为每个条目）一个操作，以 op 字段区分类型，员工可用ID或域账号指定：
+
+    \b
+    record   : employee, category, score, description, [date]
+    event    : category, description, [date]，以及 employees + score 或 scores（{员工: 分值}）
+    workload : year, week, employees（按工作量从高到低）, [description]
+    toggle   : employee 或 category, active（true/false）
+    setting  : key（performance_cycle/default_department/storage_profile）, value
+    rule     : category, weight, description, [effective_date]
+
+    所有操作通过校验后在一个事务中执行，任何一个操作有误时都不写入，并以状态码 1 退出。
+    .yaml/.yml 文件需要安装 PyYAML；PATH 为 - 时从标准输入读取 JSONL。
+    """
+    tracker = get_tracker()
+    try:
+        steps, errors = tracker.apply_batch(path, dry_run=dry_run)
+    except ValueError as e:
+        click.echo(f'读取失败：{str(e)}', err=True)
+        ctx.exit(1)
+
+    if errors:
+        for position, reason in errors:
+            click.echo(f'第 {position} 条：{reason}', err=True)
+        click.echo(click.style(f'{len(errors)} 个操作未通过校验，未写入任何变更', fg='red'), err=True)
+        ctx.exit(1)
+
+    if dry_run:
+        for step in steps:
+            for change in step.changes:
+                click.echo(change)
+
+    counts = Counter(step.kind for step in steps)
+    summary = '，'.join(f'{label} {counts[kind]} 项' for kind, label in STEP_LABELS.items() if counts[kind])
+    if not steps:
+        click.echo('没有需要执行的变更')
+    elif dry_run:
+        click.echo(click.style(f'\n将要执行：{summary}（未写入）', fg='yellow'))
+    else:
+        click.echo(click.style(f'已执行：{summary}', fg='green'))
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""表现类别管理命令 (perf cat)"""
+
+import sqlite3
+
+import click
+from src.cli.common import get_tracker, tabulate
+
+@click.group('cat')
+def category():
+    """表现类别管理相关命令"""
+    pass
+
+@category.command('list')
+@click.option('--format', '-f', default='simple', help='输出格式 (simple/grid/fancy_grid)')
+@click.option('--all', '-a', is_flag=True, help='显示所有类别（包括已禁用的）')
+def show_categories(format, all):
+    """显示表现类别列表"""
+    tracker = get_tracker()
+    
+    # 获取类别信息
+    if all:
+        categories = tracker.get_all_categories()
+        title = '所有表现类别'
+    else:
+        categories = [(name, desc, True) for name, desc in tracker.get_active_categories()]
+        title = '已启用的表现类别'
+    
+    if not categories:
+        click.echo('暂无表现类别信息')
+        return
+    
+    # 显示类别信息
+    click.echo(click.style(f'\n{title}：', fg='green', bold=True))
+    headers = ['序号', '类别名称', '描述', '状态']
+    category_list = []
+    
+    for i, (name, description, is_active) in enumerate(categories, 1):
+        # 根据状态使用不同的颜色
+        if is_active:
+            status = click.style('已启用', fg='green')
+            row = [
+                click.style(str(i), fg='green'),
+                click.style(name, fg='green'),
+                click.style(description, fg='green'),
+                status
+            ]
+        else:
+            status = click.style('已禁用', fg='red')
+            row = [
+                click.style(str(i), fg='red'),
+                click.style(name, fg='red'),
+                click.style(description, fg='red'),
+                status
+            ]
+        category_list.append(row)
+    
+    click.echo(tabulate(category_list, headers=headers, tablefmt=format))
+
+@category.command('add')
+@click.option('--name', prompt='类别名称', help='表现类别名称')
+@click.option('--description', prompt='类别描述', help='表现类别描述')
+def add_category(name, description):
+    """添加新的表现类别"""
+    tracker = get_tracker()
+    try:
+        tracker.add_category(name, description)
+        click.echo(f'成功添加表现类别: {name}')
+    except sqlite3.IntegrityError:
+        click.echo(f'错误：类别 {name} 已存在')
+    except Exception as e:
+        click.echo(f'添加类别失败：{str(e)}')
+
+@category.command('toggle')
+@click.option('--name', type=str, help='类别名称')
+def toggle_category_status(name):
+    """切换表现类别的启用/禁用状态"""
+    tracker = get_tracker()
+    
+    # 如果没有提供类别名称，显示可选列表
+    if not name:
+        categories = tracker.get_all_categories()
+        if not categories:
+            click.echo('暂无表现类别')
+            return
+        
+        # 显示类别列表供选择
+        click.echo(click.style('\n现有表现类别：', fg='blue'))
+        for i, cat in enumerate(categories, 1):
+            status = click.style('启用', fg='green') if cat[3] else click.style('禁用', fg='red')
+            click.echo(f'{i}. {cat[1]} [{status}] - {cat[2]}')
+        
+        # 让用户选择类别
+        cat_index = click.prompt('请选择要操作的类别序号', type=int)
+        if cat_index < 1 or cat_index > len(categories):
+            click.echo('无效的序号')
+            return
+        
+        # 获取选中的类别信息
+        category = categories[cat_index - 1]
+        name = category[1]
+        current_status = category[3]
+        
+        # 确认操作
+        new_status = not current_status
+        status_str = '启用' if new_status else '禁用'
+        if not click.confirm(f'是否{status_str}类别 "{name}"？'):
+            click.echo('操作已取消')
+            return
+        
+        try:
+            tracker.toggle_category_status(name, new_status)
+            click.echo(f'成功{status_str}类别：{name}')
+        except ValueError as e:
+            click.echo(f'操作失败：{str(e)}')
+    else:
+        # 如果提供了类别名称，先获取当前状态
+        try:
+            current_status = tracker.get_category_status(name)
+            if current_status is None:
+                click.echo(f'未找到类别：{name}')
+                return
+            
+            # 切换状态
+            new_status = not current_status
+            tracker.toggle_category_status(name, new_status)
+            status_str = '启用' if new_status else '禁用'
+            click.echo(f'成功{status_str}类别：{name}')
+        except ValueError as e:
+            click.echo(f'操作失败：{str(e)}')
+
+@category.command('change')
+@click.argument('name', type=str, required=False)
+def change_category(name):
+    """修改表现类别信息"""
+    tracker = get_tracker()
+    
+    # 如果没有提供类别名称，显示可选列表
+    if not name:
+        categories = tracker.get_all_categories()
+        if not categories:
+            click.echo('暂无表现类别')
+            return
+        
+        click.echo(click.style('\n当前所有表现类别：', fg='blue'))
+        for i, cat in enumerate(categories, 1):
+            status = click.style('启用', fg='green') if cat[3] else click.style('禁用', fg='red')
+            click.echo(f'{i}. {cat[1]} [{status}] - {cat[2]}')
+        
+        # 让用户选择类别
+        cat_index = click.prompt('请选择要修改的类别序号', type=int)
+        if cat_index < 1 or cat_index > len(categories):
+            click.echo('无效的序号')
+            return
+        
+        # 获取选中的类别信息
+        category = categories[cat_index - 1]
+        name = category[1]
+        old_description = category[2]
+        old_status = category[3]
+    else:
+        # 获取类别信息
+        category = tracker.get_category_by_name(name)
+        if not category:
+            click.echo(f'未找到类别：{name}')
+            return
+        old_description = category[2]
+        old_status = category[3]
+    
+    # 获取新的信息
+    new_name = click.prompt('新名称', default=name)
+    new_description = click.prompt('新描述', default=old_description)
+    new_status = click.confirm('是否启用', default=old_status)
+    
+    if not click.confirm('确认修改？'):
+        click.echo('操作已取消')
+        return
+    
+    try:
+        tracker.update_category(name, new_name, new_description, new_status)
+        click.echo(click.style('\n成功更新类别信息', fg='green'))
+    except ValueError as e:
+        click.echo(f'修改失败：{str(e)}')
+
+@category.command('del')
+@click.argument('category', type=str, required=False)
+@click.option('--force', '-f', is_flag=True, help='强制删除，不进行确认')
+def delete_category(category, force):
+    """删除表现类别"""
+    tracker = get_tracker()
+    
+    # 如果没有提供类别，显示可选列表
+    if not category:
+        categories = tracker.get_all_categories()
+        if not categories:
+            click.echo('暂无表现类别')
+            return
+        
+        # 显示类别列表供选择
+        click.echo(click.style('\n现有表现类别：', fg='blue'))
+        for i, cat in enumerate(categories, 1):
+            status = click.style('启用', fg='green') if cat[3] else click.style('禁用', fg='red')
+            click.echo(f'{i}. {cat[1]} [{status}] - {cat[2]}')
+        
+        # 让用户选择类别
+        cat_index = click.prompt('请选择要删除的类别序号', type=int)
+        if cat_index < 1 or cat_index > len(categories):
+            click.echo('无效的序号')
+            return
+        
+        # 获取选中的类别信息
+        category_info = categories[cat_index - 1]
+    else:
+        # 尝试将输入解析为ID或名称
+        category_info = None
+        try:
+            category_id = int(category)
+            category_info = tracker.get_category_by_id(category_id)
+        except ValueError:
+            # 如果不是数字，则按名称查找
+            category_info = tracker.get_category_by_name(category)
+        
+        if not category_info:
+            click.echo(f'未找到类别：{category}')
+            return
+    
+    # 显示类别信息
+    click.echo(click.style('\n要删除的类别信息：', fg='yellow'))
+    click.echo(f'ID: {category_info[0]}')
+    click.echo(f'名称: {category_info[1]}')
+    click.echo(f'描述: {category_info[2]}')
+    click.echo(f'状态: {"启用" if category_info[3] else "禁用"}')
+    
+    # 检查是否有关联的表现记录
+    record_count = tracker.get_category_record_count(category_info[1])
+    if record_count > 0:
+        click.echo(click.style(f'\n警告：该类别下有 {record_count} 条表现记录', fg='red'))
+    
+    # 确认删除
+    if not force and not click.confirm('\n确定要删除该类别吗？此操作不可恢复'):
+        click.echo('操作已取消')
+        return
+    
+    try:
+        tracker.delete_category(category_info[1])
+        click.echo(click.style(f'\n成功删除类别：{category_info[1]}', fg='green'))
+    except ValueError as e:
+        click.echo(f'删除失败：{str(e)}')
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""命令行共用的跟踪器获取、表格与格式化函数"""
+
+import csv
+import io
+import json
+import unicodedata
+from collections import namedtuple
+from itertools import chain, islice
+
+import click
+from src.core.tracker import PerformanceTracker
+
+def get_tracker():
+    """获取当前命令使用的 PerformanceTracker
+    
+    perf shell 会话通过上下文对象共享同一个跟踪器（连接、维度缓存和语句缓存随之复用），
+    单独执行的命令则新建跟踪器。
+    """
+    ctx = click.get_current_context(silent=True)
+    tracker = ctx.find_object(PerformanceTracker) if ctx is not None else None
+    return tracker if tracker is not None else PerformanceTracker()
+
+def tabulate(*args, **kwargs):
+    """渲染表格，首次调用时才导入 tabulate
+    
+    tabulate 的导入耗时在命令行启动中占比最大，只显示帮助或等待输入的命令不必加载它。
+    """
+    from tabulate import tabulate as render
+    return render(*args, **kwargs)
+
+# 流式表格支持的格式，外观与 tabulate 的同名格式一致：
+# 分隔线为 (左端, 填充, 列间, 右端)，None 表示没有；row 为数据行的 (左端, 列间, 右端)；padding 为单元格两侧的空格数
+TableStyle = namedtuple('TableStyle', ['above', 'below_header', 'between_rows', 'below', 'row', 'padding'])
+
+STREAM_FORMATS = {
+    'plain': TableStyle(None, None, None, None, ('', '  ', ''), 0),
+    'simple': TableStyle(None, ('', '-', '  ', ''), None, None, ('', '  ', ''), 0),
+    'grid': TableStyle(('+', '-', '+', '+'), ('+', '=', '+', '+'), ('+', '-', '+', '+'), ('+', '-', '+', '+'),
+                       ('|', '|', '|'), 1),
+    'fancy_grid': TableStyle(('╒', '═', '╤', '╕'), ('╞', '═', '╪', '╡'), ('├', '─', '┼', '┤'), ('╘', '═', '╧', '╛'),
+                             ('│', '│', '│'), 1),
+}
+
+def _char_width(char):
+    return 2 if unicodedata.east_asian_width(char) in 'WF' else 1
+
+def display_width(text):
+    """文本在终端中的显示宽度：忽略颜色控制符，全角字符计为 2"""
+    if '\x1b' in text:
+        text = click.unstyle(text)
+    if text.isascii():
+        return len(text)
+    return sum(_char_width(char) for char in text)
+
+def _cell_text(value):
+    if value is None:
+        return ''
+    if isinstance(value, float):
+        return f'{value:g}'
+    return str(value)
+
+def _is_number(text):
+    try:
+        float(click.unstyle(text))
+        return True
+    except ValueError:
+        return False
+
+def _fit(text, width, right):
+    """按列宽对齐单元格；文本列超出列宽时截断（颜色随之去掉）并以 … 结尾，数字列不截断"""
+    text_width = display_width(text)
+    if text_width > width and not right:
+        kept, text_width = [], 1
+        for char in click.unstyle(text):
+            if text_width + _char_width(char) > width:
+                break
+            kept.append(char)
+            text_width += _char_width(char)
+        text = ''.join(kept) + '…'
+    padding = ' ' * max(width - text_width, 0)
+    return padding + text if right else text + padding
+
+def stream_table(rows, headers, format='simple', page_size=100, widths=None):
+    """将行迭代器渲染为表格文本并逐行生成，配合 click.echo_via_pager 输出
+    
+    记录不超过一页时整页交给 tabulate 渲染。超过一页时，列宽和对齐方式由第一页确定
+    （widths 可按表头直接指定某些列的宽度），之后的行读到一行输出一行，内存中只保留第一页；
+    每页重复一次表头，各页列宽一致。超出列宽的文本截断并以 … 结尾。
+    STREAM_FORMATS 以外的格式仍按页交给 tabulate 渲染。
+    
+    Args:
+        rows: 行迭代器，每行为单元格序列
+        headers: 表头
+        format: 表格格式
+        page_size: 每页行数
+        widths: {表头: 列宽}，指定的列不按第一页计算宽度
+    """
+    rows = iter(rows)
+    first_page = list(islice(rows, page_size + 1))
+    style = STREAM_FORMATS.get(format)
+    if style is None or len(first_page) <= page_size:
+        rows = chain(first_page, rows)
+        for page in iter(lambda: list(islice(rows, page_size)), []):
+            yield tabulate(page, headers=headers, tablefmt=format) + '\n\n'
+        return
+    
+    cells = ([_cell_text(value) for value in row] for row in chain(first_page, rows))
+    sample = list(islice(cells, page_size))
+    numeric = [
+        any(row[i] for row in sample) and all(_is_number(row[i]) for row in sample if row[i])
+        for i in range(len(headers))
+    ]
+    widths = widths or {}
+    column_widths = [
+        widths.get(header) or max(display_width(header) + 2, *(display_width(row[i]) for row in sample))
+        for i, header in enumerate(headers)
+    ]
+    padding = ' ' * style.padding
+    
+    def line(parts):
+        left, fill, separator, right = parts
+        return left + separator.join(fill * (width + 2 * style.padding) for width in column_widths) + right + '\n'
+    
+    def row_line(values):
+        left, separator, right = style.row
+        return left + separator.join(
+            padding + _fit(value, width, right_align) + padding
+            for value, width, right_align in zip(values, column_widths, numeric)
+        ) + right + '\n'
+    
+    for index, row in enumerate(chain(sample, cells)):
+        if index % page_size == 0:
+            if index:
+                if style.below:
+                    yield line(style.below)
+                yield '\n'
+            if style.above:
+                yield line(style.above)
+            yield row_line(headers)
+            if style.below_header:
+                yield line(style.below_header)
+        elif style.between_rows:
+            yield line(style.between_rows)
+        yield row_line(row)
+    if style.below:
+        yield line(style.below)
+    yield '\n'
+
+# 结构化输出格式：不着色、不排版，按固定的英文列名输出原始值，供脚本和其他程序读取
+STRUCTURED_FORMATS = ('json', 'csv', 'ndjson')
+
+# --format 选项的说明
+FORMAT_HELP = '输出格式 (simple/grid/fancy_grid，或 json/csv/ndjson 结构化输出)'
+
+def structured_lines(rows, columns, format):
+    """将行迭代器转换为 json、csv 或 ndjson 文本并逐行生成
+    
+    ndjson 每行一个对象；csv 第一行为列名；json 为对象数组，每个对象占一行。
+    读到一行输出一行，不在内存中保留全部结果；没有数据时 json 输出 []，csv 只输出列名。
+    
+    Args:
+        rows: 行迭代器，每行为与 columns 对应的原始值
+        columns: 列名
+        format: STRUCTURED_FORMATS 中的一种
+    """
+    if format == 'csv':
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        for row in chain([columns], rows):
+            writer.writerow(row)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        return
+    
+    objects = (json.dumps(dict(zip(columns, row)), ensure_ascii=False) for row in rows)
+    if format == 'ndjson':
+        for text in objects:
+            yield text + '\n'
+        return
+    
+    separator = '[\n'
+    for text in objects:
+        yield separator + text
+        separator = ',\n'
+    yield '[]\n' if separator == '[\n' else '\n]\n'
+
+def echo_structured(rows, columns, format, batch_size=500):
+    """以结构化格式输出到标准输出，不经过分页器；每 batch_size 行写出一次"""
+    lines = structured_lines(rows, columns, format)
+    for chunk in iter(lambda: ''.join(islice(lines, batch_size)), ''):
+        click.echo(chunk, nl=False)
+
+def format_workload_record(record):
+    """格式化一条工作量记录（周数、员工姓名、部门、年份、排名百分比、得分、描述）"""
+    return [
+        record[1],  # 员工姓名
+        record[2],  # 部门
+        record[3],  # 年份
+        record[0],  # 周数
+        f"{record[4]:>6.2f}%",  # 排名百分比
+        click.style(f"{record[5]:>+6.2f}", fg='green' if record[5] > 0 else 'red'),  # 得分
+        record[6]   # 描述
+    ]
+
+WORKLOAD_HEADERS = ['员工', '部门', '年份', '周数', '排名百分比', '得分', '描述']
+
+WORKLOAD_COLUMNS = ('year', 'week_number', 'employee_name', 'department', 'ranking_percentage', 'score', 'description')
+
+def workload_values(record):
+    """按 WORKLOAD_COLUMNS 的顺序取出一条工作量记录的原始值"""
+    return (record[3], record[0], record[1], record[2], record[4], record[5], record[6])
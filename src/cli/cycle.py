@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""绩效周期命令 (perf cycle)"""
+
+from datetime import datetime
+
+import click
+from src.cli.common import get_tracker, tabulate
+
+@click.group('cycle')
+def cycle():
+    """绩效周期相关命令"""
+    pass
+
+@cycle.command('close')
+@click.option('--start', 'start_date', default=None, help='周期开始日期 (YYYY-MM-DD)，默认为当前绩效周期')
+@click.option('--end', 'end_date', default=None, help='周期结束日期 (YYYY-MM-DD)，默认为当前绩效周期')
+@click.option('--yes', '-y', is_flag=True, help='周期尚未结束时不再确认')
+def close_cycle(start_date, end_date, yes):
+    """关闭绩效周期，冻结当前的排名和得分
+    
+    关闭后该周期的统计直接读取快照，修改历史记录不再影响结果。
+    """
+    tracker = get_tracker()
+    
+    if not start_date or not end_date:
+        start_date, end_date = tracker.get_current_performance_cycle()
+        if not start_date or not end_date:
+            click.echo('请先设置绩效周期（使用 set perf 命令）')
+            return
+    
+    if end_date >= datetime.now().strftime('%Y-%m-%d') and not yes:
+        if not click.confirm(f'绩效周期 {start_date} 至 {end_date} 尚未结束，关闭后不能再添加该周期内的记录，确定要关闭吗？'):
+            click.echo('已取消')
+            return
+    
+    try:
+        snapshot_id, checksum = tracker.close_performance_cycle(start_date, end_date)
+    except ValueError as e:
+        click.echo(f'关闭失败：{str(e)}')
+        return
+    click.echo(click.style(f'\n已关闭绩效周期 {start_date} 至 {end_date}（快照 {snapshot_id}，校验和 {checksum[:12]}）', fg='green'))
+
+@cycle.command('list')
+@click.option('--year', type=int, default=None, help='只显示开始日期在该年份的周期')
+@click.option('--format', '-f', default='simple', help='输出格式 (simple/grid/fancy_grid)')
+def list_cycles(year, format):
+    """列出已关闭的绩效周期并校验快照"""
+    tracker = get_tracker()
+    
+    cycles = tracker.get_closed_cycles(year)
+    if not cycles:
+        click.echo('暂无已关闭的绩效周期')
+        return
+    
+    headers = ['快照ID', '开始日期', '结束日期', '关闭时间', '员工数', '校验']
+    table_data = [
+        [snapshot_id, start_date, end_date, closed_at, count,
+         click.style('一致', fg='green') if tracker.verify_cycle_snapshot(snapshot_id) else click.style('不一致', fg='red')]
+        for snapshot_id, start_date, end_date, closed_at, count, _ in cycles
+    ]
+    click.echo(click.style('\n已关闭的绩效周期：', fg='green', bold=True))
+    click.echo(tabulate(table_data, headers=headers, tablefmt=format))
+
+@cycle.command('report')
+@click.option('--year', type=int, default=lambda: datetime.now().year, help='年份，默认为今年')
+@click.option('--format', '-f', default='simple', help='输出格式 (simple/grid/fancy_grid)')
+def cycle_report(year, format):
+    """显示一年内已关闭周期的得分与排名"""
+    tracker = get_tracker()
+    
+    cycles, rows = tracker.get_cycle_report(year)
+    if not cycles:
+        click.echo(f'{year} 年暂无已关闭的绩效周期')
+        return
+    
+    headers = ['员工ID', '姓名', '部门', *[f'{start}~{end}' for start, end in cycles], '年度总分']
+    table_data = [
+        [employee_id, name, department,
+         *[f'{score[0]:.2f}（第{score[1]}名）' if score else '-' for score in scores],
+         click.style(f'{total:.2f}', fg='yellow', bold=True)]
+        for employee_id, name, department, scores, total in rows
+    ]
+    click.echo(click.style(f'\n{year} 年绩效周期报告：', fg='green', bold=True))
+    click.echo(tabulate(table_data, headers=headers, tablefmt=format))
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""员工管理命令 (perf emp)"""
+
+import click
+from src.cli.common import FORMAT_HELP, STRUCTURED_FORMATS, echo_structured, get_tracker, stream_table, tabulate
+
+EMPLOYEE_COLUMNS = ('id', 'name', 'domain_account', 'department', 'position', 'is_active')
+
+@click.group('emp')
+def employee():
+    """员工管理相关命令
+    
+    \b
+    emp add    : 添加新员工
+    emp del    : 删除员工
+    emp list   : 显示员工列表
+    emp show   : 显示员工详情
+    emp toggle : 激活/禁用员工
+    """
+    pass
+
+@employee.command('add')
+@click.option('--name', prompt='员工姓名', help='员工姓名')
+@click.option('--domain-account', prompt='域账号', help='域账号（字母+数字的字符串）')
+@click.option('--gender', prompt='性别', help='性别')
+@click.option('--hometown', prompt='家乡', help='家乡')
+@click.option('--university', prompt='毕业院校', help='毕业院校')
+@click.option('--major', prompt='专业', help='专业')
+@click.option('--phone', prompt='联系电话', help='联系电话（11位手机号）')
+@click.option('--id-card', prompt='身份证号', help='18位身份证号码')
+@click.option('--department', help='所属部门（可选）')
+@click.option('--position', prompt='职级', type=click.Choice(['P2-1', 'P2-2', 'P2-3', 'P3-1', 'P3-2', 'P3-3', 'P4-1', 'P4-2', 'P4-3']), help='职级（P2-1至P4-3）')
+@click.option('--join-date', prompt='入职日期', help='入职日期（格式：YYYY-MM-DD）')
+def add_employee(name, domain_account, gender, hometown, university, major, phone, id_card, department, position, join_date):
+    """添加新员工信息 (add_employee)"""
+    tracker = get_tracker()
+    tracker.add_employee(name, domain_account, gender, hometown, university, major, phone, id_card, department, position, join_date)
+    click.echo(f'成功添加员工: {name}')
+
+@employee.command('toggle')
+@click.option('--employee-id', prompt='员工ID', type=int, help='员工ID')
+@click.option('--active/--inactive', prompt='是否激活', help='激活或取消激活员工')
+def toggle_employee_status(employee_id, active):
+    """激活或取消激活员工 """
+    tracker = get_tracker()
+    try:
+        tracker.toggle_employee_status(employee_id, active)
+        status = '激活' if active else '取消激活'
+        click.echo(f'成功{status}员工')
+    except ValueError as e:
+        click.echo(f'错误：{str(e)}')
+
+@employee.command('list')
+@click.option('--format', '-f', default='simple', help=FORMAT_HELP)
+@click.option('--all', '-a', is_flag=True, help='显示所有员工（包括已禁用的）')
+@click.option('--page-size', type=click.IntRange(min=1), default=100, help='每页显示的员工数')
+def list_employees(format, all, page_size):
+    """列出所有员工的基本信息"""
+    tracker = get_tracker()
+    
+    # 获取员工列表
+    employees = tracker.get_all_employees()
+    if not employees and format not in STRUCTURED_FORMATS:
+        click.echo('暂无员工信息')
+        return
+    
+    # 过滤非激活员工（除非指定显示所有）
+    if not all:
+        employees = [emp for emp in employees if emp[12]]  # is_active 字段
+    
+    if format in STRUCTURED_FORMATS:
+        rows = ((emp[0], emp[1], emp[2], emp[9], emp[10], bool(emp[12])) for emp in employees)
+        echo_structured(rows, EMPLOYEE_COLUMNS, format)
+        return
+    
+    if not employees:
+        click.echo('暂无' + ('员工信息' if all else '在职员工'))
+        return
+    
+    # 显示员工列表，状态着色模板只生成一次
+    headers = ['ID', '姓名', '部门', '职级', '状态']
+    statuses = (click.style('已离职', fg='red'), click.style('在职', fg='green'))
+    table_data = (
+        [
+            emp[0],  # ID
+            emp[1],  # 姓名
+            emp[9],  # 部门
+            emp[10], # 职级
+            statuses[bool(emp[12])]
+        ]
+        for emp in employees
+    )
+    
+    click.echo(click.style('\n员工列表：', fg='blue', bold=True))
+    click.echo_via_pager(stream_table(table_data, headers, format, page_size))
+
+@employee.command('del')
+@click.argument('employee_id', type=int)
+@click.option('--force', '-f', is_flag=True, help='强制删除，不进行确认')
+def delete_employee(employee_id, force):
+    """删除指定员工"""
+    tracker = get_tracker()
+    
+    # 获取员工信息
+    employee = tracker.get_employee_detail(employee_id)
+    if not employee:
+        click.echo(f'未找到ID为 {employee_id} 的员工')
+        return
+    
+    # 显示员工信息并确认
+    click.echo(click.style('\n要删除的员工信息：', fg='yellow'))
+    click.echo(f'ID: {employee[0]}')
+    click.echo(f'姓名: {employee[1]}')
+    click.echo(f'部门: {employee[9]}')
+    click.echo(f'职级: {employee[10]}')
+    click.echo(f'状态: {"在职" if employee[12] else "已离职"}')
+    
+    # 确认删除
+    if not force and not click.confirm('\n确定要删除该员工吗？此操作不可恢复'):
+        click.echo('操作已取消')
+        return
+    
+    try:
+        tracker.delete_employee(employee_id)
+        click.echo(click.style(f'\n成功删除员工：{employee[1]}', fg='green'))
+    except Exception as e:
+        click.echo(f'删除失败：{str(e)}')
+
+@employee.command('show')
+@click.argument('employee_id', type=int)
+@click.option('--format', '-f', default='simple', help='输出格式 (simple/grid/fancy_grid)')
+def show_employee(employee_id, format):
+    """显示员工的详细信息"""
+    tracker = get_tracker()
+    
+    # 获取员工信息
+    employee = tracker.get_employee_detail(employee_id)
+    if not employee:
+        click.echo(f'未找到ID为 {employee_id} 的员工')
+        return
+    
+    # 准备显示数据
+    info = [
+        ['ID', employee[0]],
+        ['姓名', employee[1]],
+        ['域账号', employee[2]],
+        ['性别', employee[3]],
+        ['家乡', employee[4]],
+        ['毕业院校', employee[5]],
+        ['专业', employee[6]],
+        ['联系电话', employee[7]],
+        ['身份证号', employee[8]],
+        ['部门', employee[9]],
+        ['职级', employee[10]],
+        ['入职日期', employee[11]],
+        ['状态', click.style('在职', fg='green') if employee[12] else click.style('已离职', fg='red')],
+        ['创建时间', employee[13]]
+    ]
+    
+    # 显示信息
+    click.echo(click.style(f'\n员工详细信息：', fg='blue', bold=True))
+    click.echo(tabulate(info, tablefmt=format))
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""按需加载子命令的命令组"""
+
+import importlib
+
+import click
+
+
+class LazyGroup(click.Group):
+    """子命令在实际调用时才导入所在模块的命令组
+
+    子命令以 {名称: (模块路径, 属性名, 简短说明)} 登记。显示命令列表时使用登记的简短说明，
+    不导入任何子命令模块；调用某个子命令时只导入该子命令的模块。
+    """
+
+    def __init__(self, *args, lazy_commands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx):
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module, attribute, _ = self.lazy_commands[cmd_name]
+            self.add_command(getattr(importlib.import_module(module), attribute), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx, formatter):
+        names = self.list_commands(ctx)
+        if not names:
+            return
+        limit = formatter.width - 6 - max(len(name) for name in names)
+        rows = []
+        for name in names:
+            if name in self.commands:
+                command = self.commands[name]
+                if command.hidden:
+                    continue
+                help_text = command.get_short_help_str(limit)
+            else:
+                help_text = self.lazy_commands[name][2]
+            rows.append((name, help_text))
+        with formatter.section('Commands'):
+            formatter.write_dl(rows)
@@ -0,0 +1,628 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""表现记录管理命令 (perf rec)"""
+
+from datetime import datetime, timedelta
+from itertools import chain
+
+import click
+from src.cli.common import (
+    FORMAT_HELP, STRUCTURED_FORMATS, WORKLOAD_COLUMNS, WORKLOAD_HEADERS, echo_structured, format_workload_record,
+    get_tracker, stream_table, tabulate, workload_values,
+)
+
+RECORD_COLUMNS = ('id', 'employee_name', 'department', 'category', 'score', 'description', 'record_date')
+
+def is_active_employee(tracker, employee_id):
+    """判断员工是否存在且处于激活状态"""
+    employee = tracker.get_employee(employee_id)
+    return bool(employee and employee[12])
+
+@click.group('rec')
+def record():
+    """表现记录管理相关命令"""
+    pass
+
+@record.command('add')
+@click.option('--format', '-f', default='simple', help='输出格式 (simple/grid/fancy_grid)')
+def add_record(format):
+    """记录员工表现"""
+    tracker = get_tracker()
+    
+    # 获取当前绩效周期
+    start_date, end_date = tracker.get_current_performance_cycle()
+    if not start_date or not end_date:
+        click.echo('请先设置绩效周期（使用 set-perf 命令）')
+        return
+    
+    # 获取并显示所有激活状态的员工
+    employees = tracker.get_all_employees()
+    if not employees:
+        click.echo('暂无员工信息')
+        return
+        
+    active_employees = [emp for emp in employees if emp[12]]
+    if not active_employees:
+        click.echo('暂无激活状态的员工')
+        return
+    
+    # 显示员工列表供选择
+    click.echo(click.style("\n当前激活员工列表：", fg='green'))
+    for emp in active_employees:
+        click.echo(f"{emp[0]}: {emp[1]} ({emp[9]})")  # ID: 姓名 (部门)
+    
+    # 选择员工
+    while True:
+        employee_id = click.prompt('请输入员工ID', type=int)
+        employee = tracker.get_employee(employee_id)
+        if employee and employee[12]:
+            break
+        click.echo('无效的员工ID，请重新输入')
+    
+    # 获取并显示所有可用的表现类别
+    categories = tracker.get_active_categories()
+    if not categories:
+        click.echo('错误：未找到任何可用的表现类别')
+        return
+    
+    click.echo(click.style('\n可选的表现类别：', fg='green'))
+    for i, (name, description) in enumerate(categories, 1):
+        click.echo(f'{i}. {name} - {description}')
+    
+    # 选择表现类别
+    while True:
+        category_input = click.prompt('请选择表现类别(输入序号或类别名称)')
+        try:
+            # 尝试通过序号选择
+            idx = int(category_input) - 1
+            if 0 <= idx < len(categories):
+                category = categories[idx][0]
+                break
+        except ValueError:
+            # 通过名称选择
+            if category_input in [cat[0] for cat in categories]:
+                category = category_input
+                break
+        click.echo('无效的选择，请重新输入')
+    
+    # 获取分值
+    while True:
+        score_str = click.prompt('请输入分值（需要带+/-符号，如：+5 或 -3）')
+        try:
+            if score_str[0] not in ('+', '-'):
+                click.echo('错误：分值必须带有+或-符号')
+                continue
+            score = float(score_str)
+            break
+        except ValueError:
+            click.echo('错误：请输入有效的数字')
+    
+    # 获取描述
+    description = click.prompt('请输入表现描述')
+    
+    # 确认添加
+    click.echo(click.style('\n请确认以下信息：', fg='yellow'))
+    click.echo(f'员工：{employee[1]}')
+    click.echo(f'类别：{category}')
+    click.echo(f'分值：{score:>+6.2f}')
+    click.echo(f'描述：{description}')
+    
+    if not click.confirm('\n是否确认添加？'):
+        click.echo('操作已取消')
+        return
+    
+    # 执行添加
+    try:
+        tracker.add_performance_record(employee_id, category, description, score)
+        click.echo(click.style('\n记录添加成功！', fg='green'))
+    except Exception as e:
+        click.echo(f'添加失败：{str(e)}')
+
+@record.command('change')
+@click.option('--format', '-f', default='simple', help='输出格式 (simple/grid/fancy_grid)')
+def change_record(format):
+    """修改表现记录"""
+    tracker = get_tracker()
+    
+    # 获取当前绩效周期
+    start_date, end_date = tracker.get_current_performance_cycle()
+    if not start_date or not end_date:
+        click.echo('请先设置绩效周期（使用 set-perf 命令）')
+        return
+    
+    # 获取并显示所有激活状态的员工
+    employees = tracker.get_all_employees()
+    if not employees:
+        click.echo('暂无员工信息')
+        return
+        
+    active_employees = [emp for emp in employees if emp[12]]
+    if not active_employees:
+        click.echo('暂无激活状态的员工')
+        return
+    
+    # 显示员工列表供选择
+    click.echo(click.style("\n当前激活员工列表：", fg='green'))
+    for emp in active_employees:
+        click.echo(f"{emp[0]}: {emp[1]} ({emp[9]})")  # ID: 姓名 (部门)
+    
+    # 选择员工
+    while True:
+        employee_id = click.prompt('请输入员工ID', type=int)
+        employee = tracker.get_employee(employee_id)
+        if employee and employee[12]:
+            break
+        click.echo('无效的员工ID，请重新输入')
+    
+    # 获取该员工在当前周期内的所有表现记录
+    records = tracker.get_employee_performance_records(employee_id, start_date, end_date)
+    if not records:
+        click.echo(f'在当前周期（{start_date} 至 {end_date}）内未找到该员工的表现记录')
+        return
+    
+    # 显示所有记录
+    click.echo(click.style(f'\n{employee[1]}的表现记录：', fg='yellow'))
+    headers = ['序号', '记录ID', '类别', '分值', '描述', '记录日期']
+    records_list = []
+    for i, record in enumerate(records, 1):
+        records_list.append([
+            i,
+            record[0],  # record_id
+            record[2],  # category_name
+            click.style(f"{record[3]:>+6.2f}", fg='green' if record[3] > 0 else 'red'),  # score
+            record[4],  # description
+            record[5]   # record_date
+        ])
+    click.echo(tabulate(records_list, headers=headers, tablefmt=format))
+    
+    # 选择要修改的记录
+    while True:
+        idx = click.prompt('\n请选择要修改的记录序号', type=int)
+        if 1 <= idx <= len(records):
+            record = records[idx - 1]
+            break
+        click.echo('无效的序号，请重新输入')
+    
+    # 获取新的分值
+    while True:
+        score_str = click.prompt('\n请输入新的分值（需要带+/-符号，如：+5 或 -3）')
+        try:
+            if score_str[0] not in ('+', '-'):
+                click.echo('错误：分值必须带有+或-符号')
+                continue
+            new_score = float(score_str)
+            break
+        except ValueError:
+            click.echo('错误：请输入有效的数字')
+    
+    # 获取新的描述
+    new_description = click.prompt('请输入新的描述（直接回车保持不变）', default=record[4])
+    
+    # 确认修改
+    click.echo(click.style('\n请确认以下修改：', fg='yellow'))
+    if new_score != record[3]:
+        click.echo(f'分值：{record[3]:>+6.2f} -> {new_score:>+6.2f}')
+    if new_description != record[4]:
+        click.echo(f'描述：{record[4]} -> {new_description}')
+    
+    if not click.confirm('\n是否确认执行以上修改？'):
+        click.echo('操作已取消')
+        return
+    
+    # 执行修改
+    try:
+        tracker.update_performance_record(record[0], new_score, new_description)
+        click.echo(click.style('\n记录修改成功！', fg='green'))
+    except Exception as e:
+        click.echo(f'修改失败：{str(e)}')
+
+@record.command('del')
+@click.option('--format', '-f', default='simple', help='输出格式 (simple/grid/fancy_grid)')
+def delete_record(format):
+    """删除表现记录"""
+    tracker = get_tracker()
+    
+    # 获取当前绩效周期
+    start_date, end_date = tracker.get_current_performance_cycle()
+    if not start_date or not end_date:
+        click.echo('请先设置绩效周期（使用 set-perf 命令）')
+        return
+    
+    # 获取并显示所有激活状态的员工
+    employees = tracker.get_all_employees()
+    if not employees:
+        click.echo('暂无员工信息')
+        return
+        
+    active_employees = [emp for emp in employees if emp[12]]
+    if not active_employees:
+        click.echo('暂无激活状态的员工')
+        return
+    
+    # 显示员工列表供选择
+    click.echo(click.style("\n当前激活员工列表：", fg='green'))
+    for emp in active_employees:
+        click.echo(f"{emp[0]}: {emp[1]} ({emp[9]})")  # ID: 姓名 (部门)
+    
+    # 选择员工
+    while True:
+        employee_id = click.prompt('请输入员工ID', type=int)
+        employee = tracker.get_employee(employee_id)
+        if employee and employee[12]:
+            break
+        click.echo('无效的员工ID，请重新输入')
+    
+    # 获取该员工在当前周期内的所有表现记录
+    records = tracker.get_employee_performance_records(employee_id, start_date, end_date)
+    if not records:
+        click.echo(f'在当前周期（{start_date} 至 {end_date}）内未找到该员工的表现记录')
+        return
+    
+    # 显示所有记录
+    click.echo(click.style(f'\n{employee[1]}的表现记录：', fg='yellow'))
+    headers = ['序号', '记录ID', '类别', '分值', '描述', '记录日期']
+    records_list = []
+    for i, record in enumerate(records, 1):
+        records_list.append([
+            i,
+            record[0],  # record_id
+            record[2],  # category_name
+            click.style(f"{record[3]:>+6.2f}", fg='green' if record[3] > 0 else 'red'),  # score
+            record[4],  # description
+            record[5]   # record_date
+        ])
+    click.echo(tabulate(records_list, headers=headers, tablefmt=format))
+    
+    # 选择要删除的记录
+    while True:
+        idx = click.prompt('\n请选择要删除的记录序号', type=int)
+        if 1 <= idx <= len(records):
+            record = records[idx - 1]
+            break
+        click.echo('无效的序号，请重新输入')
+    
+    # 确认删除
+    click.echo(click.style('\n请确认要删除以下记录：', fg='yellow'))
+    click.echo(f'员工：{employee[1]}')
+    click.echo(f'类别：{record[2]}')
+    click.echo(f'分值：{record[3]:>+6.2f}')
+    click.echo(f'描述：{record[4]}')
+    click.echo(f'记录日期：{record[5]}')
+    
+    if not click.confirm('\n是否确认删除？', abort=True):
+        click.echo('操作已取消')
+        return
+    
+    # 执行删除
+    try:
+        tracker.delete_performance_record(record[0])
+        click.echo(click.style('\n记录删除成功！', fg='green'))
+    except Exception as e:
+        click.echo(f'删除失败：{str(e)}')
+
+@record.command('env')
+@click.option('--format', '-f', default='simple', help='输出格式 (simple/grid/fancy_grid)')
+def add_event_score(format):
+    """记录团队事件相关表现"""
+    tracker = get_tracker()
+    
+    # 获取当前绩效周期
+    start_date, end_date = tracker.get_current_performance_cycle()
+    if not start_date or not end_date:
+        click.echo('请先设置绩效周期（使用 set-perf 命令）')
+        return
+    
+    # 获取事件描述
+    event = click.prompt('请输入事件描述')
+    
+    # 获取并显示所有可用的表现类别
+    categories = tracker.get_active_categories()
+    if not categories:
+        click.echo('错误：未找到任何可用的表现类别')
+        return
+    
+    click.echo(click.style('\n可选的表现类别：', fg='green'))
+    for i, (name, description) in enumerate(categories, 1):
+        click.echo(f'{i}. {name} - {description}')
+    
+    # 选择表现类别
+    while True:
+        category_input = click.prompt('请选择表现类别(输入序号或类别名称)')
+        try:
+            # 尝试通过序号选择
+            idx = int(category_input) - 1
+            if 0 <= idx < len(categories):
+                category = categories[idx][0]
+                break
+        except ValueError:
+            # 通过名称选择
+            if category_input in [cat[0] for cat in categories]:
+                category = category_input
+                break
+        click.echo('无效的选择，请重新输入')
+    
+    # 获取并显示所有激活状态的员工
+    employees = tracker.get_all_employees()
+    if not employees:
+        click.echo('暂无员工信息')
+        return
+        
+    active_employees = [emp for emp in employees if emp[12]]
+    if not active_employees:
+        click.echo('暂无激活状态的员工')
+        return
+    
+    # 显示员工列表供选择
+    click.echo(click.style("\n当前激活员工列表：", fg='green'))
+    for emp in active_employees:
+        click.echo(f"{emp[0]}: {emp[1]} ({emp[9]})")  # ID: 姓名 (部门)
+    
+    # 选择加分模式
+    mode = click.prompt(
+        '请选择加分模式',
+        type=click.Choice(['1', '2']),
+        show_choices=False,
+        prompt_suffix='\n1. 统一加分（为多名员工统一加分）\n2. 单独加分（为每名员工单独设置分值）\n请输入(1/2)：'
+    )
+    
+    employee_scores = []
+    if mode == '1':
+        # 统一加分模式
+        while True:
+            try:
+                # 获取统一分值
+                score_str = click.prompt('请输入统一分值（需要带+/-符号，如：+5 或 -3）')
+                if score_str[0] not in ('+', '-'):
+                    click.echo('错误：分值必须带有+或-符号')
+                    continue
+                score = float(score_str)
+                
+                # 获取员工ID列表
+                ids_input = click.prompt('请输入员工ID列表（多个ID用逗号分隔，如：1,2,3）')
+                employee_ids = [int(id.strip()) for id in ids_input.split(',')]
+                
+                # 验证所有ID是否有效
+                invalid_ids = [id for id in employee_ids if not is_active_employee(tracker, id)]
+                if invalid_ids:
+                    click.echo(f'错误：以下ID无效或对应员工未激活：{invalid_ids}')
+                    continue
+                
+                # 为每个员工添加相同的分值
+                employee_scores = [(eid, score) for eid in employee_ids]
+                break
+                
+            except ValueError:
+                click.echo('错误：请输入有效的分值和ID列表')
+    else:
+        # 单独加分模式
+        while True:
+            score_input = click.prompt('请输入员工ID和分值（格式：ID1,分值1;ID2,分值2 例如：1,+5;2,-3）')
+            try:
+                # 解析输入
+                pairs = score_input.strip().split(';')
+                employee_scores = []
+                invalid_ids = []
+                
+                for pair in pairs:
+                    if not pair.strip():
+                        continue
+                    id_str, score_str = pair.strip().split(',')
+                    employee_id = int(id_str.strip())
+                    
+                    # 验证员工ID是否有效
+                    if not is_active_employee(tracker, employee_id):
+                        invalid_ids.append(employee_id)
+                        continue
+                    
+                    # 解析分值（支持+/-符号）
+                    score_str = score_str.strip()
+                    if score_str[0] not in ('+', '-'):
+                        click.echo('错误：分值必须带有+或-符号')
+                        employee_scores = []
+                        break
+                    score = float(score_str)
+                    
+                    employee_scores.append((employee_id, score))
+                
+                if invalid_ids:
+                    click.echo(f'错误：以下ID无效或对应员工未激活：{invalid_ids}')
+                    continue
+                    
+                if employee_scores:
+                    break
+                    
+            except ValueError:
+                click.echo('错误：输入格式不正确，请使用正确的格式（ID1,分值1;ID2,分值2）')
+    
+    # 确认操作
+    click.echo(click.style('\n请确认以下操作：', fg='yellow'))
+    click.echo(f'事件描述：{event}')
+    click.echo(f'表现类别：{category}')
+    click.echo(f'加分模式：{"统一加分" if mode == "1" else "单独加分"}')
+    click.echo('\n参与员工及分值：')
+    
+    # 显示详细的加分信息
+    headers = ['姓名', '部门', '分值']
+    details = []
+    for emp_id, score in employee_scores:
+        emp = tracker.get_employee(emp_id)
+        score_str = click.style(f"{score:>+6.2f}", fg='green' if score > 0 else 'red')
+        details.append([emp[1], emp[9], score_str])
+    click.echo(tabulate(details, headers=headers))
+    
+    if not click.confirm('\n是否确认执行以上操作？'):
+        click.echo('操作已取消')
+        return
+    
+    # 执行加分操作（同一事务内批量写入）
+    try:
+        failures = tracker.add_performance_records_bulk(category, employee_scores, f'团队事件：{event}')
+    except Exception as e:
+        click.echo(f'添加记录时出错：{str(e)}')
+        failures = [(employee_id, str(e)) for employee_id, _ in employee_scores]
+    else:
+        for employee_id, reason in failures:
+            click.echo(f'为员工ID {employee_id} 添加记录时出错：{reason}')
+    success_count = len(employee_scores) - len(failures)
+    
+    # 显示执行结果
+    if success_count > 0:
+        click.echo(click.style(f'\n成功为 {success_count} 名员工添加得分记录：', fg='green'))
+        click.echo(f'类别：{category}')
+        click.echo(f'事件：{event}')
+        click.echo(f'记录时间：{datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
+    else:
+        click.echo('操作失败：未能成功添加任何记录')
+
+@record.command('list')
+@click.option('--format', '-f', default='simple', help=FORMAT_HELP)
+@click.option('--all', '-a', is_flag=True, help='显示所有记录（不限制在当前绩效周期内）')
+@click.option('--page-size', type=click.IntRange(min=1), default=100, help='每页显示的记录数')
+def list_records(format, all, page_size):
+    """列出表现记录"""
+    tracker = get_tracker()
+    
+    # 获取当前绩效周期
+    start_date, end_date = tracker.get_current_performance_cycle()
+    if not start_date or not end_date:
+        click.echo('请先设置绩效周期（使用 set perf 命令）', err=format in STRUCTURED_FORMATS)
+        return
+    
+    # 按页读取记录，第一条记录用于判断是否为空
+    records = tracker.iter_performance_records(None if all else start_date, None if all else end_date)
+    if format in STRUCTURED_FORMATS:
+        echo_structured(records, RECORD_COLUMNS, format)
+        return
+    first = next(records, None)
+    if first is None:
+        click.echo('暂无表现记录')
+        return
+    
+    # 显示记录
+    click.echo(click.style(f'\n表现记录列表（{start_date} 至 {end_date}）：', fg='blue'))
+    
+    headers = ['记录ID', '员工', '部门', '类别', '分值', '描述', '记录日期']
+    rows = (
+        [
+            record[0],  # 记录ID
+            record[1],  # 员工姓名
+            record[2],  # 部门
+            record[3],  # 类别
+            click.style(f"{record[4]:>+6.2f}", fg='green' if record[4] > 0 else 'red'),  # 分值
+            record[5],  # 描述
+            record[6]   # 记录日期
+        ]
+        for record in chain([first], records)
+    )
+    click.echo_via_pager(stream_table(rows, headers, format, page_size))
+
+@record.command('search')
+@click.argument('keywords', nargs=-1, required=True)
+@click.option('--start', 'start_date', default=None, help='开始日期 (YYYY-MM-DD)，默认不限')
+@click.option('--end', 'end_date', default=None, help='结束日期 (YYYY-MM-DD)，默认不限')
+@click.option('--year', '-y', type=int, default=None, help='只检索指定年份（覆盖 --start/--end）')
+@click.option('--source', '-s', type=click.Choice(['all', 'records', 'workload']), default='all', help='检索表现记录、工作量记录或全部')
+@click.option('--limit', '-n', type=click.IntRange(min=1), default=50, help='最多显示的条数')
+@click.option('--format', '-f', default='simple', help='输出格式 (simple/grid/fancy_grid)')
+def search_records(keywords, start_date, end_date, year, source, limit, format):
+    """按关键词检索表现记录和工作量记录的描述
+    
+    多个关键词须同时出现；结果按相关度排序，三个字及以上的关键词使用全文索引。
+    """
+    tracker = get_tracker()
+    if year:
+        start_date, end_date = f'{year}-01-01', f'{year}-12-31'
+    sources = ('records', 'workload') if source == 'all' else (source,)
+    try:
+        hits = tracker.search_records(' '.join(keywords), start_date, end_date, sources, limit)
+    except ValueError as e:
+        click.echo(f'检索失败：{str(e)}')
+        return
+    if not hits:
+        click.echo('没有找到匹配的记录')
+        return
+    
+    labels = {'records': '表现记录', 'workload': '工作量'}
+    headers = ['来源', '记录ID', '日期', '员工', '部门', '类别', '分值', '描述']
+    rows = [
+        [
+            labels[hit[0]],  # 来源
+            hit[1],  # 记录ID
+            hit[2],  # 日期（工作量为周一日期）
+            hit[3],  # 员工姓名
+            hit[4],  # 部门
+            hit[5],  # 类别或周次
+            click.style(f"{hit[6]:>+6.2f}", fg='green' if hit[6] > 0 else 'red'),  # 分值
+            hit[7]   # 描述
+        ]
+        for hit in hits
+    ]
+    click.echo(click.style(f'\n检索结果（共 {len(hits)} 条）：', fg='blue'))
+    click.echo(tabulate(rows, headers=headers, tablefmt=format))
+
+@record.command('work')
+@click.option('--format', '-f', default='simple', help=FORMAT_HELP)
+@click.option('--all', '-a', is_flag=True, help='显示所有记录（不限制在当前绩效周期内）')
+@click.option('--week', '-w', type=int, help='查看指定周的记录')
+@click.option('--year', '-y', type=int, default=lambda: datetime.now().year, help='查看指定年份的记录')
+@click.option('--page-size', type=click.IntRange(min=1), default=100, help='每页显示的记录数')
+def list_workload_records(format, all, week, year, page_size):
+    """列出工作量记录"""
+    tracker = get_tracker()
+    structured = format in STRUCTURED_FORMATS
+    
+    if week:
+        # 查看指定周的记录
+        if not 1 <= week <= 53:
+            click.echo('无效的周数，请输入1-53之间的数字', err=structured)
+            return
+        
+        # 获取指定周的起止日期
+        first_day = datetime(year, 1, 1)
+        week_start = first_day - timedelta(days=first_day.isoweekday() - 1)
+        week_start = week_start + timedelta(weeks=week-1)
+        week_end = week_start + timedelta(days=6)
+        
+        # 验证周数是否属于指定年份
+        if week_start.isocalendar()[0] != year:
+            click.echo(f'第{week}周不属于{year}年', err=structured)
+            return
+        
+        # 获取指定周的记录
+        records = tracker.get_workload_records_by_week(week, year)
+        if structured:
+            echo_structured(map(workload_values, records), WORKLOAD_COLUMNS, format)
+            return
+        if not records:
+            click.echo(f'{year}年第{week}周暂无工作量记录')
+            return
+        
+        # 显示记录
+        click.echo(click.style(
+            f'\n{year}年第{week}周工作量记录（{week_start.strftime("%m.%d")}-{week_end.strftime("%m.%d")}）：',
+            fg='blue'
+        ))
+    else:
+        # 获取当前绩效周期
+        start_date, end_date = tracker.get_current_performance_cycle()
+        if not start_date or not end_date:
+            click.echo('请先设置绩效周期（使用 set perf 命令）', err=structured)
+            return
+        
+        # 按页读取记录，第一条记录用于判断是否为空
+        records = tracker.iter_workload_records(None if all else start_date, None if all else end_date)
+        if structured:
+            echo_structured(map(workload_values, records), WORKLOAD_COLUMNS, format)
+            return
+        first = next(records, None)
+        if first is None:
+            click.echo('暂无工作量记录')
+            return
+        records = chain([first], records)
+        
+        # 显示记录
+        click.echo(click.style(f'\n工作量记录列表（{start_date} 至 {end_date}）：', fg='blue'))
+    
+    rows = (format_workload_record(record) for record in records)
+    click.echo_via_pager(stream_table(rows, WORKLOAD_HEADERS, format, page_size))
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""系统设置命令 (perf set)"""
+
+import click
+from src.cli.common import get_tracker
+from src.db.database import STORAGE_PROFILES
+
+@click.group('set')
+def settings():
+    """系统设置相关命令"""
+    pass
+
+@settings.command('dept')
+@click.argument('department')
+def set_department(department):
+    """设置默认部门"""
+    tracker = get_tracker()
+    try:
+        tracker.update_global_setting('default_department', department, '默认部门')
+        click.echo(f'成功设置默认部门为：{department}')
+    except Exception as e:
+        click.echo(f'设置失败：{str(e)}')
+
+@settings.command('perf')
+@click.option('--cycle', type=click.Choice(['monthly', 'quarterly']), prompt='请选择绩效周期类型', help='monthly: 月度, quarterly: 季度')
+def set_performance_cycle(cycle):
+    """设置绩效统计周期"""
+    tracker = get_tracker()
+    try:
+        tracker.update_global_setting('performance_cycle', cycle, '绩效统计周期')
+        click.echo(f'成功设置绩效周期为：{"月度" if cycle == "monthly" else "季度"}')
+    except Exception as e:
+        click.echo(f'设置失败：{str(e)}')
+
+@settings.command('storage')
+@click.argument('profile', type=click.Choice(list(STORAGE_PROFILES)))
+def set_storage_profile(profile):
+    """设置数据库存储配置（日志模式、同步级别、缓存等）
+    
+    \b
+    default : WAL 日志，CLI 与 API 可以同时读写
+    durable : 每次提交同步落盘
+    bulk    : 大批量导入时使用，关闭同步
+    legacy  : 回滚日志模式
+    
+    环境变量 PERF_DB_PROFILE 优先于此设置。
+    """
+    tracker = get_tracker()
+    try:
+        tracker.update_global_setting('storage_profile', profile, '数据库存储配置')
+        click.echo(f'成功设置存储配置为：{profile}（下次连接数据库时生效）')
+    except Exception as e:
+        click.echo(f'设置失败：{str(e)}')
+
+@settings.command('rule')
+@click.option('--category', prompt='评分类别', help='评分类别（工作量得分使用 "工作承担"）')
+@click.option('--weight', prompt='权重', type=float, help='权重值')
+@click.option('--description', prompt='规则描述', help='规则描述')
+@click.option('--effective-date', default=None, help='生效日期 (YYYY-MM-DD)，默认为当天')
+def set_scoring_rule(category, weight, description, effective_date):
+    """设置评分规则
+    
+    规则按生效日期保存版本，统计绩效周期时使用周期结束日期当时生效的版本。
+    """
+    tracker = get_tracker()
+    try:
+        tracker.update_scoring_rule(category, weight, description, effective_date)
+        click.echo(f'成功更新评分规则：{category}')
+    except Exception as e:
+        click.echo(f'设置失败：{str(e)}')
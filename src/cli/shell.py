@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""交互式命令行 (perf shell)"""
+
+import shlex
+
+import click
+from src.cli.common import get_tracker
+
+# 会话内置命令（不属于 perf 命令组）
+SHELL_BUILTINS = ('help', 'exit', 'quit')
+
+class ShellCompleter:
+    """perf shell 的 Tab 补全
+
+    输入命令时补全命令组、子命令和选项；命令执行过程中等待输入（选择员工、类别等）时，
+    从跟踪器的维度缓存补全员工ID、姓名、域账号和类别名称。
+    """
+
+    def __init__(self, root, tracker):
+        """初始化补全器
+
+        Args:
+            root: 顶层命令组
+            tracker: 会话共享的 PerformanceTracker
+        """
+        self.root = root
+        self.tracker = tracker
+        self.command_mode = True
+        self._matches = []
+
+    def command_candidates(self, line):
+        """根据光标前已输入的命令行，返回可补全的命令或选项"""
+        words = line.split()
+        prefix = '' if not words or line[-1].isspace() else words.pop()
+        command = self.root
+        for word in words:
+            if not isinstance(command, click.Group):
+                break
+            subcommand = command.get_command(None, word)
+            if subcommand is None:
+                return []
+            command = subcommand
+
+        if isinstance(command, click.Group):
+            names = command.list_commands(None)
+            if command is self.root:
+                names = [name for name in names if name != 'shell'] + list(SHELL_BUILTINS)
+        else:
+            names = [
+                option for param in command.params if isinstance(param, click.Option)
+                for option in param.opts if option.startswith('--')
+            ] + ['--help']
+        return sorted(name for name in names if name.startswith(prefix))
+
+    def directory_candidates(self, text):
+        """返回与输入匹配的员工和类别
+
+        输入数字时补全员工ID；输入姓名或域账号的前缀且只匹配一名员工时补全为该员工的ID，
+        以便直接用于“请输入员工ID”；否则补全姓名、域账号和启用的类别名称。
+        """
+        employees = self.tracker.get_all_employees()
+        if text.isdigit():
+            return sorted(str(row[0]) for row in employees if str(row[0]).startswith(text))
+
+        matched = [row for row in employees if row[1].startswith(text) or (row[2] or '').startswith(text)]
+        categories = [name for name, _ in self.tracker.get_active_categories() if name.startswith(text)]
+        if text and len(matched) == 1 and not categories:
+            return [str(matched[0][0])]
+        names = {value for row in matched for value in row[1:3] if value and value.startswith(text)}
+        return sorted(names | set(categories))
+
+    def complete(self, text, state):
+        """readline 补全回调"""
+        if state == 0:
+            if self.command_mode:
+                import readline
+                self._matches = self.command_candidates(readline.get_line_buffer()[:readline.get_endidx()])
+            else:
+                self._matches = self.directory_candidates(text)
+        return self._matches[state] if state < len(self._matches) else None
+
+def install_completer(completer):
+    """启用 Tab 补全；没有 readline 的平台（如 Windows）只是不提供补全"""
+    try:
+        import readline
+    except ImportError:
+        return False
+    readline.set_completer_delims(' \t\n')
+    readline.set_completer(completer.complete)
+    if 'libedit' in (readline.__doc__ or ''):
+        readline.parse_and_bind('bind ^I rl_complete')
+    else:
+        readline.parse_and_bind('tab: complete')
+    return True
+
+def run_command(root, args, tracker):
+    """在会话共享的跟踪器上执行一条命令，命令出错或被取消时不退出会话"""
+    try:
+        root.main(args, prog_name='perf', standalone_mode=False, obj=tracker)
+    except click.ClickException as e:
+        e.show()
+    except click.Abort:
+        click.echo('\n操作已取消')
+    except Exception as e:
+        click.echo(click.style(f'命令执行失败：{str(e)}', fg='red'))
+
+@click.command('shell')
+def shell():
+    """交互式命令行，连续执行多条命令
+
+    会话内的命令共用一个跟踪器：数据库只连接、迁移一次，员工和类别等维度数据、
+    全局设置以及预编译语句在命令之间保持缓存，其他进程修改数据后缓存自动失效。
+
+    \b
+    输入命令时省略开头的 perf，例如：rec add、emp list
+    help [命令]  : 显示帮助
+    exit / quit : 退出（也可使用 Ctrl-D）
+    Tab         : 补全命令和选项；命令中输入员工、类别时补全ID、姓名、域账号和类别名称
+    """
+    from src.cli.commands import cli
+
+    tracker = get_tracker()
+    completer = ShellCompleter(cli, tracker)
+    install_completer(completer)
+    # 预先加载员工和类别目录，后续命令和补全直接使用缓存
+    tracker.get_all_employees()
+    tracker.get_active_categories()
+    click.echo(click.style('员工绩效跟踪系统交互模式，输入 help 查看命令，exit 退出', fg='green'))
+
+    try:
+        while True:
+            completer.command_mode = True
+            try:
+                line = click.prompt('perf', prompt_suffix='> ', default='', show_default=False)
+            except click.Abort:
+                click.echo()
+                break
+            completer.command_mode = False
+
+            try:
+                args = shlex.split(line)
+            except ValueError as e:
+                click.echo(f'无法解析命令：{str(e)}')
+                continue
+            if not args:
+                continue
+            if args[0] in ('exit', 'quit'):
+                break
+            if args[0] == 'help':
+                args = args[1:] + ['--help']
+            if args[0] == 'shell':
+                click.echo('已在交互模式中')
+                continue
+            run_command(cli, args, tracker)
+    finally:
+        tracker.db.close()
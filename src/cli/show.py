@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""绩效查看命令 (perf show)"""
+
+from itertools import chain
+
+import click
+from src.cli.common import FORMAT_HELP, STRUCTURED_FORMATS, echo_structured, get_tracker, stream_table, tabulate
+
+# show detail 结构化输出的列：source 为 workload（工作承担得分）或 record（表现得分），不适用的列为空
+DETAIL_COLUMNS = (
+    'source', 'year', 'week_number', 'ranking_percentage', 'category', 'score', 'description', 'record_date'
+)
+
+@click.group('show')
+def show():
+    """绩效查看相关命令"""
+    pass
+
+@show.command('perf')
+@click.option('--format', '-f', default='simple', help=FORMAT_HELP)
+@click.option('--page-size', type=click.IntRange(min=1), default=100, help='每页显示的员工数')
+def show_performance_summary(format, page_size):
+    """显示当前绩效周期内所有员工的绩效统计"""
+    tracker = get_tracker()
+    
+    # 获取当前绩效周期
+    start_date, end_date = tracker.get_current_performance_cycle()
+    if not start_date or not end_date:
+        click.echo('请先设置绩效周期（使用 set-perf 命令）', err=format in STRUCTURED_FORMATS)
+        return
+    
+    # 获取绩效统计数据
+    scores = tracker.get_cycle_scores(start_date, end_date)
+    summary_data, categories = scores.rows(), scores.categories
+    if format in STRUCTURED_FORMATS:
+        columns = ('employee_id', 'name', 'department', 'workload', *categories, 'total')
+        echo_structured(summary_data, columns, format)
+        return
+    if not summary_data:
+        click.echo('当前周期内暂无绩效数据')
+        return
+    
+    # 显示统计信息
+    click.echo(click.style(f'\n当前绩效周期（{start_date} 至 {end_date}）统计：', fg='green', bold=True))
+    if scores.weighted:
+        weights = [('工作承担', scores.workload_weight), *zip(categories, scores.weights.tolist())]
+        click.echo('总分按评分规则加权：' + '，'.join(f'{name}×{weight:g}' for name, weight in weights))
+    
+    # 准备表格数据，着色模板只生成一次
+    headers = ['员工ID', '姓名', '部门', '工作承担', *categories, '总分']
+    workload_style = click.style('{:>6.2f}', fg='blue')
+    positive_style = click.style('{:>6.2f}', fg='green')
+    negative_style = click.style('{:>6.2f}', fg='red')
+    total_style = click.style('{:>6.2f}', fg='yellow', bold=True)
+    
+    def format_row(row):
+        emp_id, name, department, workload_score = row[:4]
+        category_scores = [
+            (positive_style if score > 0 else negative_style).format(score)
+            for score in row[4:-1]
+        ]
+        return [
+            emp_id, name, department, workload_style.format(workload_score),
+            *category_scores, total_style.format(row[-1])
+        ]
+    
+    # 逐行格式化并输出，行数超过一页时不必等全部格式化完成
+    table_data = (format_row(row) for row in summary_data)
+    click.echo_via_pager(stream_table(table_data, headers, format, page_size))
+
+@show.command('rules')
+@click.option('--format', '-f', default='simple', help='输出格式 (simple/grid/fancy_grid)')
+@click.option('--all', '-a', is_flag=True, help='显示所有版本（不限于当前绩效周期生效的规则）')
+def show_scoring_rules(format, all):
+    """显示评分规则"""
+    tracker = get_tracker()
+    
+    if all:
+        rules = tracker.get_scoring_rules()
+        title = '所有评分规则版本'
+    else:
+        _, end_date = tracker.get_current_performance_cycle()
+        if not end_date:
+            click.echo('请先设置绩效周期（使用 set perf 命令）')
+            return
+        rules = tracker.get_scoring_rules(end_date)
+        title = f'截至 {end_date} 生效的评分规则'
+    
+    if not rules:
+        click.echo('暂无评分规则，各类别按权重 1 计算')
+        return
+    
+    click.echo(click.style(f'\n{title}：', fg='green', bold=True))
+    headers = ['类别', '权重', '描述', '生效日期']
+    click.echo(tabulate(rules, headers=headers, tablefmt=format))
+
+def parse_weight_set(text):
+    """解析 "类别=权重,类别=权重" 格式的候选权重"""
+    weight_set = {}
+    for item in text.split(','):
+        name, sep, weight = item.partition('=')
+        if not sep or not name.strip():
+            raise click.BadParameter(f'无法解析权重 "{item}"，格式应为 类别=权重')
+        try:
+            weight_set[name.strip()] = float(weight)
+        except ValueError:
+            raise click.BadParameter(f'权重 "{weight}" 不是数字')
+    return weight_set
+
+@show.command('simulate')
+@click.option('--weights', '-w', multiple=True, help='一组候选权重，格式为 "类别=权重,类别=权重"，可重复指定')
+@click.option('--file', 'weights_file', type=click.File('r', encoding='utf-8'), help='候选权重文件，每行一组，# 开头为注释')
+@click.option('--all', '-a', is_flag=True, help='显示所有员工（默认只显示排名或档位变化的员工）')
+@click.option('--format', '-f', default='simple', help='输出格式 (simple/grid/fancy_grid)')
+def show_simulation(weights, weights_file, all, format):
+    """模拟多组候选权重下当前绩效周期的排名变化
+    
+    未提及的类别沿用当前评分规则，工作量使用类别名称 "工作承担"。
+    """
+    tracker = get_tracker()
+    
+    start_date, end_date = tracker.get_current_performance_cycle()
+    if not start_date or not end_date:
+        click.echo('请先设置绩效周期（使用 set perf 命令）')
+        return
+    
+    lines = list(weights)
+    if weights_file:
+        lines.extend(line.strip() for line in weights_file if line.strip() and not line.lstrip().startswith('#'))
+    if not lines:
+        click.echo('请通过 --weights 或 --file 提供候选权重')
+        return
+    
+    try:
+        weight_sets = [parse_weight_set(line) for line in lines]
+        simulation = tracker.simulate_weights(start_date, end_date, weight_sets)
+    except (click.BadParameter, ValueError) as e:
+        click.echo(f'模拟失败：{str(e)}')
+        return
+    if not len(simulation.baseline):
+        click.echo('当前周期内暂无绩效数据')
+        return
+    
+    click.echo(click.style(f'\n当前绩效周期（{start_date} 至 {end_date}）权重模拟：', fg='green', bold=True))
+    headers = ['员工ID', '姓名', '当前排名', '模拟排名', '变化', '当前档位', '模拟档位', '模拟总分']
+    # 逐组输出，每组计算完成即显示
+    for n, line in enumerate(lines):
+        rows = simulation.changes(n, moved_only=not all)
+        click.echo(click.style(f'\n方案 {n + 1}：{line}', fg='yellow', bold=True))
+        if not rows:
+            click.echo('排名与档位均无变化')
+            continue
+        table_data = [
+            [emp_id, name, rank, new_rank,
+             click.style(f'{delta:+d}', fg='green' if delta > 0 else 'red' if delta < 0 else None),
+             tier, click.style(new_tier, fg='yellow') if new_tier != tier else new_tier, f'{total:.2f}']
+            for emp_id, name, rank, new_rank, delta, tier, new_tier, total in rows
+        ]
+        click.echo(tabulate(table_data, headers=headers, tablefmt=format))
+
+@show.command('detail')
+@click.argument('employee_id', type=int)
+@click.option('--format', '-f', default='simple', help=FORMAT_HELP)
+def show_performance_detail(employee_id, format):
+    """显示特定员工的详细绩效记录"""
+    tracker = get_tracker()
+    structured = format in STRUCTURED_FORMATS
+    
+    # 获取当前绩效周期
+    start_date, end_date = tracker.get_current_performance_cycle()
+    if not start_date or not end_date:
+        click.echo('请先设置绩效周期（使用 set-perf 命令）', err=structured)
+        return
+    
+    # 获取员工信息
+    employee = tracker.get_employee_detail(employee_id)
+    if not employee:
+        click.echo(f'未找到ID为 {employee_id} 的员工', err=structured)
+        return
+    
+    if structured:
+        workload_details = tracker.get_employee_workload_detail(employee_id, start_date, end_date)
+        performance_details = tracker.get_employee_performance_detail(employee_id, start_date, end_date)
+        rows = chain(
+            (('workload', year, week, percentage, None, score, description, None)
+             for week, percentage, score, year, description in workload_details),
+            (('record', None, None, None, category, score, description, record_date)
+             for category, description, score, record_date in performance_details),
+        )
+        echo_structured(rows, DETAIL_COLUMNS, format)
+        return
+    
+    click.echo(click.style(f'\n{employee[1]}的绩效详情（{start_date} 至 {end_date}）：', fg='green', bold=True))
+    
+    # 显示当前排名
+    standing = tracker.get_employee_rank(employee_id, (start_date, end_date))
+    if standing:
+        rank, count, percentile, tier, gap = standing
+        position = f'当前排名：{rank}/{count}（超过 {percentile:.1f}% 的员工，{tier}'
+        if gap is not None:
+            position += f'，距上一档还差 {gap:.2f} 分'
+        click.echo(position + '）')
+    
+    # 获取工作承担得分记录
+    workload_details = tracker.get_employee_workload_detail(employee_id, start_date, end_date)
+    if workload_details:
+        click.echo(click.style('\n工作承担得分：', fg='yellow'))
+        workload_headers = ['年份', '周数', '得分', '描述']
+        formatted_workload = []
+        for detail in workload_details:
+            score = detail[2]
+            score_str = click.style(f"{score:>6.2f}", fg='green' if score > 0 else 'red')
+            formatted_workload.append([
+                detail[3],  # 年份
+                detail[0],  # 周数
+                score_str, # 得分
+                detail[4]  # 描述
+            ])
+        click.echo(tabulate(formatted_workload, headers=workload_headers, tablefmt=format))
+    
+    # 获取表现得分记录
+    performance_details = tracker.get_employee_performance_detail(employee_id, start_date, end_date)
+    if performance_details:
+        click.echo(click.style('\n表现得分：', fg='yellow'))
+        perf_headers = ['评分类别', '描述', '得分', '记录日期']
+        formatted_perf = []
+        for detail in performance_details:
+            score = detail[2]
+            score_str = click.style(f"{score:>6.2f}", fg='green' if score > 0 else 'red')
+            formatted_perf.append([
+                detail[0],  # 类别
+                detail[1],  # 描述
+                score_str, # 得分
+                detail[3]  # 日期
+            ])
+        click.echo(tabulate(formatted_perf, headers=perf_headers, tablefmt=format))
+    
+    if not workload_details and not performance_details:
+        click.echo('当前周期内暂无评分记录')
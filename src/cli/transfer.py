@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""数据导入导出命令 (perf import / perf export)"""
+
+import sys
+
+import click
+from src.cli.common import get_tracker
+from src.core.datasets import EXPORT_DATASETS, EXPORT_FORMATS, IMPORT_DATASETS
+
+@click.command('import')
+@click.argument('dataset', type=click.Choice(IMPORT_DATASETS))
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--rejects', default=None, help='拒绝文件路径，默认为导入文件名加 .rejects.csv')
+@click.option('--chunk-size', type=click.IntRange(min=1), default=50000, help='每个事务写入的行数')
+def import_data(dataset, path, rejects, chunk_size):
+    """从 CSV、JSONL 或 Excel 文件批量导入
+    
+    \b
+    employees : 员工，列为 name、domain_account、gender、hometown、university、
+                major、phone、id_card、department、position、join_date
+    records   : 表现记录，列为 domain_account（或 employee_id）、category、score、
+                description、record_date（为空时为当天）
+    workload  : 每周工作量排名，列为 year、week、domain_account（或 employee_id）、
+                rank（1 为工作量最多）、description；文件中出现的周整体替换
+    
+    未通过校验的行连同行号和原因写入拒绝文件，其余行照常导入。
+    """
+    tracker = get_tracker()
+    rejects = rejects or f'{path}.rejects.csv'
+    try:
+        imported, rejected = tracker.import_data(dataset, path, rejects=rejects, chunk_size=chunk_size)
+    except ValueError as e:
+        click.echo(f'导入失败：{str(e)}')
+        return
+    click.echo(f'已导入 {imported} 行')
+    if rejected:
+        click.echo(f'拒绝 {rejected} 行，详见 {rejects}')
+
+@click.command('export')
+@click.argument('dataset', type=click.Choice(EXPORT_DATASETS))
+@click.option('--format', '-f', 'fmt', type=click.Choice(EXPORT_FORMATS), default='csv', help='导出格式')
+@click.option('--output', '-o', default='-', help='输出文件，默认输出到标准输出（parquet 必须指定文件）')
+@click.option('--since', default=None, help='增量导出：上次导出的最大ID，或 created_at 时间（YYYY-MM-DD HH:MM:SS）')
+@click.option('--start', 'start_date', default=None, help='summary 的周期开始日期，默认为当前绩效周期')
+@click.option('--end', 'end_date', default=None, help='summary 的周期结束日期，默认为当前绩效周期')
+@click.option('--chunk-size', type=click.IntRange(min=1), default=50000, help='每次从数据库读取的行数')
+def export_data(dataset, fmt, output, since, start_date, end_date, chunk_size):
+    """导出数据
+    
+    \b
+    records   : 表现记录
+    workload  : 工作量记录
+    employees : 员工信息
+    summary   : 周期统计（总分、排名、百分位）
+    
+    按ID升序分块导出，完成后在标准错误输出最后一行的ID，可作为下次 --since 的值。
+    增量导出只包含新增的行，修改过的已有行不会再次导出。
+    """
+    tracker = get_tracker()
+    cycle = (start_date, end_date) if start_date and end_date else None
+    target = sys.stdout if output == '-' else output
+    try:
+        rows, last_id = tracker.export_data(dataset, fmt, target, since=since, cycle=cycle, chunk_size=chunk_size)
+    except ValueError as e:
+        click.echo(f'导出失败：{str(e)}', err=True)
+        return
+    message = f'已导出 {rows} 行'
+    if last_id is not None:
+        message += f'，最后一行ID：{last_id}'
+    click.echo(message, err=True)
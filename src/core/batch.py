@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""批量操作
+
+读取 JSONL 或 YAML 格式的操作流，每个操作是一个以 op 字段区分类型的对象：
+
+    record   记录一名员工的表现：employee, category, score, description, [date]
+    event    团队事件，为多名员工记录同一类别：category, description, [date]，
+             以及 employees + score（统一分值）或 scores（{员工: 分值}，单独分值）
+    workload 以新的排名替换一周的工作量评分：year, week, employees（按工作量从高到低）, [description]，
+             描述默认与 work add 相同
+    toggle   激活/禁用员工或启用/禁用类别：employee 或 category, active
+    setting  修改全局设置：key（performance_cycle、default_department、storage_profile）, value
+    rule     设置评分规则：category, weight, description, [effective_date]
+
+员工可以用ID（整数）或域账号（字符串）指定；纯数字的字符串优先按域账号查找，没有该域账号时按员工ID查找。操作先逐条对照维度数据校验并生成变更计划，
+前面的操作对后面的校验可见（例如先启用的类别可以在之后的记录中使用）；
+全部通过后由 PerformanceTracker.apply_batch 在一个事务中执行。
+"""
+
+import json
+import sys
+from collections import namedtuple
+from datetime import date, datetime
+
+from ..db.database import STORAGE_PROFILES
+from .tracker import rank_workload_scores
+
+BATCH_OPERATIONS = ('record', 'event', 'workload', 'toggle', 'setting', 'rule')
+
+# 可通过 setting 操作修改的全局设置：键 -> (设置说明, 允许的取值，None 表示不限)
+BATCH_SETTINGS = {
+    'performance_cycle': ('绩效统计周期', ('monthly', 'quarterly')),
+    'default_department': ('默认部门', None),
+    'storage_profile': ('数据库存储配置', tuple(STORAGE_PROFILES)),
+}
+
+# 变更计划中各类步骤的名称
+STEP_LABELS = {
+    'record': '表现记录',
+    'workload': '工作量排名',
+    'employee': '员工状态',
+    'category': '类别状态',
+    'setting': '全局设置',
+    'rule': '评分规则',
+}
+
+# 变更计划中的一步：kind 为步骤类型（见 STEP_LABELS），args 为执行参数，changes 为变更说明行
+BatchStep = namedtuple('BatchStep', ['kind', 'args', 'changes'])
+
+def read_operations(path):
+    """读取操作流
+
+    .yaml/.yml 文件按 YAML 读取（需要安装 PyYAML），每个文档可以是一个操作或操作列表；
+    其他文件以及 - 表示的标准输入按 JSONL 读取，忽略空行和 # 开头的注释行。
+
+    Yields:
+        tuple: (位置, 操作)，位置为 JSONL 的行号或 YAML 中操作的序号
+    """
+    if path.endswith(('.yaml', '.yml')):
+        yield from _read_yaml(path)
+        return
+
+    stream = sys.stdin if path == '-' else open(path, encoding='utf-8')
+    try:
+        for line_number, line in enumerate(stream, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"第 {line_number} 行不是有效的 JSON：{e}")
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+def _read_yaml(path):
+    try:
+        import yaml
+    except ImportError:
+        raise ValueError("读取 YAML 需要安装 PyYAML")
+    with open(path, encoding='utf-8') as f:
+        try:
+            documents = list(yaml.safe_load_all(f))
+        except yaml.YAMLError as e:
+            raise ValueError(f"YAML 格式错误：{e}")
+    position = 0
+    for document in documents:
+        if document is None:
+            continue
+        for operation in (document if isinstance(document, list) else [document]):
+            position += 1
+            yield position, operation
+
+def _required(operation, *names):
+    """取出必填字段，缺少时抛出 ValueError"""
+    missing = [name for name in names if operation.get(name) in (None, '')]
+    if missing:
+        raise ValueError(f"缺少字段：{', '.join(missing)}")
+    return [operation[name] for name in names]
+
+def _number(value, name):
+    if isinstance(value, bool):
+        raise ValueError(f"{name} 必须是数字")
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} 必须是数字")
+
+def _date(value, name):
+    try:
+        datetime.strptime(str(value), '%Y-%m-%d')
+    except ValueError:
+        raise ValueError(f"{name} 格式应为 YYYY-MM-DD")
+    return str(value)
+
+def _flag(value, name):
+    if not isinstance(value, bool):
+        raise ValueError(f"{name} 必须是 true 或 false")
+    return value
+
+class BatchPlanner:
+    """对照维度数据逐条校验操作并生成变更计划
+
+    员工、类别和全局设置在创建时从跟踪器的维度缓存读取一次，之后的校验只查内存；
+    切换状态、修改设置的操作同时更新这份副本，使后续操作按变更后的状态校验。
+    """
+
+    def __init__(self, tracker, record_date=None):
+        """初始化校验器
+
+        Args:
+            tracker: PerformanceTracker 实例
+            record_date: 未指定 date 的表现记录使用的日期，默认为当天
+        """
+        self.tracker = tracker
+        self.record_date = record_date or datetime.now().strftime('%Y-%m-%d')
+        employees = tracker.dimensions.employees()
+        # 员工ID -> [姓名, 是否激活]；类别名称 -> [类别ID, 是否启用]
+        self.employees = {row[0]: [row[1], bool(row[12])] for row in employees}
+        self.accounts = {row[2]: row[0] for row in employees if row[2]}
+        self.categories = {row[1]: [row[0], bool(row[3])] for row in tracker.dimensions.categories()}
+        self.settings = tracker.get_settings()._asdict()
+        # 已关闭周期的 (开始日期, 结束日期)，周期内不能再写入记录
+        self.closed_cycles = tracker.db.connection().execute(
+            "SELECT start_date, end_date FROM cycle_snapshots"
+        ).fetchall()
+        # (年份, 周) -> 该周已有工作量记录的员工ID
+        self.weeks = {}
+        self.steps = []
+        self.errors = []
+
+    def add(self, position, operation):
+        """校验一个操作，通过时追加到变更计划，否则记录 (位置, 原因)"""
+        try:
+            if not isinstance(operation, dict):
+                raise ValueError("操作必须是对象")
+            op = operation.get('op')
+            if op not in BATCH_OPERATIONS:
+                raise ValueError(f"未知的操作类型：{op}")
+            self.steps.extend(getattr(self, f'_plan_{op}')(operation))
+        except ValueError as e:
+            self.errors.append((position, str(e)))
+
+    def _employee(self, ref, active=True):
+        """按ID（整数）或域账号（字符串）解析员工
+
+        由数字组成的字符串先按域账号查找，没有该域账号时按员工ID查找
+        （scores 的键在 JSON 中总是字符串）。
+        """
+        if isinstance(ref, int) and not isinstance(ref, bool):
+            employee_id = ref
+        elif isinstance(ref, str):
+            employee_id = self.accounts.get(ref)
+            if employee_id is None and ref.isascii() and ref.isdigit():
+                employee_id = int(ref)
+        else:
+            employee_id = None
+        if employee_id not in self.employees:
+            raise ValueError(f"员工 {ref} 不存在")
+        if active and not self.employees[employee_id][1]:
+            raise ValueError(f"员工 {ref} 未激活")
+        return employee_id
+
+    def _category(self, name):
+        if name not in self.categories or not self.categories[name][1]:
+            raise ValueError(f"类别 '{name}' 不存在或未启用")
+        return self.categories[name][0]
+
+    def _check_cycle_open(self, day):
+        for start_date, end_date in self.closed_cycles:
+            if start_date <= day <= end_date:
+                raise ValueError(f"绩效周期 {start_date} 至 {end_date} 已关闭，不能再添加该周期内的记录")
+
+    def _records(self, category, description, employee_scores, record_date):
+        self._check_cycle_open(record_date)
+        return [
+            BatchStep(
+                'record',
+                (employee_id, self.categories[category][0], description, score, record_date),
+                [f"+ 表现记录 {self.employees[employee_id][0]} {category} {score:+.2f} {record_date} {description}"],
+            )
+            for employee_id, score in employee_scores
+        ]
+
+    def _plan_record(self, operation):
+        employee, category, score, description = _required(operation, 'employee', 'category', 'score', 'description')
+        employee_id = self._employee(employee)
+        self._category(category)
+        record_date = _date(operation.get('date') or self.record_date, 'date')
+        return self._records(category, str(description), [(employee_id, _number(score, 'score'))], record_date)
+
+    def _plan_event(self, operation):
+        category, description = _required(operation, 'category', 'description')
+        self._category(category)
+        record_date = _date(operation.get('date') or self.record_date, 'date')
+        if isinstance(operation.get('scores'), dict):
+            employee_scores = [
+                (self._employee(employee), _number(score, f'{employee} 的分值'))
+                for employee, score in operation['scores'].items()
+            ]
+        else:
+            employees, score = _required(operation, 'employees', 'score')
+            if not isinstance(employees, list):
+                raise ValueError("employees 必须是列表")
+            score = _number(score, 'score')
+            employee_scores = [(self._employee(employee), score) for employee in employees]
+        if not employee_scores:
+            raise ValueError("没有指定员工")
+        if len({employee_id for employee_id, _ in employee_scores}) != len(employee_scores):
+            raise ValueError("员工重复")
+        return self._records(category, str(description), employee_scores, record_date)
+
+    def _plan_workload(self, operation):
+        year, week, employees = _required(operation, 'year', 'week', 'employees')
+        try:
+            year, week = int(year), int(week)
+            thursday = date.fromisocalendar(year, week, 4).isoformat()
+        except (TypeError, ValueError):
+            raise ValueError(f"{year} 年没有第 {week} 周")
+        self._check_cycle_open(thursday)
+        if not isinstance(employees, list) or not employees:
+            raise ValueError("employees 必须是非空列表")
+        employee_ids = [self._employee(employee) for employee in employees]
+        if len(set(employee_ids)) != len(employee_ids):
+            raise ValueError("员工重复")
+        description = str(operation.get('description') or f'{year}年第{week}周工作量评分')
+
+        existing = self.weeks.get((year, week))
+        if existing is None:
+            existing = {
+                row[0] for row in self.tracker.db.connection().execute(
+                    "SELECT employee_id FROM workload_scores WHERE year = ? AND week_number = ?",
+                    (year, week)
+                )
+            }
+        label = f"{year}年第{week}周"
+        changes = [
+            f"{'~' if employee_id in existing else '+'} 工作量 {label} {self.employees[employee_id][0]} "
+            f"{ranking_percentage:.2f}% {score:+.2f}"
+            for employee_id, ranking_percentage, score in rank_workload_scores(employee_ids)
+        ]
+        changes += [
+            f"- 工作量 {label} {self.employees[employee_id][0]}"
+            for employee_id in sorted(existing - set(employee_ids))
+        ]
+        self.weeks[(year, week)] = set(employee_ids)
+        return [BatchStep('workload', (week, year, employee_ids, description), changes)]
+
+    def _plan_toggle(self, operation):
+        active = _flag(operation.get('active'), 'active')
+        if ('employee' in operation) == ('category' in operation):
+            raise ValueError("需要指定 employee 或 category 其中之一")
+        if 'employee' in operation:
+            employee_id = self._employee(operation['employee'], active=False)
+            name, current = self.employees[employee_id]
+            if current == active:
+                return []
+            self.employees[employee_id][1] = active
+            states = ('禁用', '激活')
+            return [BatchStep('employee', (employee_id, active),
+                              [f"~ 员工 {name}: {states[current]} -> {states[active]}"])]
+
+        name = operation['category']
+        if name not in self.categories:
+            raise ValueError(f"类别 '{name}' 不存在")
+        current = self.categories[name][1]
+        if current == active:
+            return []
+        self.categories[name][1] = active
+        states = ('禁用', '启用')
+        return [BatchStep('category', (name, active), [f"~ 类别 {name}: {states[current]} -> {states[active]}"])]
+
+    def _plan_setting(self, operation):
+        key, value = _required(operation, 'key', 'value')
+        if key not in BATCH_SETTINGS:
+            raise ValueError(f"不支持的设置：{key}")
+        description, choices = BATCH_SETTINGS[key]
+        value = str(value)
+        if choices is not None and value not in choices:
+            raise ValueError(f"{key} 的取值应为 {'/'.join(choices)}")
+        if self.settings.get(key) == value:
+            return []
+        change = f"~ 设置 {key}: {self.settings.get(key) or '未设置'} -> {value}"
+        self.settings[key] = value
+        return [BatchStep('setting', (key, value, description), [change])]
+
+    def _plan_rule(self, operation):
+        category, weight, description = _required(operation, 'category', 'weight', 'description')
+        weight = _number(weight, 'weight')
+        effective_date = _date(operation.get('effective_date') or self.record_date, 'effective_date')
+        return [BatchStep('rule', (str(category), weight, str(description), effective_date),
+                          [f"~ 评分规则 {category}（{effective_date} 起）: 权重 {weight:g}"])]
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""员工、表现类别与全局设置的进程内维度缓存
+
+员工表和类别表很小但被频繁查询，缓存整表后按 ID、名称、域账号建立映射；
+全局设置缓存为一个 Settings 快照。
+跟踪器自身的写操作会主动使缓存失效；其他进程或连接的修改通过
+PRAGMA data_version 的变化检测，下次访问时重新加载。
+data_version 是每个连接各自的计数，而每个线程使用自己的连接，
+因此各线程分别记录自己的连接上次看到的值。
+"""
+
+import threading
+from typing import NamedTuple, Optional
+
+
+class Settings(NamedTuple):
+    """全局设置快照，未设置的项为 None"""
+    performance_cycle: Optional[str] = None
+    default_department: Optional[str] = None
+    storage_profile: Optional[str] = None
+
+
+class DimensionCache:
+    def __init__(self, db):
+        """初始化维度缓存
+
+        Args:
+            db: PerformanceDB 实例
+        """
+        self.db = db
+        # 各线程记录 (连接, 上次看到的 data_version)
+        self._seen = threading.local()
+        self._employees = None
+        self._categories = None
+        self._settings = None
+
+    def invalidate(self, employees=True, categories=True, settings=True):
+        """使缓存失效，下次访问时重新加载
+
+        Args:
+            employees: 是否使员工缓存失效
+            categories: 是否使类别缓存失效
+            settings: 是否使全局设置缓存失效
+        """
+        if employees:
+            self._employees = None
+        if categories:
+            self._categories = None
+        if settings:
+            self._settings = None
+
+    def _check_data_version(self):
+        """其他连接提交修改后当前线程连接的 data_version 会变化，此时丢弃全部缓存
+
+        当前线程第一次检查（或数据库重新连接后）时无法判断缓存是否过期，同样丢弃。
+        """
+        conn = self.db.connection()
+        version = conn.execute("PRAGMA data_version").fetchone()[0]
+        seen = getattr(self._seen, 'version', None)
+        if seen is None or seen[0] is not conn or seen[1] != version:
+            self._seen.version = (conn, version)
+            self.invalidate()
+
+    def _load_employees(self):
+        self._check_data_version()
+        if self._employees is None:
+            rows = self.db.connection().execute("""
+                SELECT
+                    id,
+                    name,
+                    domain_account,
+                    gender,
+                    hometown,
+                    university,
+                    major,
+                    phone,
+                    id_card,
+                    department,
+                    position,
+                    join_date,
+                    is_active,
+                    created_at
+                FROM employees
+                ORDER BY position, name
+            """).fetchall()
+            self._employees = {
+                'rows': rows,
+                'by_id': {row[0]: row for row in rows},
+                'by_account': {row[2]: row[0] for row in rows if row[2]},
+            }
+        return self._employees
+
+    def _load_categories(self):
+        self._check_data_version()
+        if self._categories is None:
+            rows = self.db.connection().execute("""
+                SELECT
+                    id,
+                    name,
+                    description,
+                    is_active,
+                    created_at
+                FROM performance_categories
+                ORDER BY id
+            """).fetchall()
+            self._categories = {
+                'rows': rows,
+                'by_id': {row[0]: row for row in rows},
+                'by_name': {row[1]: row[0] for row in rows},
+            }
+        return self._categories
+
+    def settings(self):
+        """全局设置快照"""
+        self._check_data_version()
+        if self._settings is None:
+            rows = self.db.connection().execute(
+                "SELECT key, value FROM global_settings WHERE key IN (?, ?, ?)", Settings._fields
+            ).fetchall()
+            self._settings = Settings(**dict(rows))
+        return self._settings
+
+    def employees(self):
+        """所有员工，按职级和姓名排序"""
+        return self._load_employees()['rows']
+
+    def employee(self, employee_id):
+        """按ID获取员工，不存在时返回 None"""
+        return self._load_employees()['by_id'].get(employee_id)
+
+    def employee_id_by_account(self, domain_account):
+        """按域账号获取员工ID，不存在时返回 None"""
+        return self._load_employees()['by_account'].get(domain_account)
+
+    def categories(self):
+        """所有表现类别，按ID排序"""
+        return self._load_categories()['rows']
+
+    def category(self, category_id):
+        """按ID获取表现类别，不存在时返回 None"""
+        return self._load_categories()['by_id'].get(category_id)
+
+    def category_id(self, name):
+        """按名称获取表现类别ID，不存在时返回 None"""
+        return self._load_categories()['by_name'].get(name)
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""导入导出的数据集和格式
+
+命令行定义参数时就要用到这些取值；它们单独放在不依赖 pandas 的模块中，
+perf import/export 只显示帮助时不必加载 pandas。
+"""
+
+IMPORT_DATASETS = ('employees', 'records', 'workload')
+
+EXPORT_FORMATS = ('csv', 'ndjson', 'parquet')
+
+# records、workload、employees 的查询见 export.EXPORT_QUERIES，summary 为周期统计
+EXPORT_DATASETS = ('records', 'workload', 'employees', 'summary')
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""数据导出
+
+表现记录、工作量记录和员工信息通过 pandas 分块游标读取（每块一个 DataFrame），
+逐块写入 CSV、NDJSON 或 Parquet，内存占用与表大小无关。
+增量导出以自增 ID 或 created_at 为水位线，只导出上次之后新增的行：
+原地修改的行（修改表现记录、修改员工信息、激活/禁用员工）ID 和 created_at 不变，不会再次导出，
+需要同步修改时应重新全量导出。工作量按周整体替换时删除后重新插入，新的行会被增量导出，
+但被替换掉的旧行不会体现在增量中。
+"""
+
+import pandas as pd
+
+from .datasets import EXPORT_DATASETS, EXPORT_FORMATS
+
+# 各数据集的查询，{where} 处插入增量条件；按 ID 升序导出，最后一行的 ID 即下次增量的起点
+EXPORT_QUERIES = {
+    'records': """
+        SELECT
+            pr.id,
+            pr.employee_id,
+            e.domain_account,
+            e.name AS employee_name,
+            pc.name AS category,
+            pr.score,
+            pr.description,
+            pr.record_date,
+            pr.created_at
+        FROM performance_records pr
+        LEFT JOIN employees e ON pr.employee_id = e.id
+        LEFT JOIN performance_categories pc ON pr.category_id = pc.id
+        {where}
+        ORDER BY pr.id
+    """,
+    'workload': """
+        SELECT
+            ws.id,
+            ws.employee_id,
+            e.domain_account,
+            e.name AS employee_name,
+            ws.year,
+            ws.week_number,
+            ws.week_start,
+            ws.ranking_percentage,
+            ws.score,
+            ws.description,
+            ws.created_at
+        FROM workload_scores ws
+        LEFT JOIN employees e ON ws.employee_id = e.id
+        {where}
+        ORDER BY ws.id
+    """,
+    'employees': """
+        SELECT
+            id,
+            name,
+            domain_account,
+            gender,
+            hometown,
+            university,
+            major,
+            phone,
+            id_card,
+            department,
+            position,
+            join_date,
+            is_active,
+            created_at
+        FROM employees
+        {where}
+        ORDER BY id
+    """,
+}
+
+# 增量条件使用的表别名
+EXPORT_ALIASES = {'records': 'pr.', 'workload': 'ws.', 'employees': ''}
+
+
+def since_condition(dataset, since):
+    """构造增量导出条件
+
+    Args:
+        dataset: 数据集名称
+        since: 整数（或纯数字字符串）表示导出 ID 大于该值的行，
+               其他字符串表示导出 created_at 晚于该时间的行；两者都只反映新增的行，不反映原地修改
+
+    Returns:
+        tuple: (WHERE 子句, 参数列表)
+    """
+    if since is None:
+        return '', []
+    alias = EXPORT_ALIASES[dataset]
+    if isinstance(since, int) or str(since).isdigit():
+        return f'WHERE {alias}id > ?', [int(since)]
+    return f'WHERE {alias}created_at > ?', [str(since)]
+
+
+def read_chunks(conn, dataset, since=None, chunk_size=50000):
+    """分块读取数据集
+
+    没有数据时仍生成一个只有列名的空块，CSV 因此总会写出表头
+    （部分 pandas 版本分块读取空结果时不生成任何块）。
+
+    Yields:
+        DataFrame: 每块最多 chunk_size 行
+    """
+    where, params = since_condition(dataset, since)
+    sql = EXPORT_QUERIES[dataset].format(where=where)
+    empty = True
+    for frame in pd.read_sql_query(sql, conn, params=params, chunksize=chunk_size):
+        empty = False
+        yield frame
+    if empty:
+        cursor = conn.execute(f"SELECT * FROM ({sql}) LIMIT 0", params)
+        yield pd.DataFrame(columns=[column[0] for column in cursor.description])
+
+
+def write_chunks(frames, fmt, output):
+    """将 DataFrame 块逐个写入输出
+
+    Args:
+        frames: DataFrame 迭代器，列结构一致
+        fmt: csv、ndjson 或 parquet
+        output: 文件路径或文本文件对象（parquet 只支持文件路径）
+
+    Returns:
+        tuple: (写入的行数, 最后一行的 id 列值；没有 id 列或没有数据时为 None)
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"不支持的导出格式：{fmt}")
+    if fmt == 'parquet':
+        return _write_parquet(frames, output)
+
+    if isinstance(output, str):
+        with open(output, 'w', encoding='utf-8', newline='') as stream:
+            return write_chunks(frames, fmt, stream)
+
+    rows, last_id = 0, None
+    for i, frame in enumerate(frames):
+        if fmt == 'csv':
+            frame.to_csv(output, header=(i == 0), index=False)
+        elif len(frame):
+            text = frame.to_json(orient='records', lines=True, force_ascii=False)
+            output.write(text if text.endswith('\n') else text + '\n')
+        rows += len(frame)
+        if len(frame) and 'id' in frame.columns:
+            last_id = int(frame['id'].iloc[-1])
+    return rows, last_id
+
+
+def _write_parquet(frames, output):
+    """逐块写入 Parquet，需要安装 pyarrow"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError("导出 Parquet 需要安装 pyarrow")
+    if not isinstance(output, str):
+        raise ValueError("导出 Parquet 需要指定输出文件")
+
+    writer, rows, last_id = None, 0, None
+    try:
+        for frame in frames:
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(output, table.schema)
+            else:
+                # 某一块中全为空值的列推断不出类型，按第一块的结构转换
+                table = table.cast(writer.schema)
+            writer.write_table(table)
+            rows += len(frame)
+            if len(frame) and 'id' in frame.columns:
+                last_id = int(frame['id'].iloc[-1])
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows, last_id
+
+
+def summary_frame(scores):
+    """将周期得分转换为一个 DataFrame（每名员工一行，按总分降序）"""
+    order = scores.order
+    frame = pd.DataFrame({
+        'employee_id': scores.employee_ids[order],
+        'name': [scores.names[i] for i in order],
+        'department': [scores.departments[i] for i in order],
+        'workload': scores.workload[order],
+    })
+    for j, category in enumerate(scores.categories):
+        frame[category] = scores.matrix[order, j]
+    frame['total'] = scores.totals[order]
+    frame['rank'] = scores.ranks[order]
+    frame['percentile'] = scores.percentiles[order]
+    frame.insert(0, 'start_date', scores.start_date)
+    frame.insert(1, 'end_date', scores.end_date)
+    return frame
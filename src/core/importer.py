@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""批量导入
+
+从 CSV、JSONL 或 Excel 文件导入员工、表现记录和每周工作量排名。
+文件按块读取为 DataFrame，整块做向量化校验（重复的域账号、电话、身份证号，
+不存在或未启用的类别，不存在或未激活的员工，分值和日期格式），
+通过校验的行在每块一个事务中用 executemany 写入，未通过的行连同原因写入拒绝文件。
+"""
+
+import os
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from .datasets import IMPORT_DATASETS
+
+EMPLOYEE_COLUMNS = (
+    'name', 'domain_account', 'gender', 'hometown', 'university', 'major',
+    'phone', 'id_card', 'department', 'position', 'join_date',
+)
+
+# 各数据集必须包含的列；表现记录和工作量可用 domain_account 或 employee_id 指定员工
+REQUIRED_COLUMNS = {
+    'employees': ('name', 'domain_account'),
+    'records': ('category', 'score'),
+    'workload': ('year', 'week', 'rank'),
+}
+
+EMPLOYEE_INSERT_SQL = """
+    INSERT INTO employees
+        (name, domain_account, gender, hometown, university, major, phone, id_card, department, position, join_date)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+RECORD_INSERT_SQL = (
+    "INSERT INTO performance_records (employee_id, category_id, description, score, record_date) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+
+# 一块记录按 (月份, 员工, 类别) 合并后的增量写入汇总表
+CATEGORY_AGGREGATE_MERGE_SQL = """
+    INSERT INTO category_score_aggregates (period, employee_id, category_id, total_score, record_count)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT (period, employee_id, category_id) DO UPDATE SET
+        total_score = total_score + excluded.total_score,
+        record_count = record_count + excluded.record_count
+"""
+
+# 打开或关闭批量写入开关：打开时表现记录的插入触发器跳过逐行同步（见迁移 _bulk_write_guard）
+BULK_WRITE_GUARD_SQL = "UPDATE bulk_write_guard SET active = ? WHERE id = 1"
+
+# 为新写入的记录建立全文索引
+RECORD_FTS_SYNC_SQL = """
+    INSERT INTO performance_records_fts (rowid, description)
+    SELECT id, description FROM performance_records WHERE id > ?
+"""
+
+
+def read_frames(path, chunk_size=50000):
+    """按块读取导入文件，所有值读取为去除首尾空白的字符串，空值为空字符串
+
+    文件格式按扩展名判断：.csv、.jsonl/.ndjson、.xlsx/.xls。
+
+    Args:
+        path: 文件路径
+        chunk_size: 每块的行数，None 表示整个文件作为一块
+
+    Yields:
+        DataFrame: 每块最多 chunk_size 行，索引为文件中的数据行号（从 1 开始）
+    """
+    ext = os.path.splitext(str(path))[1].lower()
+    if ext == '.csv':
+        frames = pd.read_csv(path, dtype=str, keep_default_na=False, chunksize=chunk_size, encoding='utf-8-sig')
+    elif ext in ('.jsonl', '.ndjson'):
+        frames = pd.read_json(path, lines=True, dtype=False, chunksize=chunk_size, encoding='utf-8')
+    elif ext in ('.xlsx', '.xls'):
+        frames = _read_excel(path, chunk_size)
+    else:
+        raise ValueError(f"不支持的文件格式：{ext or path}，可选 .csv、.jsonl、.xlsx")
+    if chunk_size is None:
+        frames = [frames]
+
+    start = 1
+    for frame in frames:
+        frame = frame.astype(object).where(frame.notna(), '')
+        frame = frame.apply(lambda column: column.astype(str).str.strip())
+        frame.columns = [str(column).strip() for column in frame.columns]
+        frame.index = pd.RangeIndex(start, start + len(frame))
+        start += len(frame)
+        yield frame
+
+
+def _read_excel(path, chunk_size):
+    """Excel 无法流式读取，整表读入后按块切分，需要安装 openpyxl（.xls 需要 xlrd）"""
+    try:
+        frame = pd.read_excel(path, dtype=str, keep_default_na=False)
+    except ImportError as e:
+        raise ValueError(f"读取 Excel 需要安装相应的依赖：{e}")
+    if chunk_size is None:
+        return frame
+    return (frame.iloc[start:start + chunk_size] for start in range(0, len(frame), chunk_size))
+
+
+def check_columns(dataset, frame):
+    """检查文件是否包含数据集必须的列"""
+    missing = [column for column in REQUIRED_COLUMNS[dataset] if column not in frame.columns]
+    if dataset != 'employees' and 'domain_account' not in frame.columns and 'employee_id' not in frame.columns:
+        missing.append('domain_account 或 employee_id')
+    if missing:
+        raise ValueError(f"缺少必需的列：{', '.join(missing)}")
+
+
+def _column(frame, name):
+    """取一列，文件中没有该列时视为全部为空"""
+    if name in frame.columns:
+        return frame[name]
+    return pd.Series('', index=frame.index, dtype=object)
+
+
+def _reject(reasons, mask, reason):
+    """为尚无拒绝原因且满足 mask 的行记录原因（每行只保留第一个原因）"""
+    reasons[mask & (reasons == '')] = reason
+
+
+def _in_closed_cycles(days, closed_cycles):
+    """日期（YYYY-MM-DD）落在已关闭绩效周期内的行；已关闭周期的统计只读取快照，不能再写入"""
+    mask = pd.Series(False, index=days.index)
+    for start_date, end_date in closed_cycles:
+        mask |= (days >= start_date) & (days <= end_date)
+    return mask
+
+
+def _iso_thursday(year, week):
+    """ISO 周的周四日期，工作量按周四所在的日期归属周期；年份或周数无效时返回空字符串"""
+    try:
+        return date.fromisocalendar(int(year), int(week), 4).isoformat()
+    except (TypeError, ValueError, OverflowError):
+        return ''
+
+
+def _valid_dates(column):
+    """YYYY-MM-DD 格式且为有效日期"""
+    return pd.to_datetime(column, format='%Y-%m-%d', errors='coerce').notna()
+
+
+def validate_employees(frame, existing, default_department=None):
+    """校验员工数据
+
+    Args:
+        frame: read_frames 读取的一块数据
+        existing: 已使用的值，{'domain_account': set, 'phone': set, 'id_card': set}；
+                  通过校验的行的值会加入其中，以发现跨块的重复
+        default_department: 部门为空时使用的默认部门
+
+    Returns:
+        tuple: (待写入的行列表, 拒绝原因 Series；空字符串表示通过)
+    """
+    data = pd.DataFrame({column: _column(frame, column) for column in EMPLOYEE_COLUMNS})
+    if default_department:
+        data.loc[data['department'] == '', 'department'] = default_department
+
+    reasons = pd.Series('', index=frame.index, dtype=object)
+    _reject(reasons, data['name'] == '', '姓名为空')
+    _reject(reasons, data['domain_account'] == '', '域账号为空')
+    _reject(reasons, (data['join_date'] != '') & ~_valid_dates(data['join_date']), '入职日期格式错误，应为 YYYY-MM-DD')
+    for column, label in (('domain_account', '域账号'), ('phone', '电话'), ('id_card', '身份证号')):
+        values = data[column]
+        filled = values != ''
+        _reject(reasons, filled & values.isin(existing[column]), f'{label}已存在')
+        _reject(reasons, filled & values.duplicated(), f'{label}在文件中重复')
+
+    valid = data[reasons == '']
+    for column in ('domain_account', 'phone', 'id_card'):
+        existing[column].update(value for value in valid[column] if value)
+    # 电话和身份证号为空时写入 NULL，唯一约束不限制多个 NULL
+    valid = valid.replace({'phone': {'': None}, 'id_card': {'': None}})
+    return list(valid.itertuples(index=False, name=None)), reasons
+
+
+def resolve_employees(frame, accounts, active):
+    """将 domain_account 或 employee_id 列解析为员工ID
+
+    Args:
+        accounts: {域账号: 员工ID}
+        active: {员工ID: 是否激活}
+
+    Returns:
+        tuple: (员工ID Series，无法解析时为 0, 拒绝原因 Series)
+    """
+    reasons = pd.Series('', index=frame.index, dtype=object)
+    if 'domain_account' in frame.columns:
+        employee_ids = frame['domain_account'].map(accounts)
+    else:
+        employee_ids = pd.to_numeric(frame['employee_id'], errors='coerce')
+    employee_ids = employee_ids.fillna(0).astype(np.int64)
+    status = employee_ids.map(active)
+    _reject(reasons, status.isna(), '员工不存在')
+    _reject(reasons, status == False, '员工未激活')  # noqa: E712
+    return employee_ids, reasons
+
+
+def validate_records(frame, accounts, active, categories, record_date, closed_cycles=()):
+    """校验表现记录
+
+    Args:
+        accounts: {域账号: 员工ID}
+        active: {员工ID: 是否激活}
+        categories: {类别名称: (类别ID, 是否启用)}
+        record_date: record_date 列为空时使用的日期
+        closed_cycles: 已关闭周期的 (开始日期, 结束日期)，日期在其中的记录拒绝写入
+
+    Returns:
+        tuple: (待写入的行列表, 拒绝原因 Series)
+    """
+    employee_ids, reasons = resolve_employees(frame, accounts, active)
+
+    category = frame['category']
+    category_ids = category.map({name: category_id for name, (category_id, _) in categories.items()})
+    enabled = category.map({name: bool(is_active) for name, (_, is_active) in categories.items()})
+    _reject(reasons, category_ids.isna(), '类别不存在')
+    _reject(reasons, enabled == False, '类别未启用')  # noqa: E712
+
+    scores = pd.to_numeric(frame['score'], errors='coerce')
+    _reject(reasons, scores.isna(), '分值不是数字')
+
+    dates = _column(frame, 'record_date').replace('', record_date)
+    _reject(reasons, ~_valid_dates(dates), '记录日期格式错误，应为 YYYY-MM-DD')
+    _reject(reasons, _in_closed_cycles(dates, closed_cycles), '记录日期所在的绩效周期已关闭')
+
+    ok = reasons == ''
+    rows = list(zip(
+        employee_ids[ok].tolist(),
+        category_ids[ok].astype(np.int64).tolist(),
+        _column(frame, 'description')[ok].tolist(),
+        scores[ok].tolist(),
+        dates[ok].tolist(),
+    ))
+    return rows, reasons
+
+
+def insert_records(conn, rows):
+    """写入一块表现记录并同步更新汇总表和全文索引
+
+    逐行触发的汇总表更新和全文索引写入是大批量写入的主要开销：这里在同一事务中打开批量写入开关，
+    插入触发器随之跳过逐行同步；写入明细后整块合并更新汇总表、整块建立全文索引，再关闭开关。
+    开关的修改同样受事务保护，其他连接看不到打开的状态，出错回滚时开关随之恢复。
+
+    Args:
+        conn: 数据库连接（调用方负责事务）
+        rows: validate_records 返回的行
+    """
+    if not rows:
+        return
+    frame = pd.DataFrame(rows, columns=['employee_id', 'category_id', 'description', 'score', 'record_date'])
+    frame['period'] = frame['record_date'].str.slice(0, 7)
+    deltas = (frame.groupby(['period', 'employee_id', 'category_id'])['score']
+              .agg(['sum', 'size']).reset_index())
+    conn.executemany(CATEGORY_AGGREGATE_MERGE_SQL, deltas.itertuples(index=False, name=None))
+    last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM performance_records").fetchone()[0]
+    conn.execute(BULK_WRITE_GUARD_SQL, (1,))
+    conn.executemany(RECORD_INSERT_SQL, rows)
+    conn.execute(RECORD_FTS_SYNC_SQL, (last_id,))
+    conn.execute(BULK_WRITE_GUARD_SQL, (0,))
+
+
+def validate_workload(frame, accounts, active, closed_cycles=()):
+    """校验每周工作量排名，并按周计算排名百分比和得分
+
+    每个 (year, week) 为一周完整的排名，rank 越小工作量越多；
+    得分规则与 work add 相同（见 rank_workload_scores）。
+    周四落在已关闭周期（closed_cycles 中的 (开始日期, 结束日期)）内的周整周拒绝，不替换原有排名。
+
+    Returns:
+        tuple: (待写入的行列表，每项为 (员工ID, 周数, 年份, 排名百分比, 得分, 描述), 拒绝原因 Series)
+    """
+    employee_ids, reasons = resolve_employees(frame, accounts, active)
+
+    years = pd.to_numeric(frame['year'], errors='coerce')
+    weeks = pd.to_numeric(frame['week'], errors='coerce')
+    ranks = pd.to_numeric(frame['rank'], errors='coerce')
+    # ISO 年的最后一周即 12 月 28 日所在的周
+    last_weeks = {
+        year: date(int(year), 12, 28).isocalendar()[1]
+        for year in years.dropna().unique() if year % 1 == 0 and 1 <= year <= 9999
+    }
+    _reject(reasons, years.map(last_weeks).isna(), '年份错误')
+    _reject(reasons, (weeks % 1 != 0) | ~weeks.between(1, years.map(last_weeks)), '周数错误，该年份没有这一周')
+    _reject(reasons, ranks.isna(), '排名不是数字')
+    keys = pd.DataFrame({'year': years, 'week': weeks, 'employee_id': employee_ids})
+    _reject(reasons, keys.duplicated(), '同一周重复的员工')
+    if closed_cycles:
+        thursdays = pd.Series([_iso_thursday(*key) for key in zip(years, weeks)], index=frame.index)
+        _reject(reasons, _in_closed_cycles(thursdays, closed_cycles), '该周所在的绩效周期已关闭')
+
+    ok = reasons == ''
+    data = pd.DataFrame({
+        'employee_id': employee_ids[ok],
+        'week': weeks[ok].astype(np.int64),
+        'year': years[ok].astype(np.int64),
+        'rank': ranks[ok],
+        'description': _column(frame, 'description')[ok],
+    })
+    data = data.sort_values(['year', 'week', 'rank'], kind='stable')
+    groups = data.groupby(['year', 'week'], sort=False)
+    position = groups.cumcount().to_numpy()
+    total = groups['employee_id'].transform('size').to_numpy()
+    cutoff = (total * 0.3).astype(np.int64)
+    data['ranking_percentage'] = position / total * 100
+    data['score'] = np.select([position < cutoff, position < 2 * cutoff], [10, 8], 7)
+    default = data['year'].astype(str) + '年第' + data['week'].astype(str) + '周工作量评分'
+    data['description'] = data['description'].where(data['description'] != '', default)
+
+    rows = list(data[['employee_id', 'week', 'year', 'ranking_percentage', 'score', 'description']]
+                .itertuples(index=False, name=None))
+    return rows, reasons
+
+
+def write_rejects(stream, frame, reasons, header):
+    """将未通过校验的行写入拒绝文件（CSV），附加 row（文件中的数据行号）和 reason 列
+
+    Returns:
+        int: 写入的行数
+    """
+    rejected = reasons != ''
+    if not rejected.any():
+        return 0
+    rows = frame[rejected].copy()
+    rows.insert(0, 'row', rows.index)
+    rows['reason'] = reasons[rejected]
+    rows.to_csv(stream, header=header, index=False)
+    return len(rows)
+
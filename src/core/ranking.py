@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""周期得分查询与单个员工的排名
+
+只查询一名员工的排名时不必加载 NumPy 计算整个排行榜：在数据库中从汇总表（或明细记录）
+算出各在职员工的加权总分，名次为总分高于该员工的人数加一（并列取相同名次），
+百分位和奖金档位由同样的计数和在职人数得出。已关闭的周期直接读取快照中的总分。
+
+本模块不依赖 NumPy，scoring 模块的整周期计算共用这里的查询和档位划分。
+"""
+
+import json
+
+from ..utils.dates import cycle_week_range, month_periods
+
+# 评分规则中表示工作量得分的类别名称
+WORKLOAD_RULE_CATEGORY = '工作承担'
+
+# 各类别在指定日期生效的规则：生效日期不晚于该日期的最新版本
+# （SQLite 中与 MAX() 同时查询的列取自最大值所在的行）
+SCORING_RULES_SQL = """
+    SELECT category, weight, MAX(effective_date)
+    FROM scoring_rules
+    WHERE effective_date <= ?
+    GROUP BY category
+"""
+
+# 奖金档位：按排名先后依次为前 30%、其后 30%、其余，与工作量评分的分档方式一致
+TIER_NAMES = ('前30%', '中30%', '后40%')
+TIER_SHARES = (0.3, 0.3)
+
+# 周期按整月对齐时读取按月维护的汇总表
+WORKLOAD_AGGREGATE_SQL = """
+    SELECT employee_id, ROUND(SUM(total_score), 2)
+    FROM workload_score_aggregates
+    WHERE period BETWEEN ? AND ?
+    GROUP BY employee_id
+"""
+
+CATEGORY_AGGREGATE_SQL = """
+    SELECT employee_id, category_id, ROUND(SUM(total_score), 2)
+    FROM category_score_aggregates
+    WHERE period BETWEEN ? AND ?
+    GROUP BY employee_id, category_id
+"""
+
+# 非整月对齐的范围从明细记录计算
+WORKLOAD_DETAIL_SQL = """
+    SELECT employee_id, ROUND(SUM(score), 2)
+    FROM workload_scores
+    WHERE week_start BETWEEN ? AND ?
+    GROUP BY employee_id
+"""
+
+CATEGORY_DETAIL_SQL = """
+    SELECT employee_id, category_id, ROUND(SUM(score), 2)
+    FROM performance_records
+    WHERE record_date BETWEEN ? AND ?
+    GROUP BY employee_id, category_id
+"""
+
+# 未关闭周期各在职员工的加权总分，计算方式与 CycleScores 相同；
+# 参数依次为工作量查询、类别得分查询的参数，{类别ID: 权重} 的 JSON 和工作量权重
+CYCLE_TOTALS_SQL = """
+    WITH
+        workload(employee_id, score) AS ({workload}),
+        category_scores(employee_id, category_id, score) AS ({categories}),
+        weights(category_id, weight) AS (SELECT CAST(key AS INTEGER), value FROM json_each(?)),
+        weighted(employee_id, score) AS (
+            SELECT c.employee_id, SUM(c.score * COALESCE(w.weight, 1.0))
+            FROM category_scores c
+            LEFT JOIN weights w ON w.category_id = c.category_id
+            GROUP BY c.employee_id
+        ),
+        totals(employee_id, total) AS (
+            SELECT e.id, ROUND(COALESCE(wl.score, 0) * ? + COALESCE(wt.score, 0), 2)
+            FROM employees e
+            LEFT JOIN workload wl ON wl.employee_id = e.id
+            LEFT JOIN weighted wt ON wt.employee_id = e.id
+            WHERE e.is_active = 1
+        )
+"""
+
+# 已关闭周期的总分取自快照，参数为快照ID
+SNAPSHOT_TOTALS_SQL = """
+    WITH totals(employee_id, total) AS (
+        SELECT employee_id, total_score FROM cycle_snapshot_scores WHERE snapshot_id = ?
+    )
+"""
+
+# 员工的总分，以及总分高于、低于该员工的人数和参与排名的总人数，参数为员工ID
+STANDING_SQL = """
+    SELECT
+        own.total,
+        (SELECT COUNT(*) FROM totals WHERE total > own.total),
+        (SELECT COUNT(*) FROM totals WHERE total < own.total),
+        (SELECT COUNT(*) FROM totals)
+    FROM totals own
+    WHERE own.employee_id = ?
+"""
+
+# 按总分降序排在第 N 位（从 0 开始）的总分，参数为 N
+NTH_TOTAL_SQL = "SELECT total FROM totals ORDER BY total DESC LIMIT 1 OFFSET ?"
+
+
+def tier_cutoffs(count):
+    """各奖金档位的末位名次"""
+    cutoffs, position = [], 0
+    for share in TIER_SHARES:
+        position += int(count * share)
+        cutoffs.append(position)
+    return cutoffs
+
+
+def compile_rules(conn, as_of):
+    """读取指定日期生效的评分规则
+
+    Args:
+        conn: 数据库连接
+        as_of: 日期（YYYY-MM-DD），通常为周期结束日期
+
+    Returns:
+        dict: 类别名称到权重的映射，未设置权重的规则按 1.0 计
+    """
+    return {
+        category: 1.0 if weight is None else weight
+        for category, weight, _ in conn.execute(SCORING_RULES_SQL, (as_of,))
+    }
+
+
+def cycle_totals(conn, categories, start_date, end_date):
+    """生成计算周期内各员工总分的 WITH 子句及其参数
+
+    Args:
+        conn: 数据库连接
+        categories: 类别维度行（类别ID, 名称, ...），用于将评分规则对应到类别ID
+        start_date: 周期开始日期
+        end_date: 周期结束日期
+
+    Returns:
+        tuple: (定义 totals(employee_id, total) 的 WITH 子句, 参数列表)
+    """
+    snapshot = conn.execute(
+        "SELECT id FROM cycle_snapshots WHERE start_date = ? AND end_date = ?", (start_date, end_date)
+    ).fetchone()
+    if snapshot is not None:
+        return SNAPSHOT_TOTALS_SQL, [snapshot[0]]
+
+    periods = month_periods(start_date, end_date)
+    if periods:
+        sql = CYCLE_TOTALS_SQL.format(workload=WORKLOAD_AGGREGATE_SQL, categories=CATEGORY_AGGREGATE_SQL)
+        params = [*periods, *periods]
+    else:
+        sql = CYCLE_TOTALS_SQL.format(workload=WORKLOAD_DETAIL_SQL, categories=CATEGORY_DETAIL_SQL)
+        params = [*cycle_week_range(start_date, end_date), start_date, end_date]
+    rules = compile_rules(conn, end_date)
+    weights = {row[0]: rules.get(row[1], 1.0) for row in categories}
+    return sql, [*params, json.dumps(weights), rules.get(WORKLOAD_RULE_CATEGORY, 1.0)]
+
+
+def employee_standing(conn, categories, start_date, end_date, employee_id):
+    """在数据库中计算一名员工在周期内的位置，不计算整个排行榜
+
+    Args:
+        conn: 数据库连接
+        categories: 类别维度行
+        start_date: 周期开始日期
+        end_date: 周期结束日期
+        employee_id: 员工ID
+
+    Returns:
+        tuple: 与 CycleScores.standing 相同的 (排名, 参与排名人数, 百分位, 奖金档位, 距上一档的分差)，
+               员工不在统计范围内时返回 None
+    """
+    totals, params = cycle_totals(conn, categories, start_date, end_date)
+    row = conn.execute(totals + STANDING_SQL, [*params, employee_id]).fetchone()
+    if row is None:
+        return None
+    total, above, below, count = row
+    rank = above + 1
+    cutoffs = tier_cutoffs(count)
+    tier = sum(1 for cutoff in cutoffs if cutoff < rank)
+    gap = None
+    if tier > 0:
+        boundary = cutoffs[tier - 1]
+        if boundary > 0:
+            boundary_total = conn.execute(totals + NTH_TOTAL_SQL, [*params, boundary - 1]).fetchone()[0]
+            gap = round(boundary_total - total, 2)
+    return rank, count, below / count * 100, TIER_NAMES[tier], gap
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""向量化的周期得分计算
+
+一个周期的工作量得分和各类别得分只从数据库读取一次，装入按员工对齐的
+NumPy 数组（员工 × 类别的得分矩阵），总分、排名和百分位均以向量运算完成。
+评分规则按周期结束日期编译为权重向量，加权总分为一次矩阵向量乘法。
+"""
+
+import numpy as np
+
+from ..utils.dates import cycle_week_range, month_periods
+from .ranking import (
+    CATEGORY_AGGREGATE_SQL, CATEGORY_DETAIL_SQL, TIER_NAMES, WORKLOAD_AGGREGATE_SQL, WORKLOAD_DETAIL_SQL,
+    WORKLOAD_RULE_CATEGORY, compile_rules, tier_cutoffs,
+)
+from .snapshots import read_snapshot
+
+
+def competition_ranks(totals):
+    """按列计算并列排名（总分相同取相同名次，下一名次跳过并列人数）
+
+    Args:
+        totals: 一维总分数组，或每列为一组总分的二维数组
+
+    Returns:
+        ndarray: 与 totals 形状相同的排名数组（从 1 开始）
+    """
+    order = np.argsort(-totals, axis=0, kind='stable')
+    ordered = np.take_along_axis(totals, order, axis=0)
+    positions = np.broadcast_to(
+        np.arange(len(totals)).reshape((-1,) + (1,) * (totals.ndim - 1)), totals.shape
+    )
+    # 每段相同总分的起始位置即该段的名次
+    starts = np.ones(totals.shape, dtype=bool)
+    starts[1:] = ordered[1:] != ordered[:-1]
+    first = np.maximum.accumulate(np.where(starts, positions, 0), axis=0)
+    ranks = np.empty(totals.shape, dtype=np.int64)
+    np.put_along_axis(ranks, order, first + 1, axis=0)
+    return ranks
+
+
+def tiers_of(ranks, count):
+    """按名次计算奖金档位下标（0 为最高档）"""
+    return np.searchsorted(tier_cutoffs(count), ranks, side='left')
+
+
+class CycleScores:
+    """一个周期内所有在职员工的得分
+
+    Attributes:
+        start_date, end_date: 周期起止日期
+        employee_ids: 员工ID数组，按员工ID升序
+        names, departments: 与 employee_ids 对齐的姓名和部门列表
+        categories: 启用的类别名称列表，按名称排序
+        workload: 工作量得分数组
+        matrix: 员工 × 启用类别的得分矩阵（未加权）
+        other: 已禁用类别的加权得分合计（不单独成列，但计入总分）
+        workload_weight: 工作量得分的权重
+        weights: 与 categories 对齐的类别权重数组
+        snapshot_id: 周期已关闭时为快照ID，否则为 None
+        totals: 加权总分数组
+        order: 按总分降序排列的员工下标
+        ranks: 排名数组（并列时取相同名次）
+        percentiles: 百分位数组，即总分低于该员工的员工占比（0-100）
+        tiers: 奖金档位下标数组，对应 TIER_NAMES
+    """
+
+    def __init__(self, start_date, end_date, employee_ids, names, departments,
+                 categories, workload, matrix, other, workload_weight=1.0, weights=None,
+                 snapshot_id=None):
+        self.start_date = start_date
+        self.end_date = end_date
+        self.employee_ids = employee_ids
+        self.names = names
+        self.departments = departments
+        self.categories = categories
+        self.workload = workload
+        self.matrix = matrix
+        self.other = other
+        self.workload_weight = workload_weight
+        self.weights = np.ones(len(categories)) if weights is None else weights
+        self.snapshot_id = snapshot_id
+
+        self.totals = np.round(workload * workload_weight + matrix @ self.weights + other, 2)
+        # 稳定排序，总分相同的员工保持员工ID顺序
+        self.order = np.argsort(-self.totals, kind='stable')
+
+        count = len(self.totals)
+        ascending = np.sort(self.totals)
+        below = np.searchsorted(ascending, self.totals, side='left')
+        not_above = np.searchsorted(ascending, self.totals, side='right')
+        self.ranks = count - not_above + 1
+        self.percentiles = below / count * 100 if count else np.zeros(0)
+        self.tiers = tiers_of(self.ranks, count)
+
+    def __len__(self):
+        return len(self.employee_ids)
+
+    @property
+    def weighted(self):
+        """是否有非 1 的权重参与计算"""
+        return self.workload_weight != 1.0 or bool(np.any(self.weights != 1.0))
+
+    def index_of(self, employee_id):
+        """获取员工在数组中的下标，不在统计范围内时返回 None"""
+        i = int(np.searchsorted(self.employee_ids, employee_id))
+        if i < len(self.employee_ids) and self.employee_ids[i] == employee_id:
+            return i
+        return None
+
+    def standing(self, employee_id):
+        """获取员工在周期内的位置
+        
+        Returns:
+            tuple: (排名, 参与排名人数, 百分位, 奖金档位, 距上一档的分差)；
+                   分差为追平上一档末位总分所需的分数，已在最高档时为 None。
+                   员工不在统计范围内时返回 None
+        """
+        i = self.index_of(employee_id)
+        if i is None:
+            return None
+        count = len(self)
+        tier = int(self.tiers[i])
+        gap = None
+        if tier > 0:
+            boundary = tier_cutoffs(count)[tier - 1]
+            if boundary > 0:
+                gap = round(float(self.totals[self.order[boundary - 1]] - self.totals[i]), 2)
+        return int(self.ranks[i]), count, float(self.percentiles[i]), TIER_NAMES[tier], gap
+    
+    def simulate(self, weight_sets):
+        """在多组候选权重下重新计算总分和排名
+        
+        N 组权重组成 (类别数 × N) 的权重矩阵，与得分矩阵一次相乘得到全部候选总分。
+        候选权重中未提及的类别沿用当前规则的权重；已禁用类别的得分保持不变。
+        
+        Args:
+            weight_sets: 候选权重列表，每项为 {类别名称: 权重}，工作量使用 "工作承担"
+            
+        Returns:
+            Simulation: 模拟结果
+        """
+        columns = {name: i for i, name in enumerate(self.categories)}
+        workload_weights = np.full(len(weight_sets), self.workload_weight)
+        weights = np.repeat(self.weights[:, None], len(weight_sets), axis=1)
+        for n, weight_set in enumerate(weight_sets):
+            for name, weight in weight_set.items():
+                if name == WORKLOAD_RULE_CATEGORY:
+                    workload_weights[n] = weight
+                elif name in columns:
+                    weights[columns[name], n] = weight
+                else:
+                    raise ValueError(f"{name} 不是启用的表现类别")
+        
+        totals = np.round(
+            self.workload[:, None] * workload_weights + self.matrix @ weights + self.other[:, None], 2
+        )
+        return Simulation(self, weight_sets, workload_weights, weights, totals)
+    
+    def rows(self):
+        """按总分降序生成统计行
+
+        Returns:
+            list: 每行为 (员工ID, 姓名, 部门, 工作量得分, *各启用类别得分, 总分)
+        """
+        order = self.order
+        ids = self.employee_ids[order].tolist()
+        workload = self.workload[order].tolist()
+        matrix = self.matrix[order].tolist()
+        totals = self.totals[order].tolist()
+        names, departments = self.names, self.departments
+        return [
+            (employee_id, names[i], departments[i], workload[n], *matrix[n], totals[n])
+            for n, (i, employee_id) in enumerate(zip(order.tolist(), ids))
+        ]
+
+
+class Simulation:
+    """一个周期在 N 组候选权重下的排名
+
+    Attributes:
+        baseline: 按当前规则计算的 CycleScores
+        weight_sets: 候选权重列表
+        workload_weights: 各组的工作量权重数组（N）
+        weights: 类别 × 候选组的权重矩阵
+        totals: 员工 × 候选组的总分矩阵
+        ranks: 员工 × 候选组的排名矩阵
+        deltas: 相对当前排名的变化（正数为上升）
+        tiers: 员工 × 候选组的奖金档位下标
+    """
+
+    def __init__(self, baseline, weight_sets, workload_weights, weights, totals):
+        self.baseline = baseline
+        self.weight_sets = weight_sets
+        self.workload_weights = workload_weights
+        self.weights = weights
+        self.totals = totals
+        self.ranks = competition_ranks(totals)
+        self.deltas = baseline.ranks[:, None] - self.ranks
+        self.tiers = tiers_of(self.ranks, len(totals))
+
+    def __len__(self):
+        return len(self.weight_sets)
+
+    def changes(self, n, moved_only=True):
+        """生成第 n 组权重下的排名对比行，按模拟排名升序
+        
+        Args:
+            n: 候选组下标
+            moved_only: 只包含排名或档位发生变化的员工
+            
+        Returns:
+            list: 每行为 (员工ID, 姓名, 当前排名, 模拟排名, 排名变化, 当前档位, 模拟档位, 模拟总分)
+        """
+        baseline = self.baseline
+        ranks, deltas, tiers = self.ranks[:, n], self.deltas[:, n], self.tiers[:, n]
+        selected = np.flatnonzero((deltas != 0) | (tiers != baseline.tiers)) if moved_only else np.arange(len(ranks))
+        selected = selected[np.argsort(ranks[selected], kind='stable')]
+        return [
+            (int(baseline.employee_ids[i]), baseline.names[i], int(baseline.ranks[i]), int(ranks[i]),
+             int(deltas[i]), TIER_NAMES[baseline.tiers[i]], TIER_NAMES[tiers[i]], float(self.totals[i, n]))
+            for i in selected.tolist()
+        ]
+
+
+class ScoringEngine:
+    def __init__(self, db, dimensions):
+        """初始化得分计算引擎
+
+        Args:
+            db: PerformanceDB 实例
+            dimensions: DimensionCache 实例
+        """
+        self.db = db
+        self.dimensions = dimensions
+        # 已加载的周期，键为 (开始日期, 结束日期)，值为 (数据库状态, CycleScores)
+        self._cycles = {}
+        # 类别列布局，键为启用类别集合
+        self._layouts = {}
+
+    def _layout(self):
+        """获取启用类别的列布局，按启用类别集合缓存
+
+        Returns:
+            tuple: (按名称排序的类别名称列表, 类别ID到列序号的映射)
+        """
+        active = tuple(sorted((row[1], row[0]) for row in self.dimensions.categories() if row[3]))
+        layout = self._layouts.get(active)
+        if layout is None:
+            layout = ([name for name, _ in active], {category_id: i for i, (_, category_id) in enumerate(active)})
+            self._layouts[active] = layout
+        return layout
+
+    def load(self, start_date, end_date):
+        """加载一个周期的得分，数据库未变化时直接返回已加载的结果
+
+        已关闭的周期读取关闭时的快照，未关闭的周期从汇总表或明细记录计算。
+
+        Args:
+            start_date: 周期开始日期
+            end_date: 周期结束日期
+
+        Returns:
+            CycleScores: 周期得分
+        """
+        key = (start_date, end_date)
+        state = self.db.state_token()
+        cached = self._cycles.get(key)
+        if cached and cached[0] == state:
+            return cached[1]
+
+        with self.db.transaction() as conn:
+            # 已关闭的周期直接读取快照
+            snapshot = read_snapshot(conn, start_date, end_date)
+            if snapshot is not None:
+                scores = CycleScores(start_date, end_date, **snapshot)
+                self._cycles[key] = (state, scores)
+                return scores
+            
+            periods = month_periods(start_date, end_date)
+            if periods:
+                workload_rows = conn.execute(WORKLOAD_AGGREGATE_SQL, periods).fetchall()
+                category_rows = conn.execute(CATEGORY_AGGREGATE_SQL, periods).fetchall()
+            else:
+                workload_rows = conn.execute(WORKLOAD_DETAIL_SQL, cycle_week_range(start_date, end_date)).fetchall()
+                category_rows = conn.execute(CATEGORY_DETAIL_SQL, (start_date, end_date)).fetchall()
+            rules = compile_rules(conn, end_date)
+
+        employees = sorted(
+            (emp for emp in self.dimensions.employees() if emp[12]),
+            key=lambda emp: emp[0]
+        )
+        employee_ids = np.array([emp[0] for emp in employees], dtype=np.int64)
+        categories, columns = self._layout()
+        weights = np.array([rules.get(name, 1.0) for name in categories])
+
+        workload = np.zeros(len(employees))
+        if workload_rows:
+            ids, scores = np.array(workload_rows, dtype=float).T
+            rows, found = self._positions(employee_ids, ids)
+            workload[rows[found]] = scores[found]
+
+        matrix = np.zeros((len(employees), len(categories)))
+        other = np.zeros(len(employees))
+        if category_rows:
+            ids, category_ids, scores = np.array(category_rows, dtype=float).T
+            rows, found = self._positions(employee_ids, ids)
+            # 通过查找表将类别ID映射为列序号，禁用类别映射为 -1
+            category_ids = category_ids.astype(np.int64)
+            lookup = np.full(max(int(category_ids.max()), *columns, 0) + 1, -1, dtype=np.int64)
+            lookup[list(columns)] = list(columns.values())
+            cols = lookup[category_ids]
+            active = found & (cols >= 0)
+            np.add.at(matrix, (rows[active], cols[active]), scores[active])
+            inactive = found & (cols < 0)
+            # 禁用类别不成列，按各自的权重直接计入合计
+            category_weights = np.ones(len(lookup))
+            for row in self.dimensions.categories():
+                if row[0] < len(lookup):
+                    category_weights[row[0]] = rules.get(row[1], 1.0)
+            np.add.at(other, rows[inactive], scores[inactive] * category_weights[category_ids[inactive]])
+
+        scores = CycleScores(
+            start_date, end_date, employee_ids,
+            [emp[1] for emp in employees], [emp[9] for emp in employees],
+            categories, workload, matrix, other,
+            rules.get(WORKLOAD_RULE_CATEGORY, 1.0), weights
+        )
+        self._cycles[key] = (state, scores)
+        return scores
+
+    @staticmethod
+    def _positions(employee_ids, ids):
+        """将查询结果中的员工ID映射为数组下标
+
+        Returns:
+            tuple: (下标数组, 是否为在职员工的布尔数组)
+        """
+        ids = ids.astype(np.int64)
+        rows = np.searchsorted(employee_ids, ids)
+        rows = np.minimum(rows, max(len(employee_ids) - 1, 0))
+        found = (employee_ids[rows] == ids) if len(employee_ids) else np.zeros(len(ids), dtype=bool)
+        return rows, found
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""表现记录与工作量记录描述的全文检索
+
+两张表的 description 列各有一个 FTS5 外部内容索引（trigram 分词，适用于中文），
+由触发器与明细表同步。三个字符及以上的关键词通过索引匹配并按 bm25 相关度排序；
+trigram 无法索引更短的关键词，这些关键词以 LIKE 条件在命中结果（或日期范围内的记录）中过滤。
+"""
+
+# 未指定日期范围时使用的边界
+MIN_DATE = '0001-01-01'
+MAX_DATE = '9999-12-31'
+
+SEARCH_SOURCES = {
+    'records': {
+        'fts': 'performance_records_fts',
+        'select': """
+            SELECT
+                'records' AS source,
+                pr.id,
+                pr.record_date,
+                e.name AS employee_name,
+                e.department,
+                pc.name AS category,
+                pr.score,
+                pr.description,
+                {rank} AS rank
+        """,
+        'table': 'performance_records pr',
+        'joins': """
+            LEFT JOIN employees e ON pr.employee_id = e.id
+            LEFT JOIN performance_categories pc ON pr.category_id = pc.id
+        """,
+        'alias': 'pr',
+        'date_condition': 'pr.record_date BETWEEN ? AND ?',
+    },
+    'workload': {
+        'fts': 'workload_scores_fts',
+        'select': """
+            SELECT
+                'workload' AS source,
+                ws.id,
+                ws.week_start,
+                e.name AS employee_name,
+                e.department,
+                ws.year || '年第' || ws.week_number || '周' AS category,
+                ws.score,
+                ws.description,
+                {rank} AS rank
+        """,
+        'table': 'workload_scores ws',
+        'joins': """
+            LEFT JOIN employees e ON ws.employee_id = e.id
+        """,
+        'alias': 'ws',
+        # 工作量按周四所在日期归属周期，与绩效统计一致
+        'date_condition': "ws.week_start BETWEEN date(?, '-3 days') AND date(?, '-3 days')",
+    },
+}
+
+
+def split_terms(text):
+    """将搜索文本按空白拆分为关键词
+
+    Returns:
+        tuple: (FTS5 MATCH 表达式，没有三个字符及以上的关键词时为 None, 较短的关键词列表)
+    """
+    terms = text.split()
+    if not terms:
+        raise ValueError("搜索关键词不能为空")
+    indexed = [term for term in terms if len(term) >= 3]
+    # 每个关键词作为一个短语，双引号转义后按 AND 组合
+    match = ' '.join('"' + term.replace('"', '""') + '"' for term in indexed) or None
+    return match, [term for term in terms if len(term) < 3]
+
+
+def _like_pattern(term):
+    """将关键词转换为 LIKE 包含匹配的模式"""
+    escaped = term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f'%{escaped}%'
+
+
+def search_query(source, match, short_terms, start_date=None, end_date=None):
+    """构造单个数据源的检索语句
+
+    有 MATCH 表达式时从 FTS 索引出发再连接明细表，否则按日期范围读取明细表。
+
+    Returns:
+        tuple: (SQL, 参数列表)
+    """
+    spec = SEARCH_SOURCES[source]
+    alias = spec['alias']
+    conditions = [spec['date_condition']]
+    params = [start_date or MIN_DATE, end_date or MAX_DATE]
+    if match is not None:
+        fts = spec['fts']
+        sql = (spec['select'].format(rank=f'{fts}.rank')
+               + f"FROM {fts} JOIN {spec['table']} ON {alias}.id = {fts}.rowid" + spec['joins'])
+        conditions.insert(0, f'{fts} MATCH ?')
+        params.insert(0, match)
+    else:
+        sql = spec['select'].format(rank='NULL') + f"FROM {spec['table']}" + spec['joins']
+    for term in short_terms:
+        conditions.append(f"{alias}.description LIKE ? ESCAPE '\\'")
+        params.append(_like_pattern(term))
+    return sql + ' WHERE ' + ' AND '.join(conditions), params
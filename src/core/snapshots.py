@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""已关闭绩效周期的得分快照
+
+关闭周期时把当时计算出的排行榜、各类别得分和工作量得分写入快照表，并记录
+内容的 SHA-256 校验和。已关闭周期的查询直接读取快照，不再从明细重新计算，
+之后修改历史记录也不会改变已关闭周期的结果。
+"""
+
+import hashlib
+import json
+
+import numpy as np
+
+SNAPSHOT_BY_CYCLE_SQL = """
+    SELECT id, categories, workload_weight, weights
+    FROM cycle_snapshots
+    WHERE start_date = ? AND end_date = ?
+"""
+
+SNAPSHOT_SCORES_SQL = """
+    SELECT employee_id, name, department, workload_score, other_score, total_score, rank, percentile
+    FROM cycle_snapshot_scores
+    WHERE snapshot_id = ?
+    ORDER BY employee_id
+"""
+
+SNAPSHOT_CATEGORY_SCORES_SQL = """
+    SELECT employee_id, category, score
+    FROM cycle_snapshot_category_scores
+    WHERE snapshot_id = ?
+    ORDER BY employee_id, category
+"""
+
+
+def snapshot_checksum(start_date, end_date, categories, workload_weight, weights, score_rows, category_rows):
+    """计算快照内容的校验和
+
+    Args:
+        score_rows: 按员工ID排序的 (员工ID, 姓名, 部门, 工作量得分, 其他得分, 总分, 排名, 百分位)
+        category_rows: 按员工ID和类别排序的 (员工ID, 类别, 得分)
+
+    Returns:
+        str: 十六进制 SHA-256
+    """
+    payload = json.dumps(
+        [start_date, end_date, list(categories), workload_weight, list(weights),
+         [list(row) for row in score_rows], [list(row) for row in category_rows]],
+        ensure_ascii=False, separators=(',', ':')
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def write_snapshot(conn, scores):
+    """将周期得分写入快照表
+
+    Args:
+        conn: 数据库连接（调用方负责事务）
+        scores: CycleScores
+
+    Returns:
+        tuple: (快照ID, 校验和)
+    """
+    weights = scores.weights.tolist()
+    score_rows = [
+        (int(employee_id), scores.names[i], scores.departments[i], float(scores.workload[i]),
+         float(scores.other[i]), float(scores.totals[i]), int(scores.ranks[i]), float(scores.percentiles[i]))
+        for i, employee_id in enumerate(scores.employee_ids.tolist())
+    ]
+    # 得分为 0 的类别不保存，读取时补 0
+    rows, cols = np.nonzero(scores.matrix)
+    category_rows = sorted(
+        (int(scores.employee_ids[i]), scores.categories[j], float(scores.matrix[i, j]))
+        for i, j in zip(rows.tolist(), cols.tolist())
+    )
+    checksum = snapshot_checksum(
+        scores.start_date, scores.end_date, scores.categories, float(scores.workload_weight),
+        weights, score_rows, category_rows
+    )
+
+    cursor = conn.execute(
+        """
+        INSERT INTO cycle_snapshots (start_date, end_date, categories, workload_weight, weights, checksum)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        (scores.start_date, scores.end_date, json.dumps(scores.categories, ensure_ascii=False),
+         float(scores.workload_weight), json.dumps(weights), checksum)
+    )
+    snapshot_id = cursor.lastrowid
+    conn.executemany(
+        """
+        INSERT INTO cycle_snapshot_scores (
+            snapshot_id, employee_id, name, department, workload_score, other_score,
+            total_score, rank, percentile
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        [(snapshot_id, *row) for row in score_rows]
+    )
+    conn.executemany(
+        "INSERT INTO cycle_snapshot_category_scores (snapshot_id, employee_id, category, score) VALUES (?, ?, ?, ?)",
+        [(snapshot_id, *row) for row in category_rows]
+    )
+    return snapshot_id, checksum
+
+
+def read_snapshot(conn, start_date, end_date):
+    """读取已关闭周期的快照
+
+    Returns:
+        dict: CycleScores 的构造参数（snapshot_id、employee_ids、names、departments、categories、
+              workload、matrix、other、workload_weight、weights），周期未关闭时返回 None
+    """
+    snapshot = conn.execute(SNAPSHOT_BY_CYCLE_SQL, (start_date, end_date)).fetchone()
+    if snapshot is None:
+        return None
+    snapshot_id, categories, workload_weight, weights = snapshot
+    categories = json.loads(categories)
+
+    score_rows = conn.execute(SNAPSHOT_SCORES_SQL, (snapshot_id,)).fetchall()
+    employee_ids = [row[0] for row in score_rows]
+    matrix = np.zeros((len(score_rows), len(categories)))
+    columns = {name: j for j, name in enumerate(categories)}
+    positions = {employee_id: i for i, employee_id in enumerate(employee_ids)}
+    for employee_id, category, score in conn.execute(SNAPSHOT_CATEGORY_SCORES_SQL, (snapshot_id,)):
+        matrix[positions[employee_id], columns[category]] = score
+
+    return {
+        'snapshot_id': snapshot_id,
+        'employee_ids': np.array(employee_ids, dtype=np.int64),
+        'names': [row[1] for row in score_rows],
+        'departments': [row[2] for row in score_rows],
+        'categories': categories,
+        'workload': np.array([row[3] for row in score_rows], dtype=float),
+        'matrix': matrix,
+        'other': np.array([row[4] for row in score_rows], dtype=float),
+        'workload_weight': workload_weight,
+        'weights': np.array(json.loads(weights), dtype=float),
+    }
+
+
+def verify_snapshot(conn, snapshot_id):
+    """根据快照表中的内容重新计算校验和并与关闭时记录的值比对
+
+    Returns:
+        bool: 快照内容是否与关闭时一致，快照不存在时返回 None
+    """
+    snapshot = conn.execute(
+        "SELECT start_date, end_date, categories, workload_weight, weights, checksum FROM cycle_snapshots WHERE id = ?",
+        (snapshot_id,)
+    ).fetchone()
+    if snapshot is None:
+        return None
+    start_date, end_date, categories, workload_weight, weights, checksum = snapshot
+    score_rows = conn.execute(SNAPSHOT_SCORES_SQL, (snapshot_id,)).fetchall()
+    category_rows = conn.execute(SNAPSHOT_CATEGORY_SCORES_SQL, (snapshot_id,)).fetchall()
+    return snapshot_checksum(
+        start_date, end_date, json.loads(categories), workload_weight, json.loads(weights),
+        score_rows, category_rows
+    ) == checksum
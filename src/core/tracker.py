@@ -1,18 +1,74 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from datetime import datetime, timedelta
-import sqlite3
+from datetime import date, datetime
+from functools import partial
 from ..db.database import PerformanceDB
+from .cache import DimensionCache
+from .search import SEARCH_SOURCES, search_query, split_terms
+from ..db.migrations import CATEGORY_AGGREGATE_SOURCE_SQL, WORKLOAD_AGGREGATE_SOURCE_SQL
+from ..utils.dates import cycle_bounds, cycle_week_range, iso_week_start
+
+# 得分计算、快照、导入导出依赖 NumPy/pandas，在用到的方法中才导入，
+# 使只做简单查询的命令行调用不必承担这部分启动开销
+
+# 按 (员工, 年份, 周) 写入工作量评分，已有记录时覆盖
+WORKLOAD_UPSERT_SQL = """
+    INSERT INTO workload_scores
+        (employee_id, week_number, year, week_start, ranking_percentage, score, description)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (employee_id, year, week_number) DO UPDATE SET
+        week_start = excluded.week_start,
+        ranking_percentage = excluded.ranking_percentage,
+        score = excluded.score,
+        description = excluded.description
+"""
+
+def rank_workload_scores(employee_ids):
+    """根据工作量排名计算得分
+    
+    前 30% 得 10 分，其后 30% 得 8 分，其余得 7 分。
+    
+    Args:
+        employee_ids: 按工作量从高到低排列的员工ID列表
+        
+    Returns:
+        list: 每项为 (员工ID, 排名百分比, 得分)
+    """
+    total = len(employee_ids)
+    top_30_count = int(total * 0.3)
+    mid_30_count = int(total * 0.3)
+    
+    rankings = []
+    for i, employee_id in enumerate(employee_ids):
+        if i < top_30_count:
+            score = 10
+        elif i < top_30_count + mid_30_count:
+            score = 8
+        else:
+            score = 7
+        rankings.append((employee_id, i / total * 100, score))
+    return rankings
 
 class PerformanceTracker:
-    def __init__(self, db_path=None):
+    def __init__(self, db_path=None, profile=None):
         """初始化跟踪器
         
         Args:
             db_path: 可选的数据库路径
+            profile: 可选的存储配置名称
         """
-        self.db = PerformanceDB(db_path) if db_path else PerformanceDB()
+        self.db = PerformanceDB(db_path, profile=profile)
+        self.dimensions = DimensionCache(self.db)
+        self._scoring = None
+    
+    @property
+    def scoring(self):
+        """得分计算引擎，首次使用时创建"""
+        if self._scoring is None:
+            from .scoring import ScoringEngine
+            self._scoring = ScoringEngine(self.db, self.dimensions)
+        return self._scoring
     
     def add_employee(self, name, domain_account, gender, hometown, university, major, phone, id_card, department, position, join_date):
         """添加新员工
@@ -30,46 +86,146 @@ class PerformanceTracker:
             position: 职级
             join_date: 入职日期
         """
-        with sqlite3.connect(self.db.db_path) as conn:
+        with self.db.transaction() as conn:
             conn.execute(
                 """INSERT INTO employees 
                    (name, domain_account, gender, hometown, university, major, phone, id_card, department, position, join_date) 
                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
                 (name, domain_account, gender, hometown, university, major, phone, id_card, department, position, join_date)
             )
+            self.dimensions.invalidate(categories=False, settings=False)
+    
+    def _check_cycle_open(self, conn, day):
+        """指定日期所在的绩效周期已关闭时抛出 ValueError
+        
+        已关闭周期的统计只读取快照，之后写入的记录不会计入，因此不允许再写入。
+        工作量记录按周归属周期，传入该周周四的日期（与 cycle_week_range 的归属规则一致）。
+        """
+        closed = conn.execute(
+            "SELECT start_date, end_date FROM cycle_snapshots WHERE start_date <= ? AND end_date >= ? LIMIT 1",
+            (day, day)
+        ).fetchone()
+        if closed:
+            raise ValueError(f"绩效周期 {closed[0]} 至 {closed[1]} 已关闭，不能再添加该周期内的记录")
     
     def add_performance_record(self, employee_id, category, description, score):
         """记录员工表现"""
-        with sqlite3.connect(self.db.db_path) as conn:
+        record_date = datetime.now().strftime('%Y-%m-%d')
+        with self.db.transaction() as conn:
+            self._check_cycle_open(conn, record_date)
+            
             # 首先获取category_id
-            cursor = conn.execute(
-                "SELECT id FROM performance_categories WHERE name = ? AND is_active = 1",
-                (category,)
-            )
-            category_row = cursor.fetchone()
-            if not category_row:
+            category_id = self.get_category_id(category)
+            if category_id is None:
                 raise ValueError(f"类别 '{category}' 不存在或未启用")
             
-            category_id = category_row[0]
-            
             # 插入记录
             conn.execute(
                 "INSERT INTO performance_records (employee_id, category_id, description, score, record_date) "
                 "VALUES (?, ?, ?, ?, ?)",
-                (employee_id, category_id, description, score, datetime.now().strftime('%Y-%m-%d'))
+                (employee_id, category_id, description, score, record_date)
             )
     
-    def update_scoring_rule(self, category, weight, description):
-        """更新评分规则"""
-        with sqlite3.connect(self.db.db_path) as conn:
+    def add_performance_records_bulk(self, category, employee_scores, description):
+        """为多名员工批量记录同一类别的表现
+        
+        类别只解析一次，所有有效记录通过 executemany 在同一个事务中写入。
+        
+        Args:
+            category: 类别名称
+            employee_scores: (员工ID, 分值) 序列
+            description: 表现描述
+            
+        Returns:
+            list: 未能写入的记录，每项为 (员工ID, 原因)
+        """
+        employee_scores = list(employee_scores)
+        with self.db.transaction() as conn:
+            category_id = self.get_category_id(category)
+            if category_id is None:
+                raise ValueError(f"类别 '{category}' 不存在或未启用")
+            
+            record_date = datetime.now().strftime('%Y-%m-%d')
+            self._check_cycle_open(conn, record_date)
+            rows = []
+            failures = []
+            for employee_id, score in employee_scores:
+                employee = self.get_employee(employee_id)
+                if not employee or not employee[12]:
+                    failures.append((employee_id, '员工不存在或未激活'))
+                    continue
+                rows.append((employee_id, category_id, description, score, record_date))
+            
+            conn.executemany(
+                "INSERT INTO performance_records (employee_id, category_id, description, score, record_date) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            return failures
+    
+    def update_scoring_rule(self, category, weight, description, effective_date=None):
+        """设置评分规则
+        
+        规则按生效日期保存版本，同一类别同一生效日期重复设置时覆盖。
+        统计一个绩效周期时，各类别使用生效日期不晚于周期结束日期的最新版本。
+        
+        Args:
+            category: 类别名称，工作量得分使用 "工作承担"
+            weight: 权重
+            description: 规则描述
+            effective_date: 生效日期（YYYY-MM-DD），默认为当天
+        """
+        if effective_date is None:
+            effective_date = datetime.now().strftime('%Y-%m-%d')
+        else:
+            try:
+                datetime.strptime(effective_date, '%Y-%m-%d')
+            except ValueError:
+                raise ValueError("生效日期格式应为 YYYY-MM-DD")
+        
+        with self.db.transaction() as conn:
             conn.execute(
-                "INSERT OR REPLACE INTO scoring_rules (category, weight, description) VALUES (?, ?, ?)",
-                (category, weight, description)
+                """
+                INSERT INTO scoring_rules (category, weight, description, effective_date)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (category, effective_date) DO UPDATE SET
+                    weight = excluded.weight,
+                    description = excluded.description
+                """,
+                (category, weight, description, effective_date)
             )
     
+    def get_scoring_rules(self, as_of=None):
+        """获取评分规则
+        
+        Args:
+            as_of: 日期（YYYY-MM-DD），指定时只返回各类别在该日期生效的版本
+            
+        Returns:
+            list: (类别, 权重, 描述, 生效日期) 列表，按类别和生效日期排序
+        """
+        with self.db.transaction() as conn:
+            if as_of is None:
+                cursor = conn.execute(
+                    "SELECT category, weight, description, effective_date FROM scoring_rules "
+                    "ORDER BY category, effective_date"
+                )
+            else:
+                cursor = conn.execute(
+                    """
+                    SELECT category, weight, description, MAX(effective_date)
+                    FROM scoring_rules
+                    WHERE effective_date <= ?
+                    GROUP BY category
+                    ORDER BY category
+                    """,
+                    (as_of,)
+                )
+            return cursor.fetchall()
+    
     def toggle_employee_status(self, employee_id, active):
         """激活或取消激活员工"""
-        with sqlite3.connect(self.db.db_path) as conn:
+        with self.db.transaction() as conn:
             # 检查员工是否存在
             cursor = conn.execute("SELECT id FROM employees WHERE id = ?", (employee_id,))
             if not cursor.fetchone():
@@ -80,34 +236,23 @@ class PerformanceTracker:
                 "UPDATE employees SET is_active = ? WHERE id = ?",
                 (1 if active else 0, employee_id)
             )
+            self.dimensions.invalidate(categories=False, settings=False)
 
     def get_all_employees(self):
         """获取所有员工信息"""
-        with sqlite3.connect(self.db.db_path) as conn:
-            cursor = conn.execute("""
-                SELECT 
-                    id,
-                    name,
-                    domain_account,
-                    gender,
-                    hometown,
-                    university,
-                    major,
-                    phone,
-                    id_card,
-                    department,
-                    position,
-                    join_date,
-                    is_active,
-                    created_at
-                FROM employees
-                ORDER BY position, name
-            """)
-            return cursor.fetchall()
+        return list(self.dimensions.employees())
+    
+    def get_employee(self, employee_id):
+        """根据ID获取员工信息（来自维度缓存），不存在时返回 None"""
+        return self.dimensions.employee(employee_id)
+    
+    def get_employee_id_by_account(self, domain_account):
+        """根据域账号获取员工ID，不存在时返回 None"""
+        return self.dimensions.employee_id_by_account(domain_account)
     
     def get_employee_by_name(self, name):
         """根据姓名获取员工的详细信息"""
-        with sqlite3.connect(self.db.db_path) as conn:
+        with self.db.transaction() as conn:
             cursor = conn.execute(
                 "SELECT * FROM employees WHERE name = ?",
                 (name,)
@@ -116,31 +261,11 @@ class PerformanceTracker:
     
     def get_employee_detail(self, employee_id):
         """获取特定员工的详细信息"""
-        with sqlite3.connect(self.db.db_path) as conn:
-            cursor = conn.execute("""
-                SELECT 
-                    id,
-                    name,
-                    domain_account,
-                    gender,
-                    hometown,
-                    university,
-                    major,
-                    phone,
-                    id_card,
-                    department,
-                    position,
-                    join_date,
-                    is_active,
-                    created_at
-                FROM employees
-                WHERE id = ?
-            """, (employee_id,))
-            return cursor.fetchone()
+        return self.get_employee(employee_id)
     
     def delete_employee(self, employee_id):
         """删除指定员工"""
-        with sqlite3.connect(self.db.db_path) as conn:
+        with self.db.transaction() as conn:
             # 检查员工是否存在
             cursor = conn.execute("SELECT id FROM employees WHERE id = ?", (employee_id,))
             if not cursor.fetchone():
@@ -155,18 +280,28 @@ class PerformanceTracker:
             
             # 删除员工信息
             conn.execute("DELETE FROM employees WHERE id = ?", (employee_id,))
+            self.dimensions.invalidate(categories=False, settings=False)
     
     def update_global_setting(self, key, value, description):
         """更新全局设置"""
-        with sqlite3.connect(self.db.db_path) as conn:
+        with self.db.transaction() as conn:
             conn.execute(
                 "INSERT OR REPLACE INTO global_settings (key, value, description) VALUES (?, ?, ?)",
                 (key, value, description)
             )
+            self.dimensions.invalidate(employees=False, categories=False)
+    
+    def get_settings(self):
+        """获取全局设置快照（来自维度缓存）
+        
+        Returns:
+            Settings: 包含 performance_cycle、default_department、storage_profile
+        """
+        return self.dimensions.settings()
     
     def get_workload_record(self, week, year):
         """获取指定周的工作量记录"""
-        with sqlite3.connect(self.db.db_path) as conn:
+        with self.db.transaction() as conn:
             cursor = conn.execute(
                 "SELECT * FROM workload_scores WHERE week_number = ? AND year = ?",
                 (week, year)
@@ -174,18 +309,59 @@ class PerformanceTracker:
             return cursor.fetchone()
     
     def add_workload_score(self, employee_id, week, year, ranking_percentage, score, description):
-        """添加工作量评分记录"""
-        with sqlite3.connect(self.db.db_path) as conn:
+        """添加工作量评分记录，该员工当周已有记录时覆盖"""
+        with self.db.transaction() as conn:
+            self._check_cycle_open(conn, date.fromisocalendar(year, week, 4).isoformat())
             # 添加工作量评分记录
             conn.execute(
-                "INSERT INTO workload_scores (employee_id, week_number, year, ranking_percentage, score, description) "
-                "VALUES (?, ?, ?, ?, ?, ?)",
-                (employee_id, week, year, ranking_percentage, score, description)
+                WORKLOAD_UPSERT_SQL,
+                (employee_id, week, year, iso_week_start(year, week), ranking_percentage, score, description)
+            )
+    
+    def replace_weekly_workload(self, week, year, employee_ids, description):
+        """以新的排名整体替换指定周的工作量评分
+        
+        在同一个事务中按 (员工, 年份, 周) 覆盖写入新排名，并删除不在新排名中的旧记录，
+        因此重复执行同一周的录入不会产生重复记录。
+        
+        Args:
+            week: 周数
+            year: 年份
+            employee_ids: 按工作量从高到低排列的员工ID列表
+            description: 评分描述
+            
+        Returns:
+            list: 每项为 (员工ID, 排名百分比, 得分)
+        """
+        rankings = rank_workload_scores(employee_ids)
+        week_start = iso_week_start(year, week)
+        with self.db.transaction() as conn:
+            self._check_cycle_open(conn, date.fromisocalendar(year, week, 4).isoformat())
+            ranked = set(employee_ids)
+            stale = [
+                (row[0], year, week)
+                for row in conn.execute(
+                    "SELECT employee_id FROM workload_scores WHERE year = ? AND week_number = ?",
+                    (year, week)
+                )
+                if row[0] not in ranked
+            ]
+            conn.executemany(
+                "DELETE FROM workload_scores WHERE employee_id = ? AND year = ? AND week_number = ?",
+                stale
+            )
+            conn.executemany(
+                WORKLOAD_UPSERT_SQL,
+                [
+                    (employee_id, week, year, week_start, ranking_percentage, score, description)
+                    for employee_id, ranking_percentage, score in rankings
+                ]
             )
+        return rankings
     
     def get_workload_summary(self, start_date, end_date):
         """获取指定时间段内的工作量评分汇总"""
-        with sqlite3.connect(self.db.db_path) as conn:
+        with self.db.transaction() as conn:
             cursor = conn.execute(
                 """
                 SELECT 
@@ -203,7 +379,7 @@ class PerformanceTracker:
     
     def get_workload_details(self, start_date, end_date):
         """获取指定时间段内的工作量评分详情"""
-        with sqlite3.connect(self.db.db_path) as conn:
+        with self.db.transaction() as conn:
             cursor = conn.execute(
                 """
                 SELECT 
@@ -212,80 +388,372 @@ class PerformanceTracker:
                     ROUND(AVG(score), 2) as avg_score,
                     year
                 FROM workload_scores
-                WHERE (year || '-' || PRINTF('%02d', week_number)) BETWEEN 
-                    (strftime('%Y', ?) || '-' || strftime('%W', ?)) 
-                    AND 
-                    (strftime('%Y', ?) || '-' || strftime('%W', ?))
+                WHERE week_start BETWEEN ? AND ?
                 GROUP BY year, week_number
                 ORDER BY year, week_number
                 """,
-                (start_date, start_date, end_date, end_date)
+                cycle_week_range(start_date, end_date)
             )
             return cursor.fetchall()
     
     def get_performance_summary(self, start_date, end_date):
-        """获取指定时间段内的绩效统计"""
-        with sqlite3.connect(self.db.db_path) as conn:
-            # 首先获取所有激活的表现类别
+        """获取指定时间段内的绩效统计
+        
+        Returns:
+            tuple: (统计行列表, 启用的类别名称列表)。每行为
+                   (员工ID, 姓名, 部门, 工作量得分, *各启用类别得分, 总分)，按总分降序排列
+        """
+        scores = self.get_cycle_scores(start_date, end_date)
+        return scores.rows(), scores.categories
+    
+    def get_cycle_scores(self, start_date, end_date):
+        """获取指定时间段内的向量化得分（工作量、类别得分矩阵、总分、排名、百分位）
+        
+        Returns:
+            CycleScores: 周期得分，数据库未变化时复用已加载的结果
+        """
+        return self.scoring.load(start_date, end_date)
+    
+    def get_employee_rank(self, employee_id, cycle=None):
+        """获取员工在绩效周期内的排名
+        
+        在数据库中从汇总表（或快照、明细记录）算出各员工总分，按总分更高的人数得出名次，
+        不加载 NumPy 计算整个排行榜（见 ranking.employee_standing）。
+        
+        Args:
+            employee_id: 员工ID
+            cycle: (开始日期, 结束日期)，默认为当前绩效周期
+            
+        Returns:
+            tuple: (排名, 参与排名人数, 百分位, 奖金档位, 距上一档的分差)，
+                   员工不存在或未激活时返回 None
+        """
+        if cycle is None:
+            cycle = self.get_current_performance_cycle()
+            if not cycle[0] or not cycle[1]:
+                raise ValueError("请先设置绩效周期")
+        from .ranking import employee_standing
+        with self.db.transaction() as conn:
+            return employee_standing(conn, self.dimensions.categories(), *cycle, employee_id)
+    
+    def simulate_weights(self, start_date, end_date, weight_sets):
+        """模拟多组候选权重下的排名
+        
+        Args:
+            start_date: 周期开始日期
+            end_date: 周期结束日期
+            weight_sets: 候选权重列表，每项为 {类别名称: 权重}，未提及的类别沿用当前规则
+            
+        Returns:
+            Simulation: 各组权重下的总分、排名、排名变化和奖金档位
+        """
+        return self.get_cycle_scores(start_date, end_date).simulate(weight_sets)
+    
+    def close_performance_cycle(self, start_date=None, end_date=None):
+        """关闭绩效周期，将当前计算出的得分和排名写入快照
+        
+        关闭后该周期的统计、排名和模拟均读取快照，之后修改或删除该周期的记录不再影响结果。
+        
+        Args:
+            start_date: 周期开始日期，默认为当前绩效周期
+            end_date: 周期结束日期，默认为当前绩效周期
+            
+        Returns:
+            tuple: (快照ID, 校验和)
+        """
+        if not start_date or not end_date:
+            start_date, end_date = self.get_current_performance_cycle()
+            if not start_date or not end_date:
+                raise ValueError("请先设置绩效周期")
+        
+        from .snapshots import write_snapshot
+        with self.db.transaction() as conn:
+            scores = self.scoring.load(start_date, end_date)
+            if scores.snapshot_id is not None:
+                raise ValueError(f"绩效周期 {start_date} 至 {end_date} 已关闭")
+            return write_snapshot(conn, scores)
+    
+    def get_closed_cycles(self, year=None):
+        """获取已关闭的绩效周期
+        
+        Args:
+            year: 只返回开始日期在该年份的周期
+            
+        Returns:
+            list: (快照ID, 开始日期, 结束日期, 关闭时间, 员工数, 校验和) 列表，按开始日期排序
+        """
+        sql = """
+            SELECT s.id, s.start_date, s.end_date, s.closed_at,
+                   (SELECT COUNT(*) FROM cycle_snapshot_scores WHERE snapshot_id = s.id),
+                   s.checksum
+            FROM cycle_snapshots s
+        """
+        params = []
+        if year is not None:
+            sql += " WHERE s.start_date BETWEEN ? AND ?"
+            params = [f'{year}-01-01', f'{year}-12-31']
+        sql += " ORDER BY s.start_date, s.end_date"
+        
+        with self.db.transaction() as conn:
+            return conn.execute(sql, params).fetchall()
+    
+    def verify_cycle_snapshot(self, snapshot_id):
+        """校验快照内容与关闭时记录的校验和是否一致，快照不存在时返回 None"""
+        from .snapshots import verify_snapshot
+        with self.db.transaction() as conn:
+            return verify_snapshot(conn, snapshot_id)
+    
+    def get_cycle_report(self, year):
+        """获取一年内已关闭周期的汇总报告，只读取快照
+        
+        Args:
+            year: 年份
+            
+        Returns:
+            tuple: (周期列表, 报告行列表)。周期为 (开始日期, 结束日期)；
+                   每行为 (员工ID, 姓名, 部门, [(总分, 排名) 或 None, ...], 年度总分)，按年度总分降序排列
+        """
+        cycles = self.get_closed_cycles(year)
+        if not cycles:
+            return [], []
+        columns = {cycle[0]: i for i, cycle in enumerate(cycles)}
+        with self.db.transaction() as conn:
             cursor = conn.execute(
-                "SELECT name FROM performance_categories WHERE is_active = 1 ORDER BY name"
+                f"""
+                SELECT snapshot_id, employee_id, name, department, total_score, rank
+                FROM cycle_snapshot_scores
+                WHERE snapshot_id IN ({','.join('?' * len(columns))})
+                """,
+                list(columns)
             )
-            categories = [row[0] for row in cursor.fetchall()]
+            records = sorted(cursor, key=lambda record: (record[1], columns[record[0]]))
+        
+        employees = {}
+        for snapshot_id, employee_id, name, department, total, rank in records:
+            employee = employees.setdefault(employee_id, [employee_id, name, department, [None] * len(cycles)])
+            # 按周期先后处理，姓名和部门以最近一次快照为准
+            employee[1], employee[2] = name, department
+            employee[3][columns[snapshot_id]] = (total, rank)
+        
+        rows = [
+            (employee_id, name, department, scores, round(sum(score[0] for score in scores if score), 2))
+            for employee_id, name, department, scores in employees.values()
+        ]
+        rows.sort(key=lambda row: row[-1], reverse=True)
+        return [(cycle[1], cycle[2]) for cycle in cycles], rows
+    
+    def export_data(self, dataset, fmt, output, since=None, cycle=None, chunk_size=50000):
+        """导出数据集
+        
+        Args:
+            dataset: records（表现记录）、workload（工作量记录）、employees（员工）或 summary（周期统计）
+            fmt: csv、ndjson 或 parquet
+            output: 文件路径或文本文件对象（parquet 只支持文件路径）
+            since: 增量导出的水位线，整数为上次导出的最大ID，其他字符串为 created_at 时间，
+                只包含新增的行、不包含原地修改的行；summary 不支持
+            cycle: summary 使用的 (开始日期, 结束日期)，默认为当前绩效周期
+            chunk_size: 每次从数据库读取的行数
             
-            # 构建动态SQL查询
-            category_columns = ',\n'.join([
-                f"COALESCE(MAX(CASE WHEN cs.category = '{cat}' THEN cs.category_score END), 0) as {cat.replace(' ', '_')}_score"
-                for cat in categories
-            ])
+        Returns:
+            tuple: (导出的行数, 最后一行的ID)，最后一行的ID可作为下次增量导出的 since
+        """
+        from .export import EXPORT_DATASETS, read_chunks, summary_frame, write_chunks
+        if dataset not in EXPORT_DATASETS:
+            raise ValueError(f"不支持的数据集：{dataset}")
+        if dataset == 'summary':
+            if since is not None:
+                raise ValueError("周期统计不支持增量导出")
+            if cycle is None:
+                cycle = self.get_current_performance_cycle()
+                if not cycle[0] or not cycle[1]:
+                    raise ValueError("请先设置绩效周期")
+            return write_chunks([summary_frame(self.get_cycle_scores(*cycle))], fmt, output)
+        
+        with self.db.transaction() as conn:
+            return write_chunks(read_chunks(conn, dataset, since, chunk_size), fmt, output)
+    
+    def import_data(self, dataset, path, rejects=None, chunk_size=50000):
+        """从 CSV、JSONL 或 Excel 文件批量导入
+        
+        文件按块读取和校验，每块通过校验的行在一个事务中用 executemany 写入，
+        因此中途失败时此前的块已经提交。工作量排名需要按周计算得分，整个文件作为一块处理，
+        文件中出现的周以文件内容整体替换（与 work add 相同）。
+        
+        Args:
+            dataset: employees（员工）、records（表现记录）或 workload（每周工作量排名）
+            path: 导入文件路径
+            rejects: 拒绝文件路径（CSV），未通过校验的行连同行号和原因写入其中；None 表示不写
+            chunk_size: 每块的行数
             
-            sql = f"""
-            WITH WorkloadScores AS (
-                -- 计算工作量得分（从workload_scores表获取总分）
-                SELECT 
-                    employee_id,
-                    ROUND(SUM(score), 2) as workload_score  -- 改为SUM而不是AVG
-                FROM workload_scores
-                WHERE (year || '-' || PRINTF('%02d', week_number)) BETWEEN 
-                    (strftime('%Y', ?) || '-' || strftime('%W', ?)) 
-                    AND 
-                    (strftime('%Y', ?) || '-' || strftime('%W', ?))
-                GROUP BY employee_id
-            ),
-            CategoryScores AS (
-                -- 计算各表现类别的总分
-                SELECT 
-                    pr.employee_id,
-                    pc.name as category,
-                    ROUND(SUM(pr.score), 2) as category_score
-                FROM performance_records pr
-                JOIN performance_categories pc ON pr.category_id = pc.id
-                WHERE pr.record_date BETWEEN ? AND ?
-                GROUP BY pr.employee_id, pc.name
+        Returns:
+            tuple: (写入的行数, 拒绝的行数)
+        """
+        from .importer import (
+            EMPLOYEE_INSERT_SQL, IMPORT_DATASETS, check_columns, insert_records, read_frames,
+            validate_employees, validate_records, validate_workload, write_rejects,
+        )
+        if dataset not in IMPORT_DATASETS:
+            raise ValueError(f"不支持的数据集：{dataset}")
+        
+        if dataset == 'employees':
+            employees = self.dimensions.employees()
+            existing = {
+                'domain_account': {row[2] for row in employees if row[2]},
+                'phone': {row[7] for row in employees if row[7]},
+                'id_card': {row[8] for row in employees if row[8]},
+            }
+            default_department = self.get_settings().default_department
+            validate = partial(validate_employees, existing=existing, default_department=default_department)
+        else:
+            accounts = {row[2]: row[0] for row in self.dimensions.employees() if row[2]}
+            active = {row[0]: bool(row[12]) for row in self.dimensions.employees()}
+            # 已关闭周期内的记录与 add_performance_record 等一样拒绝写入（见 _check_cycle_open）
+            with self.db.transaction() as conn:
+                closed_cycles = conn.execute("SELECT start_date, end_date FROM cycle_snapshots").fetchall()
+            if dataset == 'records':
+                categories = {row[1]: (row[0], row[3]) for row in self.dimensions.categories()}
+                record_date = datetime.now().strftime('%Y-%m-%d')
+                validate = partial(validate_records, accounts=accounts, active=active, categories=categories,
+                                   record_date=record_date, closed_cycles=closed_cycles)
+            else:
+                validate = partial(validate_workload, accounts=accounts, active=active, closed_cycles=closed_cycles)
+                chunk_size = None
+        
+        imported = rejected = 0
+        stream = None
+        try:
+            for i, frame in enumerate(read_frames(path, chunk_size)):
+                if i == 0:
+                    check_columns(dataset, frame)
+                rows, reasons = validate(frame)
+                if rejects is not None and (reasons != '').any():
+                    header = stream is None
+                    if header:
+                        stream = open(rejects, 'w', encoding='utf-8', newline='')
+                    write_rejects(stream, frame, reasons, header)
+                rejected += int((reasons != '').sum())
+                
+                with self.db.transaction() as conn:
+                    if dataset == 'employees':
+                        conn.executemany(EMPLOYEE_INSERT_SQL, rows)
+                        self.dimensions.invalidate(categories=False, settings=False)
+                    elif dataset == 'records':
+                        insert_records(conn, rows)
+                    else:
+                        weeks = {(year, week): iso_week_start(year, week) for _, week, year, *_ in rows}
+                        conn.executemany(
+                            "DELETE FROM workload_scores WHERE year = ? AND week_number = ?",
+                            list(weeks)
+                        )
+                        conn.executemany(
+                            WORKLOAD_UPSERT_SQL,
+                            [
+                                (employee_id, week, year, weeks[(year, week)], ranking_percentage, score, description)
+                                for employee_id, week, year, ranking_percentage, score, description in rows
+                            ]
+                        )
+                imported += len(rows)
+        finally:
+            if stream is not None:
+                stream.close()
+        return imported, rejected
+    
+    def apply_batch(self, path, dry_run=False):
+        """从 JSONL 或 YAML 文件读取批量操作，全部通过校验后在一个事务中执行
+        
+        操作格式见 src/core/batch.py。任何一个操作未通过校验时都不写入；
+        执行中出错时整个事务回滚。连续的表现记录与批量导入一样整块写入（见 importer.insert_records）。
+        
+        Args:
+            path: 操作文件路径，- 表示从标准输入读取 JSONL
+            dry_run: 为 True 时只校验并返回变更计划，不写入
+        
+        Returns:
+            tuple: (变更计划 BatchStep 列表, 未通过校验的操作 [(位置, 原因)])
+        """
+        from .batch import BatchPlanner, read_operations
+        planner = BatchPlanner(self)
+        for position, operation in read_operations(path):
+            planner.add(position, operation)
+        if planner.errors or dry_run:
+            return planner.steps, planner.errors
+        
+        from .importer import insert_records
+        apply_step = {
+            'workload': self.replace_weekly_workload,
+            'employee': self.toggle_employee_status,
+            'category': self.toggle_category_status,
+            'setting': self.update_global_setting,
+            'rule': self.update_scoring_rule,
+        }
+        try:
+            with self.db.transaction() as conn:
+                records = []
+                for step in planner.steps:
+                    if step.kind == 'record':
+                        records.append(step.args)
+                        continue
+                    insert_records(conn, records)
+                    records = []
+                    apply_step[step.kind](*step.args)
+                insert_records(conn, records)
+        except BaseException:
+            # 回滚前维度缓存可能已读入事务中未提交的状态
+            self.dimensions.invalidate()
+            raise
+        return planner.steps, planner.errors
+    
+    def check_score_aggregates(self):
+        """检查得分汇总表与明细记录是否一致
+        
+        从明细记录重新计算全部汇总值并与汇总表逐行比较。
+        
+        Returns:
+            list: 不一致的汇总行，每项为 (汇总表, 键, 期望值, 实际值)，
+                  键为 (月份, 员工ID[, 类别ID])，值为 (总分, 条数)，缺失的一方为 None
+        """
+        with self.db.transaction() as conn:
+            mismatches = []
+            for table, source_sql, key_columns, count_column in (
+                ('category_score_aggregates', CATEGORY_AGGREGATE_SOURCE_SQL,
+                 'period, employee_id, category_id', 'record_count'),
+                ('workload_score_aggregates', WORKLOAD_AGGREGATE_SOURCE_SQL,
+                 'period, employee_id', 'week_count'),
+            ):
+                key_size = len(key_columns.split(','))
+                expected = {
+                    row[:key_size]: row[key_size:]
+                    for row in conn.execute(
+                        f"SELECT {key_columns}, total_score, {count_column} FROM ({source_sql})"
+                    )
+                }
+                actual = {
+                    row[:key_size]: row[key_size:]
+                    for row in conn.execute(f"SELECT {key_columns}, total_score, {count_column} FROM {table}")
+                }
+                for key in sorted(expected.keys() | actual.keys()):
+                    want, got = expected.get(key), actual.get(key)
+                    if want is None or got is None or want[1] != got[1] or abs(want[0] - got[0]) > 1e-6:
+                        mismatches.append((table, key, want, got))
+            return mismatches
+    
+    def rebuild_score_aggregates(self):
+        """从明细记录重新生成得分汇总表"""
+        with self.db.transaction() as conn:
+            conn.execute("DELETE FROM category_score_aggregates")
+            conn.execute("DELETE FROM workload_score_aggregates")
+            conn.execute(
+                "INSERT INTO category_score_aggregates (employee_id, period, category_id, total_score, record_count) "
+                + CATEGORY_AGGREGATE_SOURCE_SQL
+            )
+            conn.execute(
+                "INSERT INTO workload_score_aggregates (employee_id, period, total_score, week_count) "
+                + WORKLOAD_AGGREGATE_SOURCE_SQL
             )
-            SELECT 
-                e.id,
-                e.name,
-                e.department,
-                COALESCE(ws.workload_score, 0) as workload_score,
-                {category_columns},
-                ROUND(
-                    COALESCE(ws.workload_score, 0) + 
-                    COALESCE(SUM(cs.category_score), 0)
-                , 2) as total_score
-            FROM employees e
-            LEFT JOIN WorkloadScores ws ON e.id = ws.employee_id
-            LEFT JOIN CategoryScores cs ON e.id = cs.employee_id
-            WHERE e.is_active = 1
-            GROUP BY e.id, e.name, e.department
-            ORDER BY total_score DESC
-            """
-            
-            cursor = conn.execute(sql, (start_date, start_date, end_date, end_date, start_date, end_date))
-            return cursor.fetchall(), categories
     
     def get_employee_workload_detail(self, employee_id, start_date, end_date):
         """获取指定员工在指定时间段内的工作承担得分记录"""
-        with sqlite3.connect(self.db.db_path) as conn:
+        with self.db.transaction() as conn:
             cursor = conn.execute(
                 """
                 SELECT 
@@ -296,19 +764,16 @@ class PerformanceTracker:
                     description
                 FROM workload_scores
                 WHERE employee_id = ?
-                AND (year || '-' || PRINTF('%02d', week_number)) BETWEEN 
-                    (strftime('%Y', ?) || '-' || strftime('%W', ?)) 
-                    AND 
-                    (strftime('%Y', ?) || '-' || strftime('%W', ?))
+                AND week_start BETWEEN ? AND ?
                 ORDER BY year DESC, week_number DESC
                 """,
-                (employee_id, start_date, start_date, end_date, end_date)
+                (employee_id, *cycle_week_range(start_date, end_date))
             )
             return cursor.fetchall()
     
     def get_employee_performance_detail(self, employee_id, start_date, end_date):
         """获取指定员工在指定时间段内的表现得分记录"""
-        with sqlite3.connect(self.db.db_path) as conn:
+        with self.db.transaction() as conn:
             cursor = conn.execute(
                 """
                 SELECT 
@@ -327,79 +792,58 @@ class PerformanceTracker:
             return cursor.fetchall()
     
     def get_current_performance_cycle(self):
-        """获取当前绩效周期的起止日期"""
-        with sqlite3.connect(self.db.db_path) as conn:
-            cursor = conn.execute(
-                "SELECT value FROM global_settings WHERE key = 'performance_cycle'"
-            )
-            cycle = cursor.fetchone()
-            
-            if not cycle:
-                return None, None
-            
-            today = datetime.now()
-            if cycle[0] == 'monthly':
-                # 月度绩效：当月1号到月末
-                start_date = today.replace(day=1).strftime('%Y-%m-%d')
-                if today.month == 12:
-                    end_date = today.replace(year=today.year + 1, month=1, day=1)
-                else:
-                    end_date = today.replace(month=today.month + 1, day=1)
-                end_date = (end_date - timedelta(days=1)).strftime('%Y-%m-%d')
-            else:
-                # 季度绩效：当季度第一天到最后一天
-                quarter = (today.month - 1) // 3
-                start_date = today.replace(month=quarter * 3 + 1, day=1).strftime('%Y-%m-%d')
-                if quarter == 3:
-                    end_date = today.replace(year=today.year + 1, month=1, day=1)
-                else:
-                    end_date = today.replace(month=(quarter + 1) * 3 + 1, day=1)
-                end_date = (end_date - timedelta(days=1)).strftime('%Y-%m-%d')
-                
-            return start_date, end_date
+        """获取当前绩效周期的起止日期，未设置绩效周期时返回 (None, None)"""
+        cycle_type = self.dimensions.settings().performance_cycle
+        if not cycle_type:
+            return None, None
+        return cycle_bounds(cycle_type, date.today())
 
     def get_active_categories(self):
         """获取所有启用的表现类别"""
-        with sqlite3.connect(self.db.db_path) as conn:
-            cursor = conn.execute(
-                "SELECT name, description FROM performance_categories WHERE is_active = 1"
-            )
-            return cursor.fetchall()
+        return [(row[1], row[2]) for row in self.dimensions.categories() if row[3]]
+    
+    def get_category_id(self, name, active_only=True):
+        """根据名称获取表现类别ID（来自维度缓存）
+        
+        Args:
+            name: 类别名称
+            active_only: 为 True 时，禁用的类别视为不存在
+            
+        Returns:
+            int|None: 类别ID，不存在时返回 None
+        """
+        category_id = self.dimensions.category_id(name)
+        if category_id is None:
+            return None
+        if active_only and not self.dimensions.category(category_id)[3]:
+            return None
+        return category_id
 
     def add_category(self, name, description):
         """添加新的表现类别"""
-        with sqlite3.connect(self.db.db_path) as conn:
+        with self.db.transaction() as conn:
             conn.execute(
                 "INSERT INTO performance_categories (name, description) VALUES (?, ?)",
                 (name, description)
             )
+            self.dimensions.invalidate(employees=False, settings=False)
 
     def toggle_category(self, name, active):
         """启用或禁用表现类别"""
-        with sqlite3.connect(self.db.db_path) as conn:
+        with self.db.transaction() as conn:
             conn.execute(
                 "UPDATE performance_categories SET is_active = ?, updated_at = CURRENT_TIMESTAMP WHERE name = ?",
                 (active, name)
             )
+            self.dimensions.invalidate(employees=False, settings=False)
 
     def get_all_categories(self):
         """获取所有表现类别"""
-        with sqlite3.connect(self.db.db_path) as conn:
-            cursor = conn.execute("""
-                SELECT 
-                    id,
-                    name,
-                    description,
-                    is_active,
-                    created_at
-                FROM performance_categories
-                ORDER BY name
-            """)
-            return cursor.fetchall()
+        return sorted(self.dimensions.categories(), key=lambda row: row[1])
 
     def update_category(self, old_name, new_name, description, is_active):
         """更新表现类别信息"""
-        with sqlite3.connect(self.db.db_path) as conn:
+        with self.db.transaction() as conn:
             # 检查新名称是否已存在（如果名称有变化）
             if old_name != new_name:
                 cursor = conn.execute(
@@ -418,10 +862,11 @@ class PerformanceTracker:
                 """,
                 (new_name, description, is_active, old_name)
             )
+            self.dimensions.invalidate(employees=False, settings=False)
 
     def get_performance_record(self, record_id):
         """获取特定表现记录的详细信息"""
-        with sqlite3.connect(self.db.db_path) as conn:
+        with self.db.transaction() as conn:
             cursor = conn.execute(
                 """
                 SELECT 
@@ -442,7 +887,7 @@ class PerformanceTracker:
 
     def update_performance_record(self, record_id, new_score, new_description):
         """更新表现记录"""
-        with sqlite3.connect(self.db.db_path) as conn:
+        with self.db.transaction() as conn:
             # 检查记录是否存在
             cursor = conn.execute("SELECT id FROM performance_records WHERE id = ?", (record_id,))
             if not cursor.fetchone():
@@ -460,7 +905,7 @@ class PerformanceTracker:
 
     def get_employee_performance_records(self, employee_id, start_date, end_date):
         """获取指定员工在指定时间段内的所有表现记录"""
-        with sqlite3.connect(self.db.db_path) as conn:
+        with self.db.transaction() as conn:
             cursor = conn.execute(
                 """
                 SELECT 
@@ -483,7 +928,7 @@ class PerformanceTracker:
 
     def delete_performance_record(self, record_id):
         """删除表现记录"""
-        with sqlite3.connect(self.db.db_path) as conn:
+        with self.db.transaction() as conn:
             # 检查记录是否存在
             cursor = conn.execute("SELECT id FROM performance_records WHERE id = ?", (record_id,))
             if not cursor.fetchone():
@@ -499,7 +944,7 @@ class PerformanceTracker:
             name: 类别名称
             active: True 表示启用，False 表示禁用
         """
-        with sqlite3.connect(self.db.db_path) as conn:
+        with self.db.transaction() as conn:
             # 检查类别是否存在
             cursor = conn.execute("SELECT id FROM performance_categories WHERE name = ?", (name,))
             if not cursor.fetchone():
@@ -510,6 +955,7 @@ class PerformanceTracker:
                 "UPDATE performance_categories SET is_active = ?, updated_at = CURRENT_TIMESTAMP WHERE name = ?",
                 (1 if active else 0, name)
             )
+            self.dimensions.invalidate(employees=False, settings=False)
 
     def get_category_status(self, name):
         """获取表现类别的当前状态
@@ -520,17 +966,12 @@ class PerformanceTracker:
         Returns:
             bool|None: True表示启用，False表示禁用，None表示类别不存在
         """
-        with sqlite3.connect(self.db.db_path) as conn:
-            cursor = conn.execute(
-                "SELECT is_active FROM performance_categories WHERE name = ?",
-                (name,)
-            )
-            result = cursor.fetchone()
-            return result[0] if result else None
+        category = self.get_category_by_name(name)
+        return category[3] if category else None
 
     def get_category_detail(self, name):
         """获取表现类别的详细信息"""
-        with sqlite3.connect(self.db.db_path) as conn:
+        with self.db.transaction() as conn:
             cursor = conn.execute("""
                 SELECT 
                     id,
@@ -546,7 +987,7 @@ class PerformanceTracker:
 
     def get_category_record_count(self, name):
         """获取表现类别下的记录数量"""
-        with sqlite3.connect(self.db.db_path) as conn:
+        with self.db.transaction() as conn:
             cursor = conn.execute("""
                 SELECT COUNT(*)
                 FROM performance_records pr
@@ -561,7 +1002,7 @@ class PerformanceTracker:
         Args:
             name: 类别名称
         """
-        with sqlite3.connect(self.db.db_path) as conn:
+        with self.db.transaction() as conn:
             # 检查类别是否存在
             cursor = conn.execute("SELECT id FROM performance_categories WHERE name = ?", (name,))
             category = cursor.fetchone()
@@ -575,36 +1016,16 @@ class PerformanceTracker:
             
             # 删除类别
             conn.execute("DELETE FROM performance_categories WHERE id = ?", (category_id,))
+            self.dimensions.invalidate(employees=False, settings=False)
 
     def get_category_by_id(self, category_id):
         """根据ID获取表现类别信息"""
-        with sqlite3.connect(self.db.db_path) as conn:
-            cursor = conn.execute("""
-                SELECT 
-                    id,
-                    name,
-                    description,
-                    is_active,
-                    created_at
-                FROM performance_categories
-                WHERE id = ?
-            """, (category_id,))
-            return cursor.fetchone()
+        return self.dimensions.category(category_id)
 
     def get_category_by_name(self, name):
         """根据名称获取表现类别信息"""
-        with sqlite3.connect(self.db.db_path) as conn:
-            cursor = conn.execute("""
-                SELECT 
-                    id,
-                    name,
-                    description,
-                    is_active,
-                    created_at
-                FROM performance_categories
-                WHERE name = ?
-            """, (name,))
-            return cursor.fetchone()
+        category_id = self.dimensions.category_id(name)
+        return self.dimensions.category(category_id) if category_id is not None else None
 
     def get_all_performance_records(self, start_date=None, end_date=None):
         """获取所有表现记录
@@ -616,7 +1037,42 @@ class PerformanceTracker:
         Returns:
             list: 记录列表，每条记录包含：记录ID、员工姓名、部门、类别、分值、描述、记录日期
         """
-        with sqlite3.connect(self.db.db_path) as conn:
+        return list(self.iter_performance_records(start_date, end_date))
+    
+    def iter_performance_records(self, start_date=None, end_date=None, employee_id=None, category=None,
+                                 page_size=500):
+        """逐条生成表现记录，按记录日期和ID降序排列
+        
+        按 (record_date, id) 键集分页读取，每页在独立的短事务中查询，
+        内存占用与记录总数无关。
+        
+        Args:
+            start_date: 开始日期，可选
+            end_date: 结束日期，可选
+            employee_id: 只返回该员工的记录，可选
+            category: 只返回该类别的记录，可选
+            page_size: 每页读取的记录数
+            
+        Yields:
+            tuple: 记录ID、员工姓名、部门、类别、分值、描述、记录日期
+        """
+        conditions, params = [], []
+        if start_date and end_date:
+            conditions.append("pr.record_date BETWEEN ? AND ?")
+            params.extend([start_date, end_date])
+        if employee_id is not None:
+            conditions.append("pr.employee_id = ?")
+            params.append(employee_id)
+        if category is not None:
+            category_id = self.get_category_id(category, active_only=False)
+            if category_id is None:
+                return
+            conditions.append("pr.category_id = ?")
+            params.append(category_id)
+        
+        after = None
+        while True:
+            where = conditions + (["(pr.record_date, pr.id) < (?, ?)"] if after else [])
             query = """
                 SELECT 
                     pr.id,
@@ -630,17 +1086,50 @@ class PerformanceTracker:
                 JOIN employees e ON pr.employee_id = e.id
                 JOIN performance_categories pc ON pr.category_id = pc.id
             """
+            if where:
+                query += " WHERE " + " AND ".join(where)
+            query += " ORDER BY pr.record_date DESC, pr.id DESC LIMIT ?"
             
-            params = []
-            if start_date and end_date:
-                query += " WHERE pr.record_date BETWEEN ? AND ?"
-                params.extend([start_date, end_date])
-            
-            query += " ORDER BY pr.record_date DESC, e.name"
-            
-            cursor = conn.execute(query, params)
-            return cursor.fetchall()
+            with self.db.transaction() as conn:
+                page = conn.execute(query, params + list(after or ()) + [page_size]).fetchall()
+            yield from page
+            if len(page) < page_size:
+                return
+            after = (page[-1][6], page[-1][0])
 
+    def search_records(self, text, start_date=None, end_date=None, sources=tuple(SEARCH_SOURCES), limit=50):
+        """在表现记录和工作量记录的描述中检索关键词
+        
+        关键词以空白分隔，全部出现才算命中；三个字符及以上的关键词通过全文索引查找，
+        结果按相关度排序，相关度相同（或只有较短关键词）时按日期从新到旧。
+        
+        Args:
+            text: 搜索文本
+            start_date: 开始日期，None 表示不限
+            end_date: 结束日期，None 表示不限
+            sources: 检索的数据源，records（表现记录）和/或 workload（工作量记录）
+            limit: 最多返回的条数
+            
+        Returns:
+            list: 每项为 (数据源, 记录ID, 日期, 员工姓名, 部门, 类别或周次, 分值, 描述)
+        """
+        match, short_terms = split_terms(text)
+        unknown = [source for source in sources if source not in SEARCH_SOURCES]
+        if unknown or not sources:
+            raise ValueError(f"不支持的数据源：{', '.join(unknown)}")
+        
+        parts, params = [], []
+        for source in sources:
+            sql, source_params = search_query(source, match, short_terms, start_date, end_date)
+            parts.append(sql)
+            params.extend(source_params)
+        with self.db.transaction() as conn:
+            cursor = conn.execute(
+                ' UNION ALL '.join(parts) + ' ORDER BY rank, 3 DESC LIMIT ?',
+                (*params, limit)
+            )
+            return [row[:-1] for row in cursor]
+    
     def get_all_workload_records(self, start_date=None, end_date=None):
         """获取所有工作量记录
         
@@ -651,7 +1140,36 @@ class PerformanceTracker:
         Returns:
             list: 记录列表，每条记录包含：周数、员工姓名、部门、年份、排名百分比、得分、描述
         """
-        with sqlite3.connect(self.db.db_path) as conn:
+        return list(self.iter_workload_records(start_date, end_date))
+    
+    def iter_workload_records(self, start_date=None, end_date=None, employee_id=None, page_size=500):
+        """逐条生成工作量记录，按年份、周数和ID降序排列
+        
+        按 (year, week_number, id) 键集分页读取，每页在独立的短事务中查询。
+        未记录年份或周数的记录不在列表中。
+        
+        Args:
+            start_date: 开始日期，可选
+            end_date: 结束日期，可选
+            employee_id: 只返回该员工的记录，可选
+            page_size: 每页读取的记录数
+            
+        Yields:
+            tuple: 周数、员工姓名、部门、年份、排名百分比、得分、描述
+        """
+        conditions = ["ws.year IS NOT NULL", "ws.week_number IS NOT NULL"]
+        params = []
+        if start_date and end_date:
+            # 按周四所在日期将 ISO 周归入周期
+            conditions.append("ws.week_start BETWEEN ? AND ?")
+            params.extend(cycle_week_range(start_date, end_date))
+        if employee_id is not None:
+            conditions.append("ws.employee_id = ?")
+            params.append(employee_id)
+        
+        after = None
+        while True:
+            where = conditions + (["(ws.year, ws.week_number, ws.id) < (?, ?, ?)"] if after else [])
             query = """
                 SELECT 
                     ws.week_number,
@@ -660,26 +1178,22 @@ class PerformanceTracker:
                     ws.year,
                     ws.ranking_percentage,
                     ws.score,
-                    ws.description
+                    ws.description,
+                    ws.id
                 FROM workload_scores ws
                 JOIN employees e ON ws.employee_id = e.id
+                WHERE """ + " AND ".join(where) + """
+                ORDER BY ws.year DESC, ws.week_number DESC, ws.id DESC
+                LIMIT ?
             """
             
-            params = []
-            if start_date and end_date:
-                # 将日期转换为年和周
-                query += """ 
-                    WHERE (ws.year || '-' || PRINTF('%02d', ws.week_number)) BETWEEN 
-                        (strftime('%Y', ?) || '-' || strftime('%W', ?)) 
-                        AND 
-                        (strftime('%Y', ?) || '-' || strftime('%W', ?))
-                """
-                params.extend([start_date, start_date, end_date, end_date])
-            
-            query += " ORDER BY ws.year DESC, ws.week_number DESC, e.name"
-            
-            cursor = conn.execute(query, params)
-            return cursor.fetchall()
+            with self.db.transaction() as conn:
+                page = conn.execute(query, params + list(after or ()) + [page_size]).fetchall()
+            for row in page:
+                yield row[:-1]
+            if len(page) < page_size:
+                return
+            after = (page[-1][3], page[-1][0], page[-1][7])
 
     def get_workload_records_by_week(self, week, year):
         """获取指定周的工作量记录
@@ -691,7 +1205,7 @@ class PerformanceTracker:
         Returns:
             list: 记录列表，每条记录包含：周数、员工姓名、部门、年份、排名百分比、得分、描述
         """
-        with sqlite3.connect(self.db.db_path) as conn:
+        with self.db.transaction() as conn:
             query = """
                 SELECT 
                     ws.week_number,
@@ -719,7 +1233,7 @@ class PerformanceTracker:
         Returns:
             list: 周数列表
         """
-        with sqlite3.connect(self.db.db_path) as conn:
+        with self.db.transaction() as conn:
             query = """
                 SELECT DISTINCT week_number
                 FROM workload_scores
@@ -736,7 +1250,7 @@ class PerformanceTracker:
             week: 周数
             year: 年份
         """
-        with sqlite3.connect(self.db.db_path) as conn:
+        with self.db.transaction() as conn:
             conn.execute("""
                 DELETE FROM workload_scores
                 WHERE week_number = ? AND year = ?
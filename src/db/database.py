@@ -3,113 +3,225 @@
 
 import os
 import sqlite3
-from datetime import datetime
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 
+from .migrations import MIGRATIONS, LATEST_VERSION
+
 # 获取项目根目录的绝对路径
 APP_DIR = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 DEFAULT_DB_PATH = APP_DIR / 'data' / 'performance.db'
 
+# 存储配置：每次建立连接时应用的 PRAGMA 组合
+#   default : WAL 日志，CLI 与 API 可以同时读写，适合日常使用
+#   durable : WAL + 每次提交同步落盘，断电也不丢失已提交的事务
+#   bulk    : 大批量导入时使用，关闭同步并放大缓存，异常断电可能丢失最近的提交
+#   legacy  : 回滚日志模式，与旧版本行为一致
+STORAGE_PROFILES = {
+    'default': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'busy_timeout': 5000,
+        'mmap_size': 256 * 1024 * 1024,
+        'cache_size': -64 * 1024,
+        'temp_store': 'MEMORY',
+    },
+    'durable': {
+        'journal_mode': 'WAL',
+        'synchronous': 'FULL',
+        'busy_timeout': 10000,
+        'mmap_size': 0,
+        'cache_size': -16 * 1024,
+        'temp_store': 'DEFAULT',
+    },
+    'bulk': {
+        'journal_mode': 'WAL',
+        'synchronous': 'OFF',
+        'busy_timeout': 30000,
+        'mmap_size': 1024 * 1024 * 1024,
+        'cache_size': -256 * 1024,
+        'temp_store': 'MEMORY',
+    },
+    'legacy': {
+        'journal_mode': 'DELETE',
+        'synchronous': 'FULL',
+        'busy_timeout': 5000,
+        'mmap_size': 0,
+        'cache_size': -2000,
+        'temp_store': 'DEFAULT',
+    },
+}
+DEFAULT_STORAGE_PROFILE = 'default'
+
+# 环境变量：数据库文件路径和存储配置，优先于全局设置
+DB_PATH_ENV = 'PERF_DB_PATH'
+STORAGE_PROFILE_ENV = 'PERF_DB_PROFILE'
+
 class PerformanceDB:
-    def __init__(self, db_path=None):
+    def __init__(self, db_path=None, profile=None):
         """初始化数据库连接
         
         Args:
-            db_path: 数据库文件路径，默认为项目根目录下的 data/performance.db
+            db_path: 数据库文件路径，默认取环境变量 PERF_DB_PATH，
+                     未设置时为项目根目录下的 data/performance.db
+            profile: 存储配置名称（见 STORAGE_PROFILES），默认依次取环境变量
+                     PERF_DB_PROFILE、全局设置 storage_profile，均未设置时为 default
+        """
+        self.db_path = db_path or os.environ.get(DB_PATH_ENV) or DEFAULT_DB_PATH
+        
+        profile = profile or os.environ.get(STORAGE_PROFILE_ENV)
+        if profile and profile not in STORAGE_PROFILES:
+            raise ValueError(f"未知的存储配置 '{profile}'，可选：{', '.join(STORAGE_PROFILES)}")
+        self._profile = profile
+        self._applied_profile = None
+        
+        # 每个线程持有一个长连接，避免每次操作都重新连接、重新预热页缓存
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+        
+        # 建立连接和检查结构版本推迟到第一次访问数据库时，
+        # 创建跟踪器后不访问数据库的命令（如参数错误、取消确认）不会打开数据库
+        self._migrated = False
+        self._migrate_lock = threading.Lock()
+    
+    def connection(self):
+        """获取当前线程的数据库连接，首次调用时建立连接
+        
+        Returns:
+            sqlite3.Connection: 当前线程复用的连接
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # 确保数据目录存在
+            os.makedirs(os.path.dirname(str(self.db_path)), exist_ok=True)
+            # close() 可能在其他线程调用，因此关闭同线程检查；连接本身只在所属线程使用
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._apply_profile(conn)
+            self._local.conn = conn
+            self._local.depth = 0
+            with self._lock:
+                self._connections.append(conn)
+            # 第一个连接建立后执行尚未应用的迁移（migrate 内部通过本方法取得同一连接）
+            if not self._migrated:
+                with self._migrate_lock:
+                    if not self._migrated:
+                        self.migrate()
+                        self._migrated = True
+        return conn
+    
+    @property
+    def profile(self):
+        """连接实际使用的存储配置名称（未指定时需读取全局设置，因此会建立连接）"""
+        if self._applied_profile is None:
+            self.connection()
+        return self._applied_profile
+    
+    def _apply_profile(self, conn):
+        """在新建立的连接上应用存储配置"""
+        profile = self._profile
+        if not profile:
+            try:
+                row = conn.execute(
+                    "SELECT value FROM global_settings WHERE key = 'storage_profile'"
+                ).fetchone()
+            except sqlite3.OperationalError:
+                # 新数据库尚未建表
+                row = None
+            profile = row[0] if row and row[0] in STORAGE_PROFILES else DEFAULT_STORAGE_PROFILE
+        self._applied_profile = profile
+        
+        settings = STORAGE_PROFILES[profile]
+        # 等待锁的超时需要最先设置，切换日志模式本身也可能遇到其他进程持有的锁
+        conn.execute(f"PRAGMA busy_timeout = {int(settings['busy_timeout'])}")
+        conn.execute(f"PRAGMA journal_mode = {settings['journal_mode']}")
+        conn.execute(f"PRAGMA synchronous = {settings['synchronous']}")
+        conn.execute(f"PRAGMA mmap_size = {int(settings['mmap_size'])}")
+        conn.execute(f"PRAGMA cache_size = {int(settings['cache_size'])}")
+        conn.execute(f"PRAGMA temp_store = {settings['temp_store']}")
+    
+    def state_token(self):
+        """获取当前线程连接所见的数据库状态标识，用于判断缓存的计算结果是否过期
+        
+        本连接的写入会改变 total_changes，其他连接提交的修改会改变 data_version。
+        
+        Returns:
+            tuple: (连接标识, data_version, total_changes)
         """
-        self.db_path = db_path if db_path else DEFAULT_DB_PATH
+        conn = self.connection()
+        return id(conn), conn.execute("PRAGMA data_version").fetchone()[0], conn.total_changes
+    
+    @contextmanager
+    def transaction(self):
+        """在当前线程的连接上开启一个事务作用域
         
-        # 确保数据目录存在
-        os.makedirs(os.path.dirname(str(self.db_path)), exist_ok=True)
+        最外层作用域正常退出时提交，抛出异常时回滚；嵌套调用并入外层事务，
+        因此批量操作可以把多个方法调用合并为一次提交。
         
-        # 初始化数据库
-        self.init_database()
+        Yields:
+            sqlite3.Connection: 当前线程复用的连接
+        """
+        conn = self.connection()
+        self._local.depth += 1
+        try:
+            yield conn
+        except BaseException:
+            self._local.depth -= 1
+            if self._local.depth == 0:
+                conn.rollback()
+            raise
+        self._local.depth -= 1
+        if self._local.depth == 0:
+            conn.commit()
+    
+    def close(self):
+        """关闭所有线程上打开的连接"""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
     
     def init_database(self):
-        """初始化数据库表结构"""
-        with sqlite3.connect(self.db_path) as conn:
+        """初始化数据库表结构，执行尚未应用的迁移"""
+        self.migrate()
+    
+    def schema_version(self):
+        """获取数据库当前的结构版本号"""
+        return self.connection().execute("PRAGMA user_version").fetchone()[0]
+    
+    def migrate(self):
+        """按顺序执行所有版本高于当前结构版本的迁移
+        
+        版本已是最新时只读取一次 PRAGMA user_version。每个迁移在独立的
+        写事务中执行并同时更新版本号，多个进程同时启动时只有一个会执行迁移。
+        
+        Returns:
+            int: 迁移完成后的结构版本号
+        """
+        version = self.schema_version()
+        if version >= LATEST_VERSION:
+            return version
+        
+        conn = self.connection()
+        if version == 0:
             conn.execute("PRAGMA encoding = 'UTF-8'")
-            conn.executescript("""
-                CREATE TABLE IF NOT EXISTS employees (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    domain_account TEXT UNIQUE,
-                    gender TEXT,
-                    hometown TEXT,
-                    university TEXT,
-                    major TEXT,
-                    id_card TEXT,
-                    phone TEXT,
-                    department TEXT,
-                    position TEXT,
-                    join_date TEXT,
-                    is_active INTEGER DEFAULT 1,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(id_card),
-                    UNIQUE(phone)
-                );
-                
-                CREATE TABLE IF NOT EXISTS workload_scores (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    employee_id INTEGER,
-                    week_number INTEGER,
-                    year INTEGER,
-                    ranking_percentage REAL,
-                    score REAL,
-                    description TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (employee_id) REFERENCES employees(id)
-                );
-
-                CREATE TABLE IF NOT EXISTS promotion_scores (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    employee_id INTEGER,
-                    promotion_type TEXT CHECK(promotion_type IN ('level', 'grade')),
-                    old_value TEXT,
-                    new_value TEXT,
-                    score REAL,
-                    promotion_date TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (employee_id) REFERENCES employees(id)
-                );
-
-                CREATE TABLE IF NOT EXISTS technical_breakthrough_scores (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    employee_id INTEGER,
-                    level TEXT CHECK(level IN ('company', 'department')),
-                    project_name TEXT,
-                    description TEXT,
-                    score REAL,
-                    completion_date TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (employee_id) REFERENCES employees(id)
-                );
-
-                CREATE TABLE IF NOT EXISTS experience_case_scores (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    employee_id INTEGER,
-                    level TEXT CHECK(level IN ('company', 'other')),
-                    case_title TEXT,
-                    description TEXT,
-                    score REAL,
-                    submission_date TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (employee_id) REFERENCES employees(id)
-                );
-                
-                CREATE TABLE IF NOT EXISTS scoring_rules (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    category TEXT NOT NULL,
-                    weight REAL,
-                    description TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                );
-
-                CREATE TABLE IF NOT EXISTS global_settings (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    key TEXT NOT NULL UNIQUE,
-                    value TEXT,
-                    description TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                );
-            """)
\ No newline at end of file
+        
+        for target, _, apply in MIGRATIONS:
+            if target <= version:
+                continue
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # 获取写锁后重新读取版本号，其他进程可能已经完成了该迁移
+                if self.schema_version() >= target:
+                    conn.rollback()
+                    continue
+                apply(conn)
+                conn.execute(f"PRAGMA user_version = {int(target)}")
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+            version = target
+        return self.schema_version()
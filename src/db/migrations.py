@@ -0,0 +1,542 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""数据库结构迁移
+
+每个迁移是一个 (版本号, 说明, 执行函数) 三元组，按版本号顺序执行。
+数据库当前版本记录在 PRAGMA user_version 中，启动时只需读取该版本号，
+版本已是最新时不会执行任何 DDL。
+
+新增表结构变更时，在 MIGRATIONS 末尾追加新的迁移，不要修改已发布的迁移。
+"""
+
+import sqlite3
+
+from ..utils.dates import iso_week_start
+
+
+def run_script(conn, script):
+    """在当前事务内逐条执行 SQL 脚本
+
+    与 executescript 不同，本函数不会隐式提交事务，
+    因此迁移脚本和版本号更新可以在同一个事务中完成。
+
+    Args:
+        conn: 数据库连接
+        script: 以分号分隔的多条 SQL 语句
+    """
+    statement = ''
+    for line in script.splitlines(keepends=True):
+        statement += line
+        if sqlite3.complete_statement(statement):
+            conn.execute(statement)
+            statement = ''
+    if statement.strip():
+        conn.execute(statement)
+
+
+def _initial_schema(conn):
+    """初始表结构，并补齐跟踪器使用但此前从未创建的类别表和表现记录表"""
+    run_script(conn, """
+        CREATE TABLE IF NOT EXISTS employees (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            domain_account TEXT UNIQUE,
+            gender TEXT,
+            hometown TEXT,
+            university TEXT,
+            major TEXT,
+            id_card TEXT,
+            phone TEXT,
+            department TEXT,
+            position TEXT,
+            join_date TEXT,
+            is_active INTEGER DEFAULT 1,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(id_card),
+            UNIQUE(phone)
+        );
+
+        CREATE TABLE IF NOT EXISTS workload_scores (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            employee_id INTEGER,
+            week_number INTEGER,
+            year INTEGER,
+            ranking_percentage REAL,
+            score REAL,
+            description TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (employee_id) REFERENCES employees(id)
+        );
+
+        CREATE TABLE IF NOT EXISTS promotion_scores (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            employee_id INTEGER,
+            promotion_type TEXT CHECK(promotion_type IN ('level', 'grade')),
+            old_value TEXT,
+            new_value TEXT,
+            score REAL,
+            promotion_date TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (employee_id) REFERENCES employees(id)
+        );
+
+        CREATE TABLE IF NOT EXISTS technical_breakthrough_scores (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            employee_id INTEGER,
+            level TEXT CHECK(level IN ('company', 'department')),
+            project_name TEXT,
+            description TEXT,
+            score REAL,
+            completion_date TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (employee_id) REFERENCES employees(id)
+        );
+
+        CREATE TABLE IF NOT EXISTS experience_case_scores (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            employee_id INTEGER,
+            level TEXT CHECK(level IN ('company', 'other')),
+            case_title TEXT,
+            description TEXT,
+            score REAL,
+            submission_date TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (employee_id) REFERENCES employees(id)
+        );
+
+        CREATE TABLE IF NOT EXISTS scoring_rules (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            category TEXT NOT NULL,
+            weight REAL,
+            description TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+
+        CREATE TABLE IF NOT EXISTS global_settings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            key TEXT NOT NULL UNIQUE,
+            value TEXT,
+            description TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+
+        CREATE TABLE IF NOT EXISTS performance_categories (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE,
+            description TEXT,
+            is_active INTEGER DEFAULT 1,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+
+        CREATE TABLE IF NOT EXISTS performance_records (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            employee_id INTEGER NOT NULL,
+            category_id INTEGER NOT NULL,
+            description TEXT,
+            score REAL NOT NULL,
+            record_date TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (employee_id) REFERENCES employees(id),
+            FOREIGN KEY (category_id) REFERENCES performance_categories(id)
+        );
+    """)
+
+
+def _query_indexes(conn):
+    """为跟踪器的实际查询路径建立二级索引
+
+    索引与查询的对应关系由 tests/test_query_plans.py 中的执行计划测试保证。
+    """
+    run_script(conn, """
+        -- 员工维度的明细查询和删除：WHERE employee_id = ? AND record_date BETWEEN ? AND ?
+        CREATE INDEX IF NOT EXISTS idx_performance_records_employee_date
+            ON performance_records (employee_id, record_date);
+
+        -- 按日期范围列出记录及绩效汇总；汇总所需的列全部包含在内，无需回表
+        CREATE INDEX IF NOT EXISTS idx_performance_records_date
+            ON performance_records (record_date, employee_id, category_id, score);
+
+        -- 按类别统计和删除记录
+        CREATE INDEX IF NOT EXISTS idx_performance_records_category
+            ON performance_records (category_id);
+
+        -- 按周查询、删除工作量记录，以及按年份列出已记录的周
+        CREATE INDEX IF NOT EXISTS idx_workload_scores_week
+            ON workload_scores (year, week_number, employee_id);
+
+        -- 员工维度的工作量明细查询和删除
+        CREATE INDEX IF NOT EXISTS idx_workload_scores_employee
+            ON workload_scores (employee_id, year, week_number);
+
+        -- 删除员工时清理其晋升、技术突破和经验案例得分
+        CREATE INDEX IF NOT EXISTS idx_promotion_scores_employee
+            ON promotion_scores (employee_id);
+        CREATE INDEX IF NOT EXISTS idx_technical_breakthrough_scores_employee
+            ON technical_breakthrough_scores (employee_id);
+        CREATE INDEX IF NOT EXISTS idx_experience_case_scores_employee
+            ON experience_case_scores (employee_id);
+
+        -- 按姓名查找员工
+        CREATE INDEX IF NOT EXISTS idx_employees_name
+            ON employees (name);
+    """)
+
+
+def _workload_week_start(conn):
+    """为工作量记录增加 ISO 周一日期列，使周期过滤可以走索引范围扫描"""
+    conn.execute("ALTER TABLE workload_scores ADD COLUMN week_start TEXT")
+    weeks = conn.execute(
+        "SELECT DISTINCT year, week_number FROM workload_scores WHERE year IS NOT NULL AND week_number IS NOT NULL"
+    ).fetchall()
+    conn.executemany(
+        "UPDATE workload_scores SET week_start = ? WHERE year = ? AND week_number = ?",
+        [(iso_week_start(year, week), year, week) for year, week in weeks]
+    )
+    run_script(conn, """
+        -- 按周期过滤工作量记录：WHERE week_start BETWEEN ? AND ?；汇总所需的列全部包含在内
+        CREATE INDEX IF NOT EXISTS idx_workload_scores_week_start
+            ON workload_scores (week_start, employee_id, score);
+    """)
+
+
+def _unique_weekly_workload(conn):
+    """每名员工每周只保留一条工作量记录，重复执行 work add 时改为覆盖"""
+    run_script(conn, """
+        -- 重复录入的周保留最后一次写入的记录
+        DELETE FROM workload_scores
+        WHERE id NOT IN (
+            SELECT MAX(id) FROM workload_scores GROUP BY employee_id, year, week_number
+        );
+
+        DROP INDEX IF EXISTS idx_workload_scores_employee;
+        CREATE UNIQUE INDEX idx_workload_scores_employee
+            ON workload_scores (employee_id, year, week_number);
+    """)
+
+
+# 从明细记录重新计算汇总表内容的查询，迁移回填和一致性检查共用
+# 汇总粒度为自然月：月度周期读取一个月，季度周期读取三个月
+CATEGORY_AGGREGATE_SOURCE_SQL = """
+    SELECT employee_id, substr(record_date, 1, 7) AS period, category_id,
+           SUM(score) AS total_score, COUNT(*) AS record_count
+    FROM performance_records
+    GROUP BY employee_id, period, category_id
+"""
+
+# 工作量按周四所在月份归属，与周期过滤规则一致
+WORKLOAD_AGGREGATE_SOURCE_SQL = """
+    SELECT employee_id, strftime('%Y-%m', week_start, '+3 days') AS period,
+           SUM(score) AS total_score, COUNT(*) AS week_count
+    FROM workload_scores
+    WHERE week_start IS NOT NULL
+    GROUP BY employee_id, period
+"""
+
+
+def _score_aggregates(conn):
+    """按员工、月份、类别增量维护的得分汇总表，由触发器在明细变更时同步更新"""
+    run_script(conn, """
+        CREATE TABLE IF NOT EXISTS category_score_aggregates (
+            period TEXT NOT NULL,
+            employee_id INTEGER NOT NULL,
+            category_id INTEGER NOT NULL,
+            total_score REAL NOT NULL DEFAULT 0,
+            record_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (period, employee_id, category_id)
+        ) WITHOUT ROWID;
+
+        CREATE TABLE IF NOT EXISTS workload_score_aggregates (
+            period TEXT NOT NULL,
+            employee_id INTEGER NOT NULL,
+            total_score REAL NOT NULL DEFAULT 0,
+            week_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (period, employee_id)
+        ) WITHOUT ROWID;
+
+        CREATE TRIGGER IF NOT EXISTS trg_performance_records_aggregate_insert
+        AFTER INSERT ON performance_records
+        BEGIN
+            INSERT INTO category_score_aggregates (period, employee_id, category_id, total_score, record_count)
+            VALUES (substr(NEW.record_date, 1, 7), NEW.employee_id, NEW.category_id, NEW.score, 1)
+            ON CONFLICT (period, employee_id, category_id) DO UPDATE SET
+                total_score = total_score + excluded.total_score,
+                record_count = record_count + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_performance_records_aggregate_delete
+        AFTER DELETE ON performance_records
+        BEGIN
+            UPDATE category_score_aggregates
+            SET total_score = total_score - OLD.score, record_count = record_count - 1
+            WHERE period = substr(OLD.record_date, 1, 7)
+              AND employee_id = OLD.employee_id AND category_id = OLD.category_id;
+            DELETE FROM category_score_aggregates
+            WHERE period = substr(OLD.record_date, 1, 7)
+              AND employee_id = OLD.employee_id AND category_id = OLD.category_id
+              AND record_count <= 0;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_performance_records_aggregate_update
+        AFTER UPDATE OF employee_id, category_id, score, record_date ON performance_records
+        BEGIN
+            UPDATE category_score_aggregates
+            SET total_score = total_score - OLD.score, record_count = record_count - 1
+            WHERE period = substr(OLD.record_date, 1, 7)
+              AND employee_id = OLD.employee_id AND category_id = OLD.category_id;
+            DELETE FROM category_score_aggregates
+            WHERE period = substr(OLD.record_date, 1, 7)
+              AND employee_id = OLD.employee_id AND category_id = OLD.category_id
+              AND record_count <= 0;
+            INSERT INTO category_score_aggregates (period, employee_id, category_id, total_score, record_count)
+            VALUES (substr(NEW.record_date, 1, 7), NEW.employee_id, NEW.category_id, NEW.score, 1)
+            ON CONFLICT (period, employee_id, category_id) DO UPDATE SET
+                total_score = total_score + excluded.total_score,
+                record_count = record_count + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_workload_scores_aggregate_insert
+        AFTER INSERT ON workload_scores
+        WHEN NEW.week_start IS NOT NULL
+        BEGIN
+            INSERT INTO workload_score_aggregates (period, employee_id, total_score, week_count)
+            VALUES (strftime('%Y-%m', NEW.week_start, '+3 days'), NEW.employee_id, NEW.score, 1)
+            ON CONFLICT (period, employee_id) DO UPDATE SET
+                total_score = total_score + excluded.total_score,
+                week_count = week_count + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_workload_scores_aggregate_delete
+        AFTER DELETE ON workload_scores
+        WHEN OLD.week_start IS NOT NULL
+        BEGIN
+            UPDATE workload_score_aggregates
+            SET total_score = total_score - OLD.score, week_count = week_count - 1
+            WHERE period = strftime('%Y-%m', OLD.week_start, '+3 days') AND employee_id = OLD.employee_id;
+            DELETE FROM workload_score_aggregates
+            WHERE period = strftime('%Y-%m', OLD.week_start, '+3 days') AND employee_id = OLD.employee_id
+              AND week_count <= 0;
+        END;
+
+        -- 修改前后的周一日期可能有一个为空，拆成两个触发器分别处理旧值和新值
+        CREATE TRIGGER IF NOT EXISTS trg_workload_scores_aggregate_update_old
+        AFTER UPDATE OF employee_id, score, week_start ON workload_scores
+        WHEN OLD.week_start IS NOT NULL
+        BEGIN
+            UPDATE workload_score_aggregates
+            SET total_score = total_score - OLD.score, week_count = week_count - 1
+            WHERE period = strftime('%Y-%m', OLD.week_start, '+3 days') AND employee_id = OLD.employee_id;
+            DELETE FROM workload_score_aggregates
+            WHERE period = strftime('%Y-%m', OLD.week_start, '+3 days') AND employee_id = OLD.employee_id
+              AND week_count <= 0;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_workload_scores_aggregate_update_new
+        AFTER UPDATE OF employee_id, score, week_start ON workload_scores
+        WHEN NEW.week_start IS NOT NULL
+        BEGIN
+            INSERT INTO workload_score_aggregates (period, employee_id, total_score, week_count)
+            VALUES (strftime('%Y-%m', NEW.week_start, '+3 days'), NEW.employee_id, NEW.score, 1)
+            ON CONFLICT (period, employee_id) DO UPDATE SET
+                total_score = total_score + excluded.total_score,
+                week_count = week_count + 1;
+        END;
+    """)
+    conn.execute("DELETE FROM category_score_aggregates")
+    conn.execute("DELETE FROM workload_score_aggregates")
+    conn.execute(
+        "INSERT INTO category_score_aggregates (employee_id, period, category_id, total_score, record_count) "
+        + CATEGORY_AGGREGATE_SOURCE_SQL
+    )
+    conn.execute(
+        "INSERT INTO workload_score_aggregates (employee_id, period, total_score, week_count) "
+        + WORKLOAD_AGGREGATE_SOURCE_SQL
+    )
+
+
+def _versioned_scoring_rules(conn):
+    """评分规则按生效日期保存版本，每个类别同一生效日期只有一条规则"""
+    run_script(conn, """
+        -- 已有规则每个类别只保留最后写入的一条，视为一直有效
+        DELETE FROM scoring_rules
+        WHERE id NOT IN (SELECT MAX(id) FROM scoring_rules GROUP BY category);
+
+        ALTER TABLE scoring_rules ADD COLUMN effective_date TEXT NOT NULL DEFAULT '1970-01-01';
+
+        -- 按周期结束日期查找各类别当时生效的版本
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_scoring_rules_category_date
+            ON scoring_rules (category, effective_date);
+    """)
+
+
+def _cycle_snapshots(conn):
+    """已关闭绩效周期的得分快照，写入后不可修改"""
+    run_script(conn, """
+        CREATE TABLE IF NOT EXISTS cycle_snapshots (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            start_date TEXT NOT NULL,
+            end_date TEXT NOT NULL,
+            categories TEXT NOT NULL,
+            workload_weight REAL NOT NULL,
+            weights TEXT NOT NULL,
+            checksum TEXT NOT NULL,
+            closed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE (start_date, end_date)
+        );
+
+        CREATE TABLE IF NOT EXISTS cycle_snapshot_scores (
+            snapshot_id INTEGER NOT NULL,
+            employee_id INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            department TEXT,
+            workload_score REAL NOT NULL,
+            other_score REAL NOT NULL,
+            total_score REAL NOT NULL,
+            rank INTEGER NOT NULL,
+            percentile REAL NOT NULL,
+            PRIMARY KEY (snapshot_id, employee_id),
+            FOREIGN KEY (snapshot_id) REFERENCES cycle_snapshots(id)
+        ) WITHOUT ROWID;
+
+        CREATE TABLE IF NOT EXISTS cycle_snapshot_category_scores (
+            snapshot_id INTEGER NOT NULL,
+            employee_id INTEGER NOT NULL,
+            category TEXT NOT NULL,
+            score REAL NOT NULL,
+            PRIMARY KEY (snapshot_id, employee_id, category),
+            FOREIGN KEY (snapshot_id) REFERENCES cycle_snapshots(id)
+        ) WITHOUT ROWID;
+
+        CREATE TRIGGER IF NOT EXISTS trg_cycle_snapshots_immutable
+        BEFORE UPDATE ON cycle_snapshots
+        BEGIN
+            SELECT RAISE(ABORT, '已关闭周期的快照不可修改');
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_cycle_snapshot_scores_immutable
+        BEFORE UPDATE ON cycle_snapshot_scores
+        BEGIN
+            SELECT RAISE(ABORT, '已关闭周期的快照不可修改');
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_cycle_snapshot_category_scores_immutable
+        BEFORE UPDATE ON cycle_snapshot_category_scores
+        BEGIN
+            SELECT RAISE(ABORT, '已关闭周期的快照不可修改');
+        END;
+    """)
+
+
+def _keyset_indexes(conn):
+    """记录列表按键集分页时使用的索引，索引末尾隐含 rowid，与排序键一致"""
+    run_script(conn, """
+        -- 表现记录分页：ORDER BY record_date DESC, id DESC，WHERE (record_date, id) < (?, ?)
+        CREATE INDEX IF NOT EXISTS idx_performance_records_keyset
+            ON performance_records (record_date);
+
+        -- 工作量记录分页：ORDER BY year DESC, week_number DESC, id DESC
+        CREATE INDEX IF NOT EXISTS idx_workload_scores_keyset
+            ON workload_scores (year, week_number);
+    """)
+
+
+def _description_search(conn):
+    """表现记录和工作量记录描述的全文索引（trigram 分词，适用于中文），由触发器与明细表同步"""
+    for table in ('performance_records', 'workload_scores'):
+        run_script(conn, f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {table}_fts USING fts5(
+                description, content='{table}', content_rowid='id', tokenize='trigram'
+            );
+
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_fts_insert
+            AFTER INSERT ON {table}
+            BEGIN
+                INSERT INTO {table}_fts (rowid, description) VALUES (NEW.id, NEW.description);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_fts_delete
+            AFTER DELETE ON {table}
+            BEGIN
+                INSERT INTO {table}_fts ({table}_fts, rowid, description) VALUES ('delete', OLD.id, OLD.description);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_fts_update
+            AFTER UPDATE OF description ON {table}
+            BEGIN
+                INSERT INTO {table}_fts ({table}_fts, rowid, description) VALUES ('delete', OLD.id, OLD.description);
+                INSERT INTO {table}_fts (rowid, description) VALUES (NEW.id, NEW.description);
+            END;
+
+            -- 为已有记录建立索引
+            INSERT INTO {table}_fts ({table}_fts) VALUES ('rebuild');
+        """)
+
+
+def _snapshot_delete_guard(conn):
+    """禁止删除已关闭周期的快照：删除快照会使周期重新打开，删除得分行则无法再由校验和发现"""
+    for table in ('cycle_snapshots', 'cycle_snapshot_scores', 'cycle_snapshot_category_scores'):
+        run_script(conn, f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_undeletable
+            BEFORE DELETE ON {table}
+            BEGIN
+                SELECT RAISE(ABORT, '已关闭周期的快照不可删除');
+            END;
+        """)
+
+
+def _bulk_write_guard(conn):
+    """表现记录批量写入开关
+
+    单行表 bulk_write_guard 的 active 为 1 时，表现记录的汇总表和全文索引插入触发器跳过逐行同步，
+    由批量写入（importer.insert_records）在同一事务中整块同步后再置回 0。
+    开关只在写入事务内打开，其他连接不会看到，事务回滚时随之恢复。
+    """
+    run_script(conn, """
+        CREATE TABLE IF NOT EXISTS bulk_write_guard (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            active INTEGER NOT NULL DEFAULT 0
+        );
+
+        INSERT OR IGNORE INTO bulk_write_guard (id, active) VALUES (1, 0);
+
+        DROP TRIGGER IF EXISTS trg_performance_records_aggregate_insert;
+
+        CREATE TRIGGER trg_performance_records_aggregate_insert
+        AFTER INSERT ON performance_records
+        WHEN NOT (SELECT active FROM bulk_write_guard WHERE id = 1)
+        BEGIN
+            INSERT INTO category_score_aggregates (period, employee_id, category_id, total_score, record_count)
+            VALUES (substr(NEW.record_date, 1, 7), NEW.employee_id, NEW.category_id, NEW.score, 1)
+            ON CONFLICT (period, employee_id, category_id) DO UPDATE SET
+                total_score = total_score + excluded.total_score,
+                record_count = record_count + 1;
+        END;
+
+        DROP TRIGGER IF EXISTS trg_performance_records_fts_insert;
+
+        CREATE TRIGGER trg_performance_records_fts_insert
+        AFTER INSERT ON performance_records
+        WHEN NOT (SELECT active FROM bulk_write_guard WHERE id = 1)
+        BEGIN
+            INSERT INTO performance_records_fts (rowid, description) VALUES (NEW.id, NEW.description);
+        END;
+    """)
+
+
+# 按版本号升序排列，版本号必须连续递增
+MIGRATIONS = [
+    (1, '初始表结构', _initial_schema),
+    (2, '查询索引', _query_indexes),
+    (3, '工作量记录周一日期', _workload_week_start),
+    (4, '工作量记录按员工和周唯一', _unique_weekly_workload),
+    (5, '得分汇总表', _score_aggregates),
+    (6, '评分规则版本', _versioned_scoring_rules),
+    (7, '已关闭周期快照', _cycle_snapshots),
+    (8, '记录列表分页索引', _keyset_indexes),
+    (9, '描述全文索引', _description_search),
+    (10, '快照禁止删除', _snapshot_delete_guard),
+    (11, '表现记录批量写入开关', _bulk_write_guard),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""日期与 ISO 周相关的工具函数"""
+
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+
+def iso_week_start(year, week):
+    """获取 ISO 周的周一日期
+
+    Args:
+        year: ISO 年份
+        week: ISO 周数（1-53）
+
+    Returns:
+        str: 周一日期，格式 YYYY-MM-DD
+    """
+    # 1月4日必定落在 ISO 第1周
+    jan4 = date(year, 1, 4)
+    week1_monday = jan4 - timedelta(days=jan4.weekday())
+    return (week1_monday + timedelta(weeks=week - 1)).strftime('%Y-%m-%d')
+
+
+def cycle_week_range(start_date, end_date):
+    """获取属于指定周期的 ISO 周的周一日期范围
+
+    与 ISO 年份的归属规则一致，一周归属于其周四所在的周期，
+    因此跨年、跨月的周只会被计入一个周期。
+
+    Args:
+        start_date: 周期开始日期，格式 YYYY-MM-DD
+        end_date: 周期结束日期，格式 YYYY-MM-DD
+
+    Returns:
+        tuple: (最早的周一, 最晚的周一)，可直接用于 week_start BETWEEN ? AND ?
+    """
+    start = datetime.strptime(start_date, '%Y-%m-%d') - timedelta(days=3)
+    end = datetime.strptime(end_date, '%Y-%m-%d') - timedelta(days=3)
+    return start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')
+
+
+def month_periods(start_date, end_date):
+    """将按整月对齐的日期范围转换为汇总表的月份范围
+
+    Args:
+        start_date: 开始日期，格式 YYYY-MM-DD
+        end_date: 结束日期，格式 YYYY-MM-DD
+
+    Returns:
+        tuple|None: (起始月份, 结束月份)，格式 YYYY-MM；
+                    日期范围不是从月初到月末时返回 None
+    """
+    start = datetime.strptime(start_date, '%Y-%m-%d')
+    end = datetime.strptime(end_date, '%Y-%m-%d')
+    if start.day != 1 or (end + timedelta(days=1)).day != 1 or start > end:
+        return None
+    return start.strftime('%Y-%m'), end.strftime('%Y-%m')
+
+
+@lru_cache(maxsize=64)
+def cycle_bounds(cycle_type, day):
+    """获取指定日期所在绩效周期的起止日期
+
+    Args:
+        cycle_type: 周期类型，monthly 为月度，其他值按季度处理
+        day: 日期（datetime.date）
+
+    Returns:
+        tuple: (开始日期, 结束日期)，格式 YYYY-MM-DD
+    """
+    if cycle_type == 'monthly':
+        # 月度绩效：当月1号到月末
+        first_month = day.month
+    else:
+        # 季度绩效：当季度第一天到最后一天
+        first_month = (day.month - 1) // 3 * 3 + 1
+    start = date(day.year, first_month, 1)
+    last_month = first_month + (0 if cycle_type == 'monthly' else 2)
+    if last_month == 12:
+        end = date(day.year + 1, 1, 1)
+    else:
+        end = date(day.year, last_month + 1, 1)
+    return start.strftime('%Y-%m-%d'), (end - timedelta(days=1)).strftime('%Y-%m-%d')
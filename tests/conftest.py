@@ -7,7 +7,7 @@ from src.core.tracker import PerformanceTracker
 from src.db.database import PerformanceDB
 
 @pytest.fixture(scope="function")
-def test_db():
+def test_db(monkeypatch):
     """创建测试用的临时数据库"""
     # 使用临时目录存放测试数据库
     test_dir = "tests/temp"
@@ -15,18 +15,25 @@ def test_db():
     test_db_path = os.path.join(test_dir, "test.db")
     
     # 确保测试开始前数据库不存在
-    if os.path.exists(test_db_path):
-        os.remove(test_db_path)
+    for path in (test_db_path, test_db_path + '-wal', test_db_path + '-shm'):
+        if os.path.exists(path):
+            os.remove(path)
+    
+    # 命令行中创建的跟踪器同样使用测试数据库
+    monkeypatch.setenv('PERF_DB_PATH', test_db_path)
+    monkeypatch.delenv('PERF_DB_PROFILE', raising=False)
     
     # 初始化测试数据库
     db = PerformanceDB(test_db_path)
     db.init_database()
+    db.close()
     
     yield test_db_path
     
-    # 测试结束后清理数据库和临时目录
-    if os.path.exists(test_db_path):
-        os.remove(test_db_path)
+    # 测试结束后清理数据库（包括 WAL 日志文件）和临时目录
+    for path in (test_db_path, test_db_path + '-wal', test_db_path + '-shm'):
+        if os.path.exists(path):
+            os.remove(path)
     if os.path.exists(test_dir):
         os.rmdir(test_dir)
 
@@ -38,7 +45,9 @@ def runner():
 @pytest.fixture
 def tracker(test_db):
     """创建测试用的PerformanceTracker实例"""
-    return PerformanceTracker(test_db)
+    tracker = PerformanceTracker(test_db)
+    yield tracker
+    tracker.db.close()
 
 @pytest.fixture
 def sample_data(tracker):
@@ -64,4 +73,35 @@ def sample_data(tracker):
     # 设置绩效周期
     tracker.update_global_setting("performance_cycle", "monthly", "绩效统计周期")
     
-    return tracker 
\ No newline at end of file
+    return tracker
+
+@pytest.fixture
+def insert_record(tracker):
+    """按指定日期直接写入表现记录（add_performance_record 只能记录当天），返回记录ID"""
+    def insert(employee_id, score, record_date, category_id=1):
+        with tracker.db.transaction() as conn:
+            cursor = conn.execute(
+                "INSERT INTO performance_records (employee_id, category_id, description, score, record_date) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (employee_id, category_id, '测试记录', score, record_date)
+            )
+            return cursor.lastrowid
+    return insert
+
+@pytest.fixture
+def add_employee(tracker):
+    """添加一名测试部员工，suffix 用于生成不重复的电话和身份证号"""
+    def add(name, domain_account, suffix):
+        tracker.add_employee(
+            name=name, domain_account=domain_account, gender="女", hometown="上海",
+            university="复旦大学", major="软件工程", phone=f"1390013900{suffix}",
+            id_card=f"31010119900101000{suffix}", department="测试部",
+            position="P3-1", join_date="2023-01-01"
+        )
+    return add
+
+@pytest.fixture
+def lisi(sample_data, add_employee):
+    """在样例数据的基础上添加测试部的李四（员工ID为 2）"""
+    add_employee("李四", "lisi", 1)
+    return sample_data
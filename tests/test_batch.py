@@ -0,0 +1,148 @@
+import json
+
+import pytest
+
+from src.cli.commands import cli
+
+def _write_jsonl(path, operations):
+    path.write_text('\n'.join(json.dumps(op, ensure_ascii=False) for op in operations) + '\n', encoding='utf-8')
+    return str(path)
+
+def _record_count(tracker):
+    with tracker.db.transaction() as conn:
+        return conn.execute("SELECT COUNT(*) FROM performance_records").fetchone()[0]
+
+@pytest.fixture
+def team(sample_data):
+    tracker = sample_data
+    for name, account, phone, id_card in (('李四', 'lisi', '13800138001', '110101199001011235'),
+                                          ('王五', 'wangwu', '13800138002', '110101199001011236')):
+        tracker.add_employee(name, account, '男', '北京', '清华大学', '计算机科学', phone, id_card,
+                             '研发部', 'P3-1', '2023-01-01')
+    tracker.add_category('团队协作', '跨团队协作')
+    tracker.toggle_category_status('团队协作', False)
+    return tracker
+
+OPERATIONS = [
+    {'op': 'record', 'employee': 'zhangsan', 'category': '技术能力', 'score': 5, 'description': '完成新功能', 'date': '2024-03-01'},
+    {'op': 'toggle', 'category': '团队协作', 'active': True},
+    {'op': 'event', 'category': '团队协作', 'description': '项目按期交付', 'employees': ['lisi', 3], 'score': '+2'},
+    {'op': 'event', 'category': '技术能力', 'description': '故障复盘', 'scores': {'zhangsan': -1, 'lisi': 3}},
+    {'op': 'workload', 'year': 2024, 'week': 10, 'employees': ['wangwu', 'zhangsan', 'lisi'], 'description': '第10周'},
+    {'op': 'toggle', 'employee': 'wangwu', 'active': False},
+    {'op': 'setting', 'key': 'default_department', 'value': '测试部'},
+    {'op': 'rule', 'category': '技术能力', 'weight': 2, 'description': '加倍', 'effective_date': '2024-01-01'},
+]
+
+def test_apply_batch(team, tmp_path):
+    """测试批量操作在一个事务中执行，前面的操作对后面的校验可见"""
+    steps, errors = team.apply_batch(_write_jsonl(tmp_path / 'ops.jsonl', OPERATIONS))
+    assert errors == []
+    assert [step.kind for step in steps] == ['record', 'category', 'record', 'record', 'record', 'record',
+                                             'workload', 'employee', 'setting', 'rule']
+    assert _record_count(team) == 5
+    assert team.check_score_aggregates() == []
+    assert team.get_employee_performance_records(2, '2024-01-01', '2099-12-31') != []
+    assert [(row[1], row[5]) for row in team.get_workload_records_by_week(10, 2024)] == [
+        ('王五', 7), ('张三', 7), ('李四', 7)
+    ]
+    assert not team.get_employee(3)[12]
+    assert team.get_settings().default_department == '测试部'
+    assert team.get_scoring_rules(as_of='2024-06-01') == [('技术能力', 2.0, '加倍', '2024-01-01')]
+
+def test_apply_batch_validation_is_atomic(team, tmp_path):
+    """测试任何一个操作未通过校验时都不写入"""
+    operations = OPERATIONS[:1] + [
+        {'op': 'record', 'employee': 'lisi', 'category': '团队协作', 'score': 1, 'description': '类别未启用'},
+        {'op': 'toggle', 'employee': 'lisi', 'active': False},
+        {'op': 'workload', 'year': 2021, 'week': 53, 'employees': ['zhangsan']},
+        {'op': 'event', 'category': '技术能力', 'description': '未激活', 'employees': ['zhangsan', 'lisi'], 'score': 1},
+        {'op': 'record', 'employee': 'nobody', 'category': '技术能力', 'score': 'x', 'description': '员工不存在'},
+        {'op': 'setting', 'key': 'performance_cycle', 'value': 'weekly'},
+        {'op': 'unknown'},
+    ]
+    steps, errors = team.apply_batch(_write_jsonl(tmp_path / 'ops.jsonl', operations))
+    assert errors == [
+        (2, "类别 '团队协作' 不存在或未启用"),
+        (4, '2021 年没有第 53 周'),
+        (5, '员工 lisi 未激活'),
+        (6, '员工 nobody 不存在'),
+        (7, 'performance_cycle 的取值应为 monthly/quarterly'),
+        (8, '未知的操作类型：unknown'),
+    ]
+    assert _record_count(team) == 0
+    assert team.get_employee(2)[12]
+
+def test_apply_batch_workload_default_description(team, tmp_path):
+    """测试未指定描述的工作量排名使用与 work add 相同的默认描述"""
+    operations = [{'op': 'workload', 'year': 2024, 'week': 11, 'employees': ['zhangsan']}]
+    assert team.apply_batch(_write_jsonl(tmp_path / 'ops.jsonl', operations))[1] == []
+    assert team.get_workload_records_by_week(11, 2024)[0][6] == '2024年第11周工作量评分'
+
+def test_apply_batch_numeric_account(team, tmp_path):
+    """测试纯数字的字符串优先按域账号解析，没有该域账号时按员工ID解析"""
+    team.add_employee('赵六', '10086', '男', '北京', '清华大学', '计算机科学', '13800138003', '110101199001011237',
+                      '研发部', 'P3-1', '2023-01-01')
+    operations = [
+        {'op': 'record', 'employee': '10086', 'category': '技术能力', 'score': 1, 'description': '数字账号'},
+        {'op': 'record', 'employee': 2, 'category': '技术能力', 'score': 1, 'description': '员工ID'},
+        {'op': 'record', 'employee': '2', 'category': '技术能力', 'score': 1, 'description': '不是账号'},
+        {'op': 'record', 'employee': '99', 'category': '技术能力', 'score': 1, 'description': '不存在'},
+        {'op': 'event', 'category': '技术能力', 'description': '按ID打分', 'scores': {'1': 2, '10086': 3}},
+    ]
+    steps, errors = team.apply_batch(_write_jsonl(tmp_path / 'ops.jsonl', operations), dry_run=True)
+    assert [(step.args[0], step.args[3]) for step in steps] == [(4, 1), (2, 1), (2, 1), (1, 2), (4, 3)]
+    assert errors == [(4, '员工 99 不存在')]
+
+def test_apply_batch_rolls_back(team, tmp_path, monkeypatch):
+    """测试执行中出错时整个事务回滚"""
+    def fail(*args):
+        raise RuntimeError('写入失败')
+    monkeypatch.setattr(team, 'update_scoring_rule', fail)
+    with pytest.raises(RuntimeError):
+        team.apply_batch(_write_jsonl(tmp_path / 'ops.jsonl', OPERATIONS))
+    assert _record_count(team) == 0
+    assert team.get_employee(3)[12]
+    assert team.get_settings().default_department != '测试部'
+
+def test_apply_batch_yaml(team, tmp_path):
+    """测试读取 YAML 操作列表"""
+    pytest.importorskip('yaml')
+    path = tmp_path / 'ops.yaml'
+    path.write_text(
+        "- op: record\n  employee: zhangsan\n  category: 技术能力\n  score: 2\n  description: 代码评审\n"
+        "---\n"
+        "op: toggle\nemployee: lisi\nactive: false\n",
+        encoding='utf-8'
+    )
+    steps, errors = team.apply_batch(str(path))
+    assert errors == [] and len(steps) == 2
+    assert _record_count(team) == 1
+
+def test_batch_command(runner, team, tmp_path):
+    """测试 batch 命令的 dry-run 变更列表、执行结果和校验失败时的退出码"""
+    path = _write_jsonl(tmp_path / 'ops.jsonl', OPERATIONS)
+    result = runner.invoke(cli, ['batch', path, '--dry-run'])
+    assert result.exit_code == 0
+    assert '+ 表现记录 张三 技术能力 +5.00 2024-03-01 完成新功能' in result.output
+    assert '~ 类别 团队协作: 禁用 -> 启用' in result.output
+    assert '+ 工作量 2024年第10周 王五 0.00% +7.00' in result.output
+    assert '~ 员工 王五: 激活 -> 禁用' in result.output
+    assert '~ 设置 default_department: 未设置 -> 测试部' in result.output
+    assert '未写入' in result.output
+    assert _record_count(team) == 0
+
+    result = runner.invoke(cli, ['batch', path])
+    assert result.exit_code == 0
+    assert '已执行：表现记录 5 项，工作量排名 1 项' in result.output
+    assert _record_count(team) == 5
+
+    bad = _write_jsonl(tmp_path / 'bad.jsonl', [{'op': 'record', 'employee': 'zhangsan'}])
+    result = runner.invoke(cli, ['batch', bad])
+    assert result.exit_code == 1
+    assert '第 1 条：缺少字段：category, score, description' in result.output
+
+    (tmp_path / 'broken.jsonl').write_text('{"op": \n', encoding='utf-8')
+    result = runner.invoke(cli, ['batch', str(tmp_path / 'broken.jsonl')])
+    assert result.exit_code == 1
+    assert '第 1 行不是有效的 JSON' in result.output
@@ -0,0 +1,131 @@
+import sqlite3
+import threading
+import pytest
+from src.db.database import PerformanceDB
+from src.db.migrations import LATEST_VERSION
+
+def test_connection_reused(test_db):
+    """测试同一线程内复用同一个连接"""
+    db = PerformanceDB(test_db)
+    assert db.connection() is db.connection()
+    with db.transaction() as conn:
+        assert conn is db.connection()
+    db.close()
+
+def test_connection_per_thread(test_db):
+    """测试不同线程使用各自的连接"""
+    db = PerformanceDB(test_db)
+    main_conn = db.connection()
+    other = []
+    thread = threading.Thread(target=lambda: other.append(db.connection()))
+    thread.start()
+    thread.join()
+    assert other[0] is not main_conn
+    db.close()
+
+def test_transaction_rollback(test_db):
+    """测试事务作用域内出错时回滚"""
+    db = PerformanceDB(test_db)
+    with pytest.raises(RuntimeError):
+        with db.transaction() as conn:
+            conn.execute("INSERT INTO global_settings (key, value) VALUES ('a', '1')")
+            raise RuntimeError
+    with db.transaction() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM global_settings").fetchone()[0] == 0
+    db.close()
+
+def test_nested_transaction_commits_once(test_db):
+    """测试嵌套事务并入外层事务，最外层退出时才提交"""
+    db = PerformanceDB(test_db)
+    with db.transaction() as conn:
+        with db.transaction() as inner:
+            inner.execute("INSERT INTO global_settings (key, value) VALUES ('a', '1')")
+        # 内层退出后尚未提交，其他连接看不到
+        with sqlite3.connect(test_db) as other:
+            assert other.execute("SELECT COUNT(*) FROM global_settings").fetchone()[0] == 0
+    with sqlite3.connect(test_db) as other:
+        assert other.execute("SELECT COUNT(*) FROM global_settings").fetchone()[0] == 1
+    db.close()
+
+def test_migrate_fresh_database(test_db):
+    """测试新数据库迁移到最新版本并创建全部表"""
+    db = PerformanceDB(test_db)
+    assert db.schema_version() == LATEST_VERSION
+    tables = {row[0] for row in db.connection().execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table'"
+    )}
+    assert {'employees', 'performance_categories', 'performance_records', 'workload_scores'} <= tables
+    db.close()
+
+def test_migrate_current_only_reads_version(test_db):
+    """测试结构已是最新时启动只读取版本号"""
+    db = PerformanceDB(test_db)
+    statements = []
+    db.connection().set_trace_callback(statements.append)
+    db.migrate()
+    assert statements == ['PRAGMA user_version']
+    db.close()
+
+def test_migrate_legacy_database(tmp_path):
+    """测试未记录版本号的旧数据库升级后保留原有数据"""
+    db_path = str(tmp_path / 'legacy.db')
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE employees (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, "
+                     "domain_account TEXT UNIQUE, is_active INTEGER DEFAULT 1)")
+        conn.execute("INSERT INTO employees (name, domain_account) VALUES ('张三', 'zhangsan')")
+    conn.close()
+    db = PerformanceDB(db_path)
+    assert db.schema_version() == LATEST_VERSION
+    assert db.connection().execute("SELECT name FROM employees").fetchall() == [('张三',)]
+    db.close()
+
+def _pragma(db, name):
+    return db.connection().execute(f"PRAGMA {name}").fetchone()[0]
+
+def test_default_storage_profile(test_db):
+    """测试默认存储配置启用 WAL 和忙等待"""
+    db = PerformanceDB(test_db)
+    assert db.profile == 'default'
+    assert _pragma(db, 'journal_mode') == 'wal'
+    assert _pragma(db, 'busy_timeout') == 5000
+    db.close()
+
+def test_storage_profile_from_env(test_db, monkeypatch):
+    """测试通过环境变量选择存储配置"""
+    monkeypatch.setenv('PERF_DB_PROFILE', 'legacy')
+    db = PerformanceDB(test_db)
+    assert db.profile == 'legacy'
+    assert _pragma(db, 'journal_mode') == 'delete'
+    db.close()
+
+def test_storage_profile_from_settings(test_db):
+    """测试通过全局设置选择存储配置"""
+    db = PerformanceDB(test_db)
+    with db.transaction() as conn:
+        conn.execute("INSERT INTO global_settings (key, value) VALUES ('storage_profile', 'durable')")
+    db.close()
+    db = PerformanceDB(test_db)
+    assert db.profile == 'durable'
+    assert _pragma(db, 'synchronous') == 2  # FULL
+    db.close()
+
+def test_unknown_storage_profile(test_db):
+    """测试未知的存储配置"""
+    with pytest.raises(ValueError):
+        PerformanceDB(test_db, profile='unknown')
+
+def test_migrate_dedupes_scoring_rules(tmp_path):
+    """测试旧数据库中重复写入的评分规则只保留最后一条，并视为一直有效"""
+    db_path = str(tmp_path / 'legacy.db')
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE scoring_rules (id INTEGER PRIMARY KEY AUTOINCREMENT, category TEXT NOT NULL, "
+                     "weight REAL, description TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)")
+        conn.executemany("INSERT INTO scoring_rules (category, weight, description) VALUES (?, ?, ?)",
+                         [('技术能力', 1.0, '旧'), ('技术能力', 2.0, '新'), ('工作承担', 0.5, '')])
+    conn.close()
+    db = PerformanceDB(db_path)
+    rows = db.connection().execute(
+        "SELECT category, weight, effective_date FROM scoring_rules ORDER BY category"
+    ).fetchall()
+    assert rows == [('工作承担', 0.5, '1970-01-01'), ('技术能力', 2.0, '1970-01-01')]
+    db.close()
@@ -0,0 +1,103 @@
+import io
+import json
+
+import pandas as pd
+import pytest
+
+from src.cli.commands import cli
+
+START, END = '2024-01-01', '2024-01-31'
+
+def _insert_record(tracker, employee_id, score, record_date, description='测试记录', created_at='2024-01-10 09:00:00'):
+    with tracker.db.transaction() as conn:
+        cursor = conn.execute(
+            "INSERT INTO performance_records (employee_id, category_id, description, score, record_date, created_at) "
+            "VALUES (?, 1, ?, ?, ?, ?)",
+            (employee_id, description, score, record_date, created_at)
+        )
+        return cursor.lastrowid
+
+@pytest.fixture
+def records(sample_data):
+    """三条表现记录，描述中包含逗号、引号和换行"""
+    tracker = sample_data
+    _insert_record(tracker, 1, 5, '2024-01-10', '上线, "重构"\n复盘')
+    _insert_record(tracker, 1, 3, '2024-01-12', created_at='2024-01-12 09:00:00')
+    _insert_record(tracker, 1, 2, '2024-01-15', created_at='2024-01-15 09:00:00')
+    return tracker
+
+def test_export_csv_in_chunks(records, tmp_path):
+    """测试分块导出 CSV 只写一次表头，内容可原样读回"""
+    output = tmp_path / 'records.csv'
+    assert records.export_data('records', 'csv', str(output), chunk_size=2) == (3, 3)
+    frame = pd.read_csv(output)
+    assert frame['id'].tolist() == [1, 2, 3]
+    assert frame['score'].tolist() == [5.0, 3.0, 2.0]
+    assert frame['description'][0] == '上线, "重构"\n复盘'
+    assert frame['employee_name'].unique().tolist() == ['张三']
+
+def test_export_ndjson_since(records):
+    """测试按ID或 created_at 增量导出"""
+    stream = io.StringIO()
+    assert records.export_data('records', 'ndjson', stream, since=1) == (2, 3)
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line['id'] for line in lines] == [2, 3]
+
+    stream = io.StringIO()
+    assert records.export_data('records', 'ndjson', stream, since='2024-01-12 09:00:00') == (1, 3)
+    assert json.loads(stream.getvalue())['score'] == 2.0
+
+    stream = io.StringIO()
+    assert records.export_data('records', 'ndjson', stream, since=3) == (0, None)
+    assert stream.getvalue() == ''
+
+@pytest.mark.parametrize('chunks', ['pandas', 'none'])
+def test_export_empty_csv_has_header(records, monkeypatch, chunks):
+    """测试没有数据时 CSV 仍写出表头，包括分块读取空结果时不生成任何块的 pandas 版本"""
+    if chunks == 'none':
+        monkeypatch.setattr(pd, 'read_sql_query', lambda *args, **kwargs: iter([]))
+    stream = io.StringIO()
+    assert records.export_data('records', 'csv', stream, since=3) == (0, None)
+    assert stream.getvalue().splitlines() == [
+        'id,employee_id,domain_account,employee_name,category,score,description,record_date,created_at'
+    ]
+
+def test_export_summary(records):
+    """测试导出周期统计，不支持增量导出"""
+    stream = io.StringIO()
+    assert records.export_data('summary', 'csv', stream, cycle=(START, END)) == (1, None)
+    frame = pd.read_csv(io.StringIO(stream.getvalue()))
+    assert frame.columns.tolist() == [
+        'start_date', 'end_date', 'employee_id', 'name', 'department', 'workload',
+        '技术能力', 'total', 'rank', 'percentile'
+    ]
+    assert frame['total'].tolist() == [10.0]
+
+    with pytest.raises(ValueError):
+        records.export_data('summary', 'csv', io.StringIO(), since=1, cycle=(START, END))
+    with pytest.raises(ValueError):
+        records.export_data('unknown', 'csv', io.StringIO())
+    with pytest.raises(ValueError):
+        records.export_data('records', 'xml', io.StringIO())
+
+def test_export_parquet(records, tmp_path):
+    """测试逐块写入 Parquet"""
+    pytest.importorskip('pyarrow')
+    output = tmp_path / 'records.parquet'
+    assert records.export_data('records', 'parquet', str(output), chunk_size=1) == (3, 3)
+    assert pd.read_parquet(output)['id'].tolist() == [1, 2, 3]
+
+def test_export_command(runner, records, tmp_path):
+    """测试 export 命令输出到文件并提示下次增量导出的起点"""
+    output = tmp_path / 'employees.csv'
+    result = runner.invoke(cli, ['export', 'employees', '-o', str(output)])
+    assert result.exit_code == 0
+    assert '已导出 1 行，最后一行ID：1' in result.output
+    assert pd.read_csv(output)['domain_account'].tolist() == ['zhangsan']
+
+    result = runner.invoke(cli, ['export', 'records', '-f', 'ndjson', '--since', '2'])
+    assert result.exit_code == 0
+    assert '"id":3' in result.output
+
+    result = runner.invoke(cli, ['export', 'records', '--since', '1', '--start', START, '--end', END, '-f', 'parquet'])
+    assert '导出失败' in result.output
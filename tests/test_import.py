@@ -0,0 +1,146 @@
+import json
+
+import pandas as pd
+import pytest
+
+from src.cli.commands import cli
+
+def _write_csv(path, rows):
+    pd.DataFrame(rows).to_csv(path, index=False)
+    return str(path)
+
+def test_import_employees_rejects_duplicates(sample_data, tmp_path):
+    """测试导入员工时拒绝与已有员工或文件中前面的行重复的域账号、电话、身份证号"""
+    tracker = sample_data
+    tracker.update_global_setting('default_department', '测试部', '默认部门')
+    path = _write_csv(tmp_path / 'employees.csv', [
+        {'name': '李四', 'domain_account': 'lisi', 'phone': '013900139001', 'id_card': '', 'department': ''},
+        {'name': '王五', 'domain_account': 'zhangsan', 'phone': '', 'id_card': '', 'department': ''},
+        {'name': '赵六', 'domain_account': 'zhaoliu', 'phone': '013900139001', 'id_card': '', 'department': ''},
+        {'name': '', 'domain_account': 'sunqi', 'phone': '', 'id_card': '', 'department': ''},
+        {'name': '周八', 'domain_account': 'zhouba', 'phone': '', 'id_card': '', 'department': '研发部'},
+    ])
+    rejects = tmp_path / 'rejects.csv'
+    assert tracker.import_data('employees', path, rejects=str(rejects), chunk_size=2) == (2, 3)
+
+    lisi = tracker.get_employee(tracker.get_employee_id_by_account('lisi'))
+    assert lisi[7] == '013900139001'
+    assert lisi[8] is None
+    assert lisi[9] == '测试部'
+    assert tracker.get_employee_id_by_account('zhouba') is not None
+
+    rejected = pd.read_csv(rejects)
+    assert rejected['row'].tolist() == [2, 3, 4]
+    assert rejected['reason'].tolist() == ['域账号已存在', '电话已存在', '姓名为空']
+
+def test_import_records(sample_data, tmp_path):
+    """测试导入表现记录，校验员工、类别、分值和日期，并同步更新汇总表"""
+    tracker = sample_data
+    tracker.add_category('团队协作', '跨团队协作')
+    tracker.toggle_category_status('团队协作', False)
+    tracker.add_employee(
+        name="李四", domain_account="lisi", gender="女", hometown="上海",
+        university="复旦大学", major="软件工程", phone="13900139001",
+        id_card="310101199001010001", department="测试部",
+        position="P3-1", join_date="2023-01-01"
+    )
+    tracker.toggle_employee_status(2, False)
+    path = tmp_path / 'records.jsonl'
+    lines = [
+        {'domain_account': 'zhangsan', 'category': '技术能力', 'score': 5, 'description': '上线', 'record_date': '2024-01-10'},
+        {'domain_account': 'zhangsan', 'category': '技术能力', 'score': -2, 'description': '', 'record_date': '2024-01-20'},
+        {'domain_account': 'lisi', 'category': '技术能力', 'score': 3, 'description': '', 'record_date': '2024-01-10'},
+        {'domain_account': 'nobody', 'category': '技术能力', 'score': 3, 'description': '', 'record_date': '2024-01-10'},
+        {'domain_account': 'zhangsan', 'category': '团队协作', 'score': 3, 'description': '', 'record_date': '2024-01-10'},
+        {'domain_account': 'zhangsan', 'category': '不存在', 'score': 3, 'description': '', 'record_date': '2024-01-10'},
+        {'domain_account': 'zhangsan', 'category': '技术能力', 'score': 'x', 'description': '', 'record_date': '2024-01-10'},
+        {'domain_account': 'zhangsan', 'category': '技术能力', 'score': 1, 'description': '', 'record_date': '2024-02-30'},
+    ]
+    path.write_text('\n'.join(json.dumps(line, ensure_ascii=False) for line in lines), encoding='utf-8')
+    rejects = tmp_path / 'rejects.csv'
+    schema_version = tracker.db.connection().execute("PRAGMA schema_version").fetchone()[0]
+    assert tracker.import_data('records', str(path), rejects=str(rejects)) == (2, 6)
+    # 导入不修改表结构，其他连接已准备的语句不会失效
+    assert tracker.db.connection().execute("PRAGMA schema_version").fetchone()[0] == schema_version
+    assert pd.read_csv(rejects)['reason'].tolist() == [
+        '员工未激活', '员工不存在', '类别未启用', '类别不存在', '分值不是数字', '记录日期格式错误，应为 YYYY-MM-DD'
+    ]
+
+    summary, _ = tracker.get_performance_summary('2024-01-01', '2024-01-31')
+    assert summary[0][:2] == (1, '张三') and summary[0][-1] == 3.0
+    assert tracker.check_score_aggregates() == []
+    # 导入结束后批量写入开关已关闭，逐条添加的记录仍由触发器同步
+    assert tracker.db.connection().execute("SELECT active FROM bulk_write_guard").fetchone()[0] == 0
+    tracker.add_performance_record(1, '技术能力', '逐条添加', 1)
+    assert tracker.check_score_aggregates() == []
+
+def test_import_workload_replaces_weeks(sample_data, tmp_path):
+    """测试导入工作量排名按周计算得分，并整体替换文件中出现的周"""
+    tracker = sample_data
+    for i in range(1, 4):
+        tracker.add_employee(
+            name=f"员工{i}", domain_account=f"user{i}", gender="女", hometown="上海",
+            university="复旦大学", major="软件工程", phone=f"1390013900{i}",
+            id_card=f"31010119900101000{i}", department="测试部",
+            position="P3-1", join_date="2023-01-01"
+        )
+    tracker.replace_weekly_workload(2, 2024, [4, 1], '旧排名')
+    path = _write_csv(tmp_path / 'workload.csv', [
+        {'year': 2024, 'week': 2, 'domain_account': 'user1', 'rank': 2},
+        {'year': 2024, 'week': 2, 'domain_account': 'zhangsan', 'rank': 3},
+        {'year': 2024, 'week': 2, 'domain_account': 'user2', 'rank': 1},
+        {'year': 2024, 'week': 2, 'domain_account': 'user2', 'rank': 4},
+        {'year': 2024, 'week': 3, 'domain_account': 'user3', 'rank': 1},
+        {'year': 2024, 'week': 54, 'domain_account': 'user3', 'rank': 1},
+    ])
+    assert tracker.import_data('workload', path) == (4, 2)
+
+    # 旧排名中不在文件里的员工3被移除，三人中前 30% 不足一人，均得 7 分
+    week = [(row[1], row[4], row[5], row[6]) for row in tracker.get_workload_records_by_week(2, 2024)]
+    assert week == [
+        ('员工2', 0.0, 7.0, '2024年第2周工作量评分'),
+        ('员工1', pytest.approx(100 / 3), 7.0, '2024年第2周工作量评分'),
+        ('张三', pytest.approx(200 / 3), 7.0, '2024年第2周工作量评分'),
+    ]
+    assert len(tracker.get_workload_records_by_week(3, 2024)) == 1
+    assert tracker.check_score_aggregates() == []
+
+def test_import_rejects_closed_cycle(lisi, tmp_path):
+    """测试日期或所在周落在已关闭周期内的行写入拒绝文件，原有数据不变"""
+    tracker = lisi
+    tracker.replace_weekly_workload(2, 2024, [2], '旧排名')
+    tracker.close_performance_cycle('2024-01-01', '2024-01-31')
+
+    path = _write_csv(tmp_path / 'records.csv', [
+        {'domain_account': 'zhangsan', 'category': '技术能力', 'score': '+1', 'record_date': '2024-01-10'},
+        {'domain_account': 'zhangsan', 'category': '技术能力', 'score': '+2', 'record_date': '2024-02-05'},
+    ])
+    rejects = tmp_path / 'record_rejects.csv'
+    assert tracker.import_data('records', path, rejects=str(rejects)) == (1, 1)
+    assert pd.read_csv(rejects)['reason'].tolist() == ['记录日期所在的绩效周期已关闭']
+    assert [row[6] for row in tracker.get_all_performance_records()] == ['2024-02-05']
+
+    # 2024 年第 5 周的周四为 2 月 1 日，不属于一月份
+    path = _write_csv(tmp_path / 'workload.csv', [
+        {'year': 2024, 'week': 2, 'domain_account': 'zhangsan', 'rank': 1},
+        {'year': 2024, 'week': 5, 'domain_account': 'zhangsan', 'rank': 1},
+    ])
+    rejects = tmp_path / 'workload_rejects.csv'
+    assert tracker.import_data('workload', path, rejects=str(rejects)) == (1, 1)
+    assert pd.read_csv(rejects)['reason'].tolist() == ['该周所在的绩效周期已关闭']
+    assert [row[1] for row in tracker.get_workload_records_by_week(2, 2024)] == ['李四']
+    assert [row[1] for row in tracker.get_workload_records_by_week(5, 2024)] == ['张三']
+
+def test_import_command(runner, sample_data, tmp_path):
+    """测试 import 命令输出导入和拒绝的行数"""
+    path = _write_csv(tmp_path / 'records.csv', [
+        {'domain_account': 'zhangsan', 'category': '技术能力', 'score': '+3'},
+        {'domain_account': 'zhangsan', 'category': '不存在', 'score': '+1'},
+    ])
+    result = runner.invoke(cli, ['import', 'records', path])
+    assert result.exit_code == 0
+    assert '已导入 1 行' in result.output
+    assert f'拒绝 1 行，详见 {path}.rejects.csv' in result.output
+
+    result = runner.invoke(cli, ['import', 'workload', path])
+    assert '导入失败：缺少必需的列：year, week, rank' in result.output
@@ -0,0 +1,106 @@
+"""跟踪器查询的执行计划回归测试
+
+对每个跟踪器方法记录其实际执行的 SQL，逐条运行 EXPLAIN QUERY PLAN，
+若计划中出现未被允许的全表扫描（SCAN）则失败。
+"""
+import pytest
+
+START, END = '2024-01-01', '2024-03-31'
+
+# (方法名, 参数, 允许全表扫描的表或别名)
+# 仅列出整张维度表（包括加载维度缓存）、或按设计需要遍历全部员工的查询才允许扫描
+QUERY_CASES = [
+    ('get_all_employees', (), {'employees'}),
+    ('get_employee_by_name', ('张三',), set()),
+    ('get_employee_detail', (1,), {'employees'}),
+    ('get_workload_record', (1, 2024), set()),
+    ('get_workload_summary', (START, END), set()),
+    ('get_workload_details', (START, END), set()),
+    ('get_performance_summary', (START, END), {'employees', 'performance_categories', 'scoring_rules'}),
+    ('get_performance_summary', ('2024-01-05', '2024-03-20'), {'employees', 'performance_categories', 'scoring_rules'}),
+    ('get_employee_workload_detail', (1, START, END), set()),
+    ('get_employee_performance_detail', (1, START, END), set()),
+    ('get_current_performance_cycle', (), set()),
+    ('get_settings', (), set()),
+    ('get_active_categories', (), {'performance_categories'}),
+    ('get_all_categories', (), {'performance_categories'}),
+    ('get_category_status', ('技术能力',), {'performance_categories'}),
+    ('get_category_detail', ('技术能力',), set()),
+    ('get_category_record_count', ('技术能力',), set()),
+    ('get_category_by_id', (1,), {'performance_categories'}),
+    ('get_category_by_name', ('技术能力',), {'performance_categories'}),
+    ('get_performance_record', (1,), set()),
+    ('get_employee_performance_records', (1, START, END), set()),
+    ('get_all_performance_records', (START, END), set()),
+    ('get_all_workload_records', (START, END), set()),
+    ('get_workload_records_by_week', (1, 2024), set()),
+    ('get_workload_weeks', (2024,), set()),
+    ('search_records', ('完成新功能', START, END), set()),
+    ('search_records', ('完成 功能', START, END), set()),
+    ('get_scoring_rules', (), {'scoring_rules'}),
+    ('get_scoring_rules', ('2024-03-31',), {'scoring_rules'}),
+    ('close_performance_cycle', (START, END), {'employees', 'performance_categories', 'scoring_rules'}),
+    ('get_closed_cycles', (), {'s'}),
+    ('get_closed_cycles', (2024,), set()),
+    ('verify_cycle_snapshot', (1,), set()),
+    ('get_cycle_report', (2024,), set()),
+    ('add_performance_records_bulk', ('技术能力', [(1, 2.0)], '团队事件'), {'employees', 'performance_categories'}),
+    ('replace_weekly_workload', (1, 2024, [1], '2024年第1周工作量评分'), set()),
+    ('update_performance_record', (1, 3.0, '修改'), set()),
+    ('toggle_category_status', ('技术能力', True), set()),
+    ('toggle_employee_status', (1, True), set()),
+    ('delete_performance_record', (1,), set()),
+    ('delete_workload_records', (1, 2024), set()),
+    ('delete_category', ('技术能力',), set()),
+    ('delete_employee', (1,), set()),
+]
+
+
+@pytest.fixture
+def plan_data(sample_data):
+    """添加覆盖各查询路径所需的记录"""
+    tracker = sample_data
+    tracker.add_performance_record(1, '技术能力', '完成新功能开发', 5)
+    tracker.add_workload_score(1, 1, 2024, 0.0, 10, '2024年第1周工作量评分')
+    return tracker
+
+
+def capture_statements(tracker, method, args):
+    """执行跟踪器方法并返回其执行过的 SQL 语句（参数已展开）
+
+    执行前清空维度缓存，使缓存的加载查询同样被检查。
+    """
+    tracker.dimensions.invalidate()
+    statements = []
+    conn = tracker.db.connection()
+    conn.set_trace_callback(statements.append)
+    try:
+        getattr(tracker, method)(*args)
+    finally:
+        conn.set_trace_callback(None)
+    return [
+        sql for sql in statements
+        if sql.lstrip().split(None, 1)[0].upper() in ('SELECT', 'WITH', 'UPDATE', 'DELETE', 'INSERT')
+    ]
+
+
+def full_scans(conn, sql):
+    """返回语句执行计划中的全表扫描对象"""
+    scans = []
+    for row in conn.execute(f'EXPLAIN QUERY PLAN {sql}'):
+        detail = row[3]
+        # 带 MATCH 约束的 FTS5 虚拟表访问是索引查找（INDEX n:M...），不算全表扫描
+        if detail.startswith('SCAN ') and 'CONSTANT ROW' not in detail and ':M' not in detail:
+            scans.append(detail.split()[1])
+    return scans
+
+
+@pytest.mark.parametrize('method, args, allowed', QUERY_CASES, ids=[case[0] for case in QUERY_CASES])
+def test_query_plan_uses_indexes(plan_data, method, args, allowed):
+    """测试跟踪器查询不会退化为全表扫描"""
+    statements = capture_statements(plan_data, method, args)
+    assert statements, f'{method} 未执行任何查询'
+    conn = plan_data.db.connection()
+    for sql in statements:
+        unexpected = [name for name in full_scans(conn, sql) if name not in allowed]
+        assert not unexpected, f'{method} 出现全表扫描 {unexpected}:\n{sql}'
@@ -0,0 +1,60 @@
+import pytest
+
+@pytest.fixture
+def scored(sample_data, insert_record):
+    """两个月份的表现记录和跨月的工作量记录"""
+    tracker = sample_data
+    tracker.add_category("团队协作", "跨团队协作")
+    insert_record(1, 5, '2024-01-10')
+    insert_record(1, -2, '2024-01-20')
+    insert_record(1, 3, '2024-02-01', category_id=2)
+    # 2024年第5周（01-29 至 02-04）的周四是 02-01，归入二月
+    tracker.add_workload_score(1, 5, 2024, 0.0, 10, '2024年第5周工作量评分')
+    tracker.add_workload_score(1, 4, 2024, 0.0, 8, '2024年第4周工作量评分')
+    return tracker
+
+def _summary(tracker, start_date, end_date):
+    rows, categories = tracker.get_performance_summary(start_date, end_date)
+    return [dict(zip(['id', 'name', 'dept', 'workload', *categories, 'total'], row)) for row in rows]
+
+def test_summary_reads_monthly_aggregates(scored):
+    """测试整月对齐的周期从汇总表读取"""
+    january = _summary(scored, '2024-01-01', '2024-01-31')[0]
+    assert (january['workload'], january['技术能力'], january['团队协作'], january['total']) == (8, 3, 0, 11)
+    quarter = _summary(scored, '2024-01-01', '2024-03-31')[0]
+    assert (quarter['workload'], quarter['技术能力'], quarter['团队协作'], quarter['total']) == (18, 3, 3, 24)
+    # 非整月对齐的范围从明细计算，结果一致
+    assert _summary(scored, '2024-01-01', '2024-03-30') == [quarter]
+
+def test_aggregates_follow_updates_and_deletes(scored, insert_record):
+    """测试明细的修改和删除同步到汇总表"""
+    tracker = scored
+    record_id = insert_record(1, 4, '2024-03-05')
+    tracker.update_performance_record(record_id, 6, '修改后')
+    with tracker.db.transaction() as conn:
+        conn.execute("UPDATE performance_records SET record_date = '2024-02-10' WHERE id = ?", (record_id,))
+    tracker.add_workload_score(1, 5, 2024, 0.0, 7, '重新录入')
+    tracker.delete_workload_records(4, 2024)
+    assert tracker.check_score_aggregates() == []
+
+    february = _summary(tracker, '2024-02-01', '2024-02-29')[0]
+    assert (february['workload'], february['技术能力'], february['团队协作']) == (7, 6, 3)
+
+    tracker.delete_performance_record(record_id)
+    tracker.delete_category('团队协作')
+    assert tracker.check_score_aggregates() == []
+    with tracker.db.transaction() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM category_score_aggregates WHERE period = '2024-02'").fetchone()[0] == 0
+
+def test_check_and_rebuild_aggregates(scored):
+    """测试一致性检查发现偏差，并可从明细重建"""
+    tracker = scored
+    with tracker.db.transaction() as conn:
+        conn.execute("UPDATE workload_score_aggregates SET total_score = 0 WHERE period = '2024-02'")
+        conn.execute("DELETE FROM category_score_aggregates WHERE period = '2024-01'")
+    mismatches = tracker.check_score_aggregates()
+    assert ('workload_score_aggregates', ('2024-02', 1), (10.0, 1), (0.0, 1)) in mismatches
+    assert ('category_score_aggregates', ('2024-01', 1, 1), (3.0, 2), None) in mismatches
+
+    tracker.rebuild_score_aggregates()
+    assert tracker.check_score_aggregates() == []
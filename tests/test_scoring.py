@@ -0,0 +1,159 @@
+import sqlite3
+
+import numpy as np
+import pytest
+
+from src.cli.commands import cli
+
+START, END = '2024-01-01', '2024-01-31'
+
+@pytest.fixture
+def team(lisi, add_employee, insert_record):
+    """三名员工，其中两人总分相同"""
+    tracker = lisi
+    add_employee("王五", "wangwu", 2)
+    tracker.add_category("团队协作", "跨团队协作")
+    for employee_id, score in [(1, 5), (2, 3), (3, 3)]:
+        insert_record(employee_id, score, '2024-01-10')
+    insert_record(1, 1, '2024-01-12', category_id=2)
+    return tracker
+
+def test_cycle_scores_ranks_and_percentiles(team):
+    """测试总分、并列排名与百分位"""
+    scores = team.get_cycle_scores(START, END)
+    assert scores.employee_ids.tolist() == [1, 2, 3]
+    assert scores.categories == ['团队协作', '技术能力']
+    assert scores.matrix.tolist() == [[1, 5], [0, 3], [0, 3]]
+    assert scores.totals.tolist() == [6, 3, 3]
+    assert scores.ranks.tolist() == [1, 2, 2]
+    assert np.allclose(scores.percentiles, [200 / 3, 0, 0])
+    # 并列时按员工ID顺序输出
+    assert [row[0] for row in scores.rows()] == [1, 2, 3]
+    assert scores.index_of(3) == 2
+    assert scores.index_of(99) is None
+
+def test_cycle_scores_exclude_inactive_and_keep_disabled_totals(team):
+    """测试离职员工不参与统计，禁用类别的得分仍计入总分"""
+    team.toggle_employee_status(3, False)
+    team.toggle_category_status('团队协作', False)
+    scores = team.get_cycle_scores(START, END)
+    assert scores.employee_ids.tolist() == [1, 2]
+    assert scores.categories == ['技术能力']
+    assert scores.totals.tolist() == [6, 3]
+    assert team.get_performance_summary(START, END) == (
+        [(1, '张三', '研发部', 0.0, 5.0, 6.0), (2, '李四', '测试部', 0.0, 3.0, 3.0)],
+        ['技术能力']
+    )
+
+def test_cycle_scores_reused_until_data_changes(team, insert_record):
+    """测试数据未变化时复用已加载的周期得分，本连接或其他连接写入后重新加载"""
+    first = team.get_cycle_scores(START, END)
+    assert team.get_cycle_scores(START, END) is first
+
+    insert_record(2, 4, '2024-01-20')
+    second = team.get_cycle_scores(START, END)
+    assert second is not first
+    assert second.totals.tolist() == [6, 7, 3]
+    assert second.ranks.tolist() == [2, 1, 3]
+
+    with sqlite3.connect(team.db.db_path) as conn:
+        conn.execute(
+            "INSERT INTO performance_records (employee_id, category_id, description, score, record_date) "
+            "VALUES (3, 1, '外部写入', 10, '2024-01-25')"
+        )
+    third = team.get_cycle_scores(START, END)
+    assert third is not second
+    assert third.totals.tolist() == [6, 7, 13]
+
+def test_scoring_rules_weight_totals(team):
+    """测试评分规则的权重参与总分计算，类别得分列保持原始分值"""
+    team.update_scoring_rule('技术能力', 2.0, '技术优先', '2024-01-01')
+    team.update_scoring_rule('工作承担', 0.5, '工作量减半', '2024-01-01')
+    team.add_workload_score(2, 2, 2024, 0.0, 10, '2024年第2周工作量评分')
+    scores = team.get_cycle_scores(START, END)
+    assert scores.weighted
+    assert scores.workload_weight == 0.5
+    assert scores.weights.tolist() == [1.0, 2.0]
+    assert scores.matrix.tolist() == [[1, 5], [0, 3], [0, 3]]
+    assert scores.totals.tolist() == [11, 11, 6]
+    # 禁用类别同样按其权重计入总分
+    team.toggle_category_status('技术能力', False)
+    assert team.get_cycle_scores(START, END).totals.tolist() == [11, 11, 6]
+
+def test_scoring_rules_versioned_by_effective_date(team):
+    """测试周期使用结束日期当时生效的规则版本，同一生效日期重复设置时覆盖"""
+    team.update_scoring_rule('技术能力', 2.0, '第一版', '2024-01-01')
+    team.update_scoring_rule('技术能力', 3.0, '第二版', '2024-02-01')
+    team.update_scoring_rule('技术能力', 4.0, '第二版修订', '2024-02-01')
+    assert team.get_cycle_scores(START, END).totals.tolist() == [11, 6, 6]
+    assert team.get_cycle_scores('2024-01-01', '2024-02-29').totals.tolist() == [21, 12, 12]
+    assert team.get_scoring_rules() == [
+        ('技术能力', 2.0, '第一版', '2024-01-01'),
+        ('技术能力', 4.0, '第二版修订', '2024-02-01'),
+    ]
+    assert team.get_scoring_rules('2024-01-31') == [('技术能力', 2.0, '第一版', '2024-01-01')]
+    assert team.get_scoring_rules('2023-12-31') == []
+    with pytest.raises(ValueError):
+        team.update_scoring_rule('技术能力', 1.0, '格式错误', '2024/03/01')
+
+def test_simulate_weights_matches_applied_rules(team):
+    """测试一次模拟多组权重，结果与实际设置规则后的排名一致"""
+    weight_sets = [{'技术能力': 0}, {'团队协作': 10, '工作承担': 2}, {}]
+    simulation = team.simulate_weights(START, END, weight_sets)
+    assert simulation.totals.tolist() == [[1, 15, 6], [0, 3, 3], [0, 3, 3]]
+    assert simulation.ranks[:, 0].tolist() == [1, 2, 2]
+    assert simulation.deltas[:, 2].tolist() == [0, 0, 0]
+    assert simulation.changes(2) == []
+
+    team.update_scoring_rule('团队协作', 10, '协作优先', '2024-01-01')
+    team.update_scoring_rule('工作承担', 2, '工作量翻倍', '2024-01-01')
+    assert team.get_cycle_scores(START, END).ranks.tolist() == simulation.ranks[:, 1].tolist()
+
+    with pytest.raises(ValueError):
+        team.simulate_weights(START, END, [{'不存在': 1}])
+
+def test_show_simulate_lists_moved_employees(runner, lisi):
+    """测试 show simulate 逐组显示排名变化的员工"""
+    tracker = lisi
+    tracker.add_category("团队协作", "跨团队协作")
+    tracker.add_performance_records_bulk('技术能力', [(1, 5), (2, 1)], '迭代交付')
+    tracker.add_performance_records_bulk('团队协作', [(2, 3)], '协助排障')
+
+    result = runner.invoke(cli, ['show', 'simulate', '-w', '团队协作=3', '-w', '技术能力=1'])
+    assert result.exit_code == 0
+    assert '方案 1：团队协作=3' in result.output
+    assert '李四' in result.output and '+1' in result.output
+    assert '排名与档位均无变化' in result.output
+
+    result = runner.invoke(cli, ['show', 'simulate', '-w', '技术能力'])
+    assert '模拟失败' in result.output
+
+def test_employee_rank_with_tier_gap(team, add_employee, insert_record):
+    """测试单个员工的排名、百分位、档位和距上一档的分差"""
+    for i in range(4, 11):
+        add_employee(f"员工{i}", f"user{i}", i)
+        insert_record(i, i / 2, '2024-01-15')
+    # 总分依次为 6, 3, 3, 2, 2.5, ..., 5，三人并列 3 分；前 30% 为 3 人，末位 4.5 分
+    assert team.get_employee_rank(1, (START, END)) == (1, 10, 90.0, '前30%', None)
+    assert team.get_employee_rank(2, (START, END)) == (6, 10, 20.0, '中30%', 1.5)
+    assert team.get_employee_rank(4, (START, END)) == (10, 10, 0.0, '后40%', 1.0)
+    assert team.get_employee_rank(99, (START, END)) is None
+
+def test_employee_rank_matches_leaderboard(team, add_employee, insert_record):
+    """测试单个员工的排名在数据库中计算，不加载整个排行榜，结果与 CycleScores 一致"""
+    for i in range(4, 8):
+        add_employee(f"员工{i}", f"user{i}", i)
+        insert_record(i, i / 3, '2024-01-20', category_id=i % 2 + 1)
+    team.update_scoring_rule('团队协作', 1.5, '协作加权', '2024-01-01')
+    team.add_workload_score(3, 2, 2024, 0.0, 2, '第2周')
+    team.toggle_employee_status(5, False)
+    for cycle in [(START, END), ('2024-01-08', '2024-01-25')]:
+        standings = [team.get_employee_rank(employee_id, cycle) for employee_id in range(1, 8)]
+        assert team._scoring is None
+        scores = team.get_cycle_scores(*cycle)
+        assert standings == [scores.standing(employee_id) for employee_id in range(1, 8)]
+        team._scoring = None
+    team.close_performance_cycle(START, END)
+    team.toggle_employee_status(5, True)
+    assert team.get_employee_rank(5, (START, END)) is None
+    assert team.get_employee_rank(3, (START, END)) == team.get_cycle_scores(START, END).standing(3)
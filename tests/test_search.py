@@ -0,0 +1,83 @@
+import pandas as pd
+import pytest
+
+from src.cli.commands import cli
+
+def _insert_record(tracker, employee_id, description, record_date, score=1):
+    with tracker.db.transaction() as conn:
+        cursor = conn.execute(
+            "INSERT INTO performance_records (employee_id, category_id, description, score, record_date) "
+            "VALUES (?, 1, ?, ?, ?)",
+            (employee_id, description, score, record_date)
+        )
+        return cursor.lastrowid
+
+def _fts_consistent(tracker):
+    """FTS5 外部内容表的 integrity-check 同时比对索引与明细表内容，不一致时抛出异常"""
+    with tracker.db.transaction() as conn:
+        for table in ('performance_records_fts', 'workload_scores_fts'):
+            conn.execute(f"INSERT INTO {table} ({table}, rank) VALUES ('integrity-check', 1)")
+    return True
+
+@pytest.fixture
+def incidents(sample_data):
+    tracker = sample_data
+    tracker.first = _insert_record(tracker, 1, '双十一上线事故复盘，负责回滚', '2024-11-12', -3)
+    _insert_record(tracker, 1, '上线顺利完成', '2024-11-20', 2)
+    _insert_record(tracker, 1, '团队事件：上线事故应急处理', '2023-05-06', 1)
+    tracker.replace_weekly_workload(2, 2024, [1], '本周处理上线事故')
+    return tracker
+
+def test_search_records_and_workload(incidents):
+    """测试按关键词检索表现记录和工作量记录，并按日期过滤"""
+    hits = incidents.search_records('上线事故')
+    assert sorted((hit[0], hit[1]) for hit in hits) == [('records', 1), ('records', 3), ('workload', 1)]
+    assert {hit[7] for hit in hits} == {'双十一上线事故复盘，负责回滚', '团队事件：上线事故应急处理', '本周处理上线事故'}
+
+    hits = incidents.search_records('上线事故', '2024-01-01', '2024-12-31')
+    assert sorted((hit[0], hit[1]) for hit in hits) == [('records', 1), ('workload', 1)]
+    assert incidents.search_records('上线事故', '2024-01-01', '2024-12-31', sources=('workload',))[0][2:6] == (
+        '2024-01-08', '张三', '研发部', '2024年第2周'
+    )
+    assert len(incidents.search_records('上线事故', limit=1)) == 1
+
+def test_search_short_terms(incidents):
+    """测试少于三个字的关键词逐条匹配，多个关键词须同时出现"""
+    assert [hit[1] for hit in incidents.search_records('回滚')] == [1]
+    assert [hit[1] for hit in incidents.search_records('上线 回滚')] == [1]
+    assert [hit[1] for hit in incidents.search_records('上线事故 回滚')] == [1]
+    assert incidents.search_records('100%') == []
+    with pytest.raises(ValueError):
+        incidents.search_records('  ')
+
+def test_search_index_follows_changes(incidents):
+    """测试修改、删除记录和批量导入后全文索引保持同步"""
+    incidents.update_performance_record(incidents.first, -3, '发布回滚演练')
+    assert [hit[0] for hit in incidents.search_records('上线事故', '2024-01-01', '2024-12-31')] == ['workload']
+    assert [hit[1] for hit in incidents.search_records('回滚演练')] == [incidents.first]
+    incidents.delete_performance_record(incidents.first)
+    assert incidents.search_records('回滚演练') == []
+    assert _fts_consistent(incidents)
+
+def test_search_index_after_import(incidents, tmp_path):
+    """测试批量导入的记录同样建立全文索引"""
+    path = tmp_path / 'records.csv'
+    pd.DataFrame([
+        {'domain_account': 'zhangsan', 'category': '技术能力', 'score': 1, 'description': '导入的线上事故记录', 'record_date': '2024-06-01'},
+    ]).to_csv(path, index=False)
+    assert incidents.import_data('records', str(path)) == (1, 0)
+    assert [hit[7] for hit in incidents.search_records('线上事故')] == ['导入的线上事故记录']
+    assert _fts_consistent(incidents)
+    # 导入期间移除的全文索引触发器已恢复
+    incidents.add_performance_record(1, '技术能力', '逐条添加的线上事故', 1)
+    assert len(incidents.search_records('线上事故')) == 2
+
+def test_rec_search_command(runner, incidents):
+    """测试 rec search 命令"""
+    result = runner.invoke(cli, ['rec', 'search', '上线事故', '--year', '2024'])
+    assert result.exit_code == 0
+    assert '检索结果（共 2 条）' in result.output
+    assert '双十一上线事故复盘' in result.output and '工作量' in result.output
+
+    result = runner.invoke(cli, ['rec', 'search', '不存在的内容'])
+    assert '没有找到匹配的记录' in result.output
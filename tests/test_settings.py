@@ -0,0 +1,45 @@
+import sqlite3
+from datetime import date
+
+import pytest
+
+from src.core.cache import Settings
+from src.utils.dates import cycle_bounds
+
+@pytest.mark.parametrize('cycle_type, day, expected', [
+    ('monthly', date(2024, 2, 15), ('2024-02-01', '2024-02-29')),
+    ('monthly', date(2024, 12, 31), ('2024-12-01', '2024-12-31')),
+    ('quarterly', date(2024, 5, 1), ('2024-04-01', '2024-06-30')),
+    ('quarterly', date(2024, 11, 30), ('2024-10-01', '2024-12-31')),
+])
+def test_cycle_bounds(cycle_type, day, expected):
+    """测试月度和季度周期的起止日期"""
+    assert cycle_bounds(cycle_type, day) == expected
+
+def test_settings_snapshot(sample_data):
+    """测试全局设置以快照形式读取，本跟踪器修改后立即生效"""
+    tracker = sample_data
+    assert tracker.get_settings() == Settings(performance_cycle='monthly')
+    tracker.update_global_setting('default_department', '研发部', '默认部门')
+    assert tracker.get_settings().default_department == '研发部'
+
+def test_current_cycle_memoized(sample_data):
+    """测试重复获取当前周期只检查数据库状态，其他连接修改设置后重新加载"""
+    tracker = sample_data
+    monthly = tracker.get_current_performance_cycle()
+
+    statements = []
+    conn = tracker.db.connection()
+    conn.set_trace_callback(statements.append)
+    assert tracker.get_current_performance_cycle() == monthly
+    conn.set_trace_callback(None)
+    assert statements == ['PRAGMA data_version']
+
+    with sqlite3.connect(tracker.db.db_path) as other:
+        other.execute("UPDATE global_settings SET value = 'quarterly' WHERE key = 'performance_cycle'")
+    other.close()
+    assert tracker.get_current_performance_cycle() == cycle_bounds('quarterly', date.today())
+
+def test_current_cycle_unset(tracker):
+    """测试未设置绩效周期时返回 (None, None)"""
+    assert tracker.get_current_performance_cycle() == (None, None)
@@ -0,0 +1,55 @@
+from src.cli.commands import cli
+from src.cli.shell import ShellCompleter
+from src.core.tracker import PerformanceTracker
+
+def test_shell_session(runner, sample_data, monkeypatch):
+    """测试交互模式连续执行命令，所有命令共用一个跟踪器"""
+    created = []
+    original_init = PerformanceTracker.__init__
+    def counting_init(self, *args, **kwargs):
+        created.append(self)
+        original_init(self, *args, **kwargs)
+    monkeypatch.setattr(PerformanceTracker, '__init__', counting_init)
+
+    session = '\n'.join([
+        'emp list',
+        'rec add', '1', '1', '+5', '完成新功能开发', 'y',
+        'rec add', '1', '1', '-2', '代码质量问题', 'n',
+        'rec list',
+        'exit',
+    ]) + '\n'
+    result = runner.invoke(cli, ['shell'], input=session)
+    assert result.exit_code == 0
+    assert len(created) == 1
+    assert '张三' in result.output
+    assert result.output.count('记录添加成功') == 1
+    assert '操作已取消' in result.output
+    assert '完成新功能开发' in result.output.split('perf> ')[-2]
+
+def test_shell_errors_keep_session(runner, sample_data):
+    """测试命令出错、取消或输入结束时会话正常结束"""
+    result = runner.invoke(cli, ['shell'], input='bogus\nrec list --bad\n"unterminated\nshell\nhelp emp\nrec add\n1\n')
+    assert result.exit_code == 0
+    assert "No such command 'bogus'" in result.output
+    assert 'No such option' in result.output
+    assert '无法解析命令' in result.output
+    assert '已在交互模式中' in result.output
+    assert '员工管理相关命令' in result.output
+    assert result.output.rstrip().endswith('操作已取消\nperf>')
+
+def test_shell_completion(sample_data):
+    """测试命令补全和员工、类别目录补全"""
+    completer = ShellCompleter(cli, sample_data)
+    assert completer.command_candidates('') == sorted([
+        'batch', 'cat', 'cycle', 'emp', 'export', 'import', 'rec', 'set', 'show', 'work', 'help', 'exit', 'quit'
+    ])
+    assert completer.command_candidates('re') == ['rec']
+    assert 'search' in completer.command_candidates('rec ')
+    assert completer.command_candidates('rec list --f') == ['--format']
+    assert completer.command_candidates('nope ') == []
+
+    assert completer.directory_candidates('1') == ['1']
+    assert completer.directory_candidates('张') == ['1']
+    assert completer.directory_candidates('zh') == ['1']
+    assert completer.directory_candidates('技') == ['技术能力']
+    assert completer.directory_candidates('无') == []
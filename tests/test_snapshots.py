@@ -0,0 +1,110 @@
+import sqlite3
+
+import pytest
+
+from src.cli.commands import cli
+
+JANUARY = ('2024-01-01', '2024-01-31')
+FEBRUARY = ('2024-02-01', '2024-02-29')
+
+@pytest.fixture
+def closed(lisi, insert_record):
+    """一月份已关闭，二月份未关闭"""
+    tracker = lisi
+    tracker.record_id = insert_record(1, 5, '2024-01-10')
+    insert_record(2, 3, '2024-01-20')
+    insert_record(2, 4, '2024-02-05')
+    tracker.add_workload_score(2, 2, 2024, 0.0, 10, '2024年第2周工作量评分')
+    tracker.snapshot_id, tracker.checksum = tracker.close_performance_cycle(*JANUARY)
+    return tracker
+
+def test_closed_cycle_reads_snapshot(closed):
+    """测试关闭后修改历史记录不影响已关闭周期的统计"""
+    before = closed.get_performance_summary(*JANUARY)
+    assert before == ([(2, '李四', '测试部', 10.0, 3.0, 13.0), (1, '张三', '研发部', 0.0, 5.0, 5.0)], ['技术能力'])
+
+    closed.update_performance_record(closed.record_id, 20, '事后修改')
+    closed.toggle_employee_status(2, False)
+    closed.update_scoring_rule('技术能力', 3.0, '事后调整权重', '2024-01-01')
+    assert closed.get_performance_summary(*JANUARY) == before
+    assert closed.get_cycle_scores(*JANUARY).snapshot_id == closed.snapshot_id
+    assert closed.get_employee_rank(2, JANUARY)[0] == 1
+
+    # 未关闭的周期仍从明细计算
+    assert closed.get_cycle_scores(*FEBRUARY).snapshot_id is None
+    assert closed.get_performance_summary(*FEBRUARY)[0] == [(1, '张三', '研发部', 0.0, 0.0, 0.0)]
+
+def test_close_cycle_twice_fails(closed):
+    """测试同一周期不能重复关闭"""
+    with pytest.raises(ValueError):
+        closed.close_performance_cycle(*JANUARY)
+
+def test_closed_cycle_rejects_new_records(closed, tmp_path):
+    """测试不能再添加日期在已关闭周期内的记录"""
+    with pytest.raises(ValueError, match='已关闭'):
+        closed.replace_weekly_workload(2, 2024, [1, 2], '补录')
+    with pytest.raises(ValueError, match='已关闭'):
+        closed.add_workload_score(1, 3, 2024, 0.0, 10, '补录')
+    closed.replace_weekly_workload(5, 2024, [1, 2], '二月第一周')
+
+    path = tmp_path / 'ops.jsonl'
+    path.write_text(
+        '{"op": "record", "employee": 1, "category": "技术能力", "score": 1, "description": "补录", "date": "2024-01-15"}\n'
+        '{"op": "workload", "year": 2024, "week": 1, "employees": [1]}\n',
+        encoding='utf-8'
+    )
+    assert [position for position, _ in closed.apply_batch(str(path), dry_run=True)[1]] == [1, 2]
+
+    closed.close_performance_cycle()
+    with pytest.raises(ValueError, match='已关闭'):
+        closed.add_performance_record(1, '技术能力', '周期关闭后补录', 1)
+    with pytest.raises(ValueError, match='已关闭'):
+        closed.add_performance_records_bulk('技术能力', [(1, 1), (2, 1)], '团队事件')
+
+def test_snapshot_checksum_detects_changes(closed):
+    """测试快照不可修改和删除，事后补写的得分行会被校验发现"""
+    assert closed.verify_cycle_snapshot(closed.snapshot_id) is True
+    assert closed.verify_cycle_snapshot(99) is None
+    with pytest.raises(sqlite3.IntegrityError):
+        with closed.db.transaction() as conn:
+            conn.execute("UPDATE cycle_snapshot_scores SET total_score = 100 WHERE employee_id = 1")
+    for table in ('cycle_snapshots', 'cycle_snapshot_scores', 'cycle_snapshot_category_scores'):
+        with pytest.raises(sqlite3.IntegrityError):
+            with closed.db.transaction() as conn:
+                conn.execute(f"DELETE FROM {table}")
+    assert closed.get_cycle_scores(*JANUARY).snapshot_id == closed.snapshot_id
+    with closed.db.transaction() as conn:
+        conn.execute(
+            "INSERT INTO cycle_snapshot_category_scores (snapshot_id, employee_id, category, score) VALUES (?, 1, '事后补充', 1)",
+            (closed.snapshot_id,)
+        )
+    assert closed.verify_cycle_snapshot(closed.snapshot_id) is False
+
+def test_cycle_report_spans_closed_cycles(closed):
+    """测试年度报告只汇总已关闭周期的快照"""
+    closed.close_performance_cycle(*FEBRUARY)
+    cycles, rows = closed.get_cycle_report(2024)
+    assert cycles == [JANUARY, FEBRUARY]
+    assert rows == [
+        (2, '李四', '测试部', [(13.0, 1), (4.0, 1)], 17.0),
+        (1, '张三', '研发部', [(5.0, 2), (0.0, 2)], 5.0),
+    ]
+    assert closed.get_cycle_report(2023) == ([], [])
+    assert [cycle[1:3] for cycle in closed.get_closed_cycles()] == [JANUARY, FEBRUARY]
+
+def test_cycle_commands(runner, closed):
+    """测试 cycle close/list/report 命令"""
+    result = runner.invoke(cli, ['cycle', 'close', '--start', FEBRUARY[0], '--end', FEBRUARY[1]])
+    assert result.exit_code == 0
+    assert '已关闭绩效周期 2024-02-01 至 2024-02-29' in result.output
+
+    result = runner.invoke(cli, ['cycle', 'close', '--start', FEBRUARY[0], '--end', FEBRUARY[1]])
+    assert '关闭失败' in result.output
+
+    result = runner.invoke(cli, ['cycle', 'list'])
+    assert result.exit_code == 0
+    assert result.output.count('一致') == 2
+
+    result = runner.invoke(cli, ['cycle', 'report', '--year', '2024'])
+    assert result.exit_code == 0
+    assert '13.00（第1名）' in result.output
@@ -0,0 +1,51 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.bench_startup import RUNNER
+from src.cli.commands import COMMANDS, cli
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 这些模块导入耗时较长，只在用到的命令中加载
+HEAVY_MODULES = ('pandas', 'numpy', 'tabulate', 'src.core.scoring', 'src.core.importer', 'src.core.export')
+
+def _run(args, *options):
+    """在新进程中执行命令，退出前输出已加载的重型模块"""
+    code = RUNNER.replace(
+        "cli(sys.argv[1:], prog_name='perf')",
+        "cli(sys.argv[1:], prog_name='perf', standalone_mode=False); "
+        f"print(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules), file=sys.stderr)"
+    )
+    result = subprocess.run(
+        [sys.executable, *options, '-c', code, *args],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stderr
+
+@pytest.mark.parametrize('args', [
+    ['--help'], ['emp', '--help'], ['rec', 'search', '--help'], ['import', '--help'], ['export', '--help'],
+])
+def test_help_skips_heavy_modules(test_db, args):
+    """测试显示帮助时不加载重型模块（导入耗时预算见 benchmarks/bench_startup.py）"""
+    assert _run(args).splitlines()[-1] == '[]'
+
+def test_simple_command_skips_numeric_modules(test_db):
+    """测试普通查询命令不加载 NumPy/pandas"""
+    loaded = _run(['emp', 'list']).splitlines()[-1]
+    assert 'numpy' not in loaded and 'pandas' not in loaded
+
+def test_lazy_commands_registered(runner):
+    """测试登记的子命令均可加载，且登记的简短说明与命令自身的说明一致"""
+    for name, (_, _, short_help) in COMMANDS.items():
+        command = cli.get_command(None, name)
+        assert command is not None
+        assert command.get_short_help_str(limit=200).startswith(short_help)
+
+    result = runner.invoke(cli, ['--help'])
+    assert result.exit_code == 0
+    for name in COMMANDS:
+        assert f'  {name} ' in result.output
@@ -0,0 +1,80 @@
+import click
+import pytest
+from tabulate import tabulate
+
+from src.cli.commands import cli
+from src.cli.common import display_width, stream_table
+
+HEADERS = ['ID', '员工', '分值', '描述']
+
+def _rows(count, description='完成功能开发'):
+    for i in range(1, count + 1):
+        yield [i, '张三' if i % 2 else 'lisi', click.style(f'{i - 3:>+6.2f}', fg='green'), description * (i % 3 + 1)]
+
+def test_single_page_uses_tabulate():
+    """测试记录不超过一页时输出与 tabulate 一致"""
+    rows = list(_rows(5))
+    assert ''.join(stream_table(rows, HEADERS, 'grid', page_size=5)) == \
+        tabulate(rows, headers=HEADERS, tablefmt='grid') + '\n\n'
+    assert list(stream_table([], HEADERS)) == []
+
+@pytest.mark.parametrize('fmt', ['simple', 'grid', 'fancy_grid', 'plain'])
+def test_pages_share_column_widths(fmt):
+    """测试多页输出时每页重复表头，各页列宽一致"""
+    pages = [page.splitlines() for page in ''.join(stream_table(_rows(7), HEADERS, fmt, page_size=3)).split('\n\n') if page]
+    assert len(pages) == 3
+    assert pages[1][0] == pages[2][0] == pages[0][0]
+    assert len({display_width(line) for page in pages for line in page}) == 1
+
+def test_grid_layout():
+    """测试 grid 格式的分隔线和对齐方式与 tabulate 一致"""
+    rows = [[1, '张三', '+5.00'], [12, 'lisi', '-2.00'], [3, '王五', '+1.00']]
+    assert ''.join(stream_table(rows, ['ID', '员工', '分值'], 'grid', page_size=2)).splitlines()[:7] == [
+        '+------+--------+--------+',
+        '|   ID | 员工   |   分值 |',
+        '+======+========+========+',
+        '|    1 | 张三   |  +5.00 |',
+        '+------+--------+--------+',
+        '|   12 | lisi   |  -2.00 |',
+        '+------+--------+--------+',
+    ]
+
+def test_rows_rendered_as_they_arrive():
+    """测试第一页之后的行读到一行输出一行"""
+    consumed = []
+    def rows():
+        for row in _rows(1000):
+            consumed.append(row[0])
+            yield row
+    output = stream_table(rows(), HEADERS, 'simple', page_size=10)
+    first_lines = [next(output) for _ in range(12)]
+    assert len(consumed) == 11
+    assert first_lines[2].split()[0] == '1'
+
+def test_wide_cells_truncated_and_width_hints():
+    """测试超出列宽的文本截断，数字列不截断，widths 指定列宽"""
+    rows = [[1, '短'], [2, '短短'], [123456, '这是一条特别长的描述'], [4, 'abcdefghijk']]
+    lines = ''.join(stream_table(rows, ['ID', '描述'], 'simple', page_size=2)).rstrip('\n').splitlines()
+    assert lines[-2].rstrip() == '123456  这是…'
+    assert lines[-1].rstrip() == '   4  abcde…'
+
+    lines = ''.join(stream_table(rows, ['ID', '描述'], 'simple', page_size=2, widths={'描述': 8})).rstrip('\n').splitlines()
+    assert lines[-2].rstrip() == '123456  这是一…'
+    assert lines[-1].rstrip() == '   4  abcdefg…'
+
+def test_other_formats_paged_by_tabulate():
+    """测试流式渲染不支持的格式按页交给 tabulate"""
+    rows = list(_rows(4))
+    assert ''.join(stream_table(rows, HEADERS, 'github', page_size=3)) == (
+        tabulate(rows[:3], headers=HEADERS, tablefmt='github') + '\n\n'
+        + tabulate(rows[3:], headers=HEADERS, tablefmt='github') + '\n\n'
+    )
+
+def test_emp_list_pages(runner, sample_data):
+    """测试 emp list 超过一页时按页重复表头"""
+    sample_data.add_employee('李四', 'lisi', '男', '上海', '复旦大学', '软件工程', '13800138001',
+                             '110101199001011235', '研发部', 'P3-1', '2023-01-01')
+    result = runner.invoke(cli, ['emp', 'list', '--page-size', '1'])
+    assert result.exit_code == 0
+    assert result.output.count('姓名') == 2
+    assert '张三' in result.output and '李四' in result.output
@@ -0,0 +1,97 @@
+import csv
+import io
+import json
+from datetime import date
+
+import pytest
+
+from src.cli.commands import cli
+from src.cli.common import structured_lines
+
+COLUMNS = ('id', 'name', 'score')
+
+@pytest.fixture
+def scored(sample_data):
+    """张三本周有一条表现记录和一条工作量记录"""
+    sample_data.add_performance_record(1, '技术能力', '完成接口重构, "含引号"', 2.5)
+    year, week, _ = date.today().isocalendar()
+    sample_data.replace_weekly_workload(week, year, [1], '本周承担主要开发')
+    return sample_data
+
+def test_structured_lines():
+    """测试三种格式的文本，空数据时 json 为 []、csv 只有列名"""
+    rows = [(1, '张三', 2.5), (2, 'li,si', None)]
+    assert ''.join(structured_lines(rows, COLUMNS, 'ndjson')).splitlines() == [
+        '{"id": 1, "name": "张三", "score": 2.5}',
+        '{"id": 2, "name": "li,si", "score": null}',
+    ]
+    assert json.loads(''.join(structured_lines(rows, COLUMNS, 'json'))) == [
+        {'id': 1, 'name': '张三', 'score': 2.5}, {'id': 2, 'name': 'li,si', 'score': None},
+    ]
+    assert ''.join(structured_lines(rows, COLUMNS, 'csv')) == 'id,name,score\n1,张三,2.5\n2,"li,si",\n'
+    assert ''.join(structured_lines([], COLUMNS, 'json')) == '[]\n'
+    assert ''.join(structured_lines([], COLUMNS, 'csv')) == 'id,name,score\n'
+    assert ''.join(structured_lines([], COLUMNS, 'ndjson')) == ''
+
+def test_rows_converted_as_they_arrive():
+    """测试读到一行转换一行"""
+    consumed = []
+    def rows():
+        for i in range(1000):
+            consumed.append(i)
+            yield (i, '张三', i)
+    lines = structured_lines(rows(), COLUMNS, 'json')
+    next(lines)
+    assert consumed == [0]
+
+def test_rec_list_formats(runner, scored):
+    """测试 rec list 输出原始值，不带标题和着色"""
+    result = runner.invoke(cli, ['rec', 'list', '--format', 'ndjson'])
+    assert result.exit_code == 0
+    record = json.loads(result.output)
+    assert record['employee_name'] == '张三'
+    assert record['score'] == 2.5
+    assert record['description'] == '完成接口重构, "含引号"'
+    assert '\x1b' not in result.output
+
+    result = runner.invoke(cli, ['rec', 'list', '--format', 'csv'])
+    rows = list(csv.DictReader(io.StringIO(result.output)))
+    assert list(rows[0]) == ['id', 'employee_name', 'department', 'category', 'score', 'description', 'record_date']
+    assert rows[0]['description'] == '完成接口重构, "含引号"'
+
+@pytest.mark.parametrize('args', [['work', 'list'], ['rec', 'work']])
+def test_workload_formats(runner, scored, args):
+    """测试 work list 和 rec work 按周查看与按周期查看的列一致"""
+    year, week, _ = date.today().isocalendar()
+    by_cycle = json.loads(runner.invoke(cli, [*args, '--format', 'json']).output)
+    by_week = json.loads(runner.invoke(cli, [*args, '--format', 'json', '--week', str(week), '--year', str(year)]).output)
+    assert by_cycle == by_week == [{
+        'year': year, 'week_number': week, 'employee_name': '张三', 'department': '研发部',
+        'ranking_percentage': 0.0, 'score': by_cycle[0]['score'], 'description': '本周承担主要开发',
+    }]
+
+def test_emp_list_and_show_formats(runner, scored):
+    """测试 emp list、show perf 和 show detail 的结构化输出"""
+    employees = json.loads(runner.invoke(cli, ['emp', 'list', '-f', 'json']).output)
+    assert employees == [{
+        'id': 1, 'name': '张三', 'domain_account': 'zhangsan', 'department': '研发部', 'position': 'P3-2',
+        'is_active': True,
+    }]
+
+    summary = json.loads(runner.invoke(cli, ['show', 'perf', '-f', 'ndjson']).output)
+    assert list(summary) == ['employee_id', 'name', 'department', 'workload', '技术能力', 'total']
+    assert summary['技术能力'] == 2.5
+
+    details = [json.loads(line) for line in runner.invoke(cli, ['show', 'detail', '1', '-f', 'ndjson']).output.splitlines()]
+    assert [detail['source'] for detail in details] == ['workload', 'record']
+    assert details[1]['category'] == '技术能力'
+
+def test_empty_and_errors(runner, test_db):
+    """测试没有数据时输出空结果，提示信息写到标准错误"""
+    result = runner.invoke(cli, ['emp', 'list', '-f', 'json'])
+    assert result.exit_code == 0
+    assert result.output == '[]\n'
+
+    result = runner.invoke(cli, ['show', 'perf', '-f', 'csv'], catch_exceptions=False)
+    assert result.stdout == ''
+    assert '请先设置绩效周期' in result.stderr
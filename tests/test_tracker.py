@@ -0,0 +1,172 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from src.core.tracker import PerformanceTracker, rank_workload_scores
+
+def test_add_performance_records_bulk(sample_data):
+    """测试批量添加表现记录并返回失败的行"""
+    tracker = sample_data
+    tracker.add_employee("李四", "lisi", "女", "上海", "复旦大学", "软件工程", "13900139000",
+                         "310101199202021234", "研发部", "P3-1", "2023-02-01")
+    tracker.toggle_employee_status(2, False)
+
+    tracker.dimensions.invalidate()
+    statements = []
+    conn = tracker.db.connection()
+    conn.set_trace_callback(statements.append)
+    failures = tracker.add_performance_records_bulk('技术能力', [(1, 5.0), (2, 3.0), (99, 1.0)], '团队事件：项目交付')
+    conn.set_trace_callback(None)
+
+    assert failures == [(2, '员工不存在或未激活'), (99, '员工不存在或未激活')]
+    assert statements.count('COMMIT') == 1
+    # 类别和员工各只加载一次
+    assert len([s for s in statements if 'FROM performance_categories' in s]) == 1
+    assert len([s for s in statements if 'FROM employees' in s]) == 1
+    records = tracker.get_all_performance_records()
+    assert [(r[1], r[3], r[4], r[5]) for r in records] == [('张三', '技术能力', 5.0, '团队事件：项目交付')]
+
+def test_add_performance_records_bulk_inactive_category(sample_data):
+    """测试批量添加时类别未启用"""
+    tracker = sample_data
+    tracker.toggle_category_status('技术能力', False)
+    with pytest.raises(ValueError):
+        tracker.add_performance_records_bulk('技术能力', [(1, 5.0)], '团队事件')
+    assert tracker.get_all_performance_records() == []
+
+def test_rank_workload_scores():
+    """测试工作量排名得分划分"""
+    rankings = rank_workload_scores(list(range(1, 11)))
+    assert [score for _, _, score in rankings] == [10, 10, 10, 8, 8, 8, 7, 7, 7, 7]
+    assert [pct for _, pct, _ in rankings][:3] == [0.0, 10.0, 20.0]
+
+def test_replace_weekly_workload_is_idempotent(sample_data):
+    """测试重复录入同一周的排名会覆盖而不是追加"""
+    tracker = sample_data
+    tracker.add_employee("李四", "lisi", "女", "上海", "复旦大学", "软件工程", "13900139000",
+                         "310101199202021234", "研发部", "P3-1", "2023-02-01")
+    tracker.replace_weekly_workload(10, 2024, [1, 2], '2024年第10周工作量评分')
+    tracker.replace_weekly_workload(10, 2024, [2, 1], '2024年第10周工作量评分')
+
+    records = tracker.get_workload_records_by_week(10, 2024)
+    assert [(r[1], r[4]) for r in records] == [('李四', 0.0), ('张三', 50.0)]
+
+    # 新排名中不再包含的员工，其旧记录被删除
+    tracker.replace_weekly_workload(10, 2024, [1], '2024年第10周工作量评分')
+    records = tracker.get_workload_records_by_week(10, 2024)
+    assert [r[1] for r in records] == ['张三']
+    summary, _ = tracker.get_performance_summary('2024-03-01', '2024-03-31')
+    assert summary[0][3] == 7
+
+def test_dimension_cache_invalidated_by_own_writes(sample_data):
+    """测试跟踪器自身的写操作使维度缓存失效"""
+    tracker = sample_data
+    assert tracker.get_category_id('技术能力') == 1
+    tracker.toggle_category_status('技术能力', False)
+    assert tracker.get_category_id('技术能力') is None
+    assert tracker.get_category_id('技术能力', active_only=False) == 1
+
+    assert tracker.get_employee_id_by_account('lisi') is None
+    tracker.add_employee("李四", "lisi", "女", "上海", "复旦大学", "软件工程", "13900139000",
+                         "310101199202021234", "研发部", "P3-1", "2023-02-01")
+    assert tracker.get_employee_id_by_account('lisi') == 2
+    assert tracker.get_employee(2)[1] == '李四'
+
+def test_dimension_cache_sees_other_connections(sample_data, test_db):
+    """测试其他连接提交的修改通过 data_version 被检测到"""
+    tracker = sample_data
+    assert [emp[1] for emp in tracker.get_all_employees()] == ['张三']
+
+    other = PerformanceTracker(test_db)
+    other.add_employee("李四", "lisi", "女", "上海", "复旦大学", "软件工程", "13900139000",
+                       "310101199202021234", "研发部", "P3-1", "2023-02-01")
+    other.toggle_category_status('技术能力', False)
+    other.db.close()
+
+    assert [emp[1] for emp in tracker.get_all_employees()] == ['李四', '张三']
+    assert tracker.get_active_categories() == []
+
+def test_dimension_cache_data_version_per_connection(sample_data, test_db):
+    """测试 data_version 按连接比较：各线程的连接计数不同，不能与其他线程记录的值比较"""
+    tracker = sample_data
+    other = PerformanceTracker(test_db)
+    tracker.get_all_employees()
+    other.add_employee("李四", "lisi", "女", "上海", "复旦大学", "软件工程", "13900139000",
+                       "310101199202021234", "研发部", "P3-1", "2023-02-01")
+    assert len(tracker.get_all_employees()) == 2
+
+    with ThreadPoolExecutor(max_workers=1) as worker:
+        # 工作线程的连接在第一次修改之后建立，其 data_version 落后于主线程的连接
+        worker.submit(tracker.db.connection).result()
+        other.add_employee("王五", "wangwu", "男", "北京", "清华大学", "计算机科学", "13900139001",
+                           "310101199202021235", "研发部", "P3-1", "2023-02-01")
+        assert len(worker.submit(tracker.get_all_employees).result()) == 3
+    other.db.close()
+
+def test_performance_summary_category_with_quote(sample_data):
+    """测试类别名称包含引号和空格时绩效统计正常"""
+    tracker = sample_data
+    tracker.add_category("O'Reilly 分享", "技术分享")
+    tracker.add_performance_record(1, "O'Reilly 分享", '内部分享', 2)
+    tracker.add_performance_record(1, '技术能力', '完成新功能开发', 5)
+    start_date, end_date = tracker.get_current_performance_cycle()
+    summary, categories = tracker.get_performance_summary(start_date, end_date)
+    assert categories == ["O'Reilly 分享", '技术能力']
+    assert summary == [(1, '张三', '研发部', 0, 2.0, 5.0, 7.0)]
+
+def test_performance_summary_sql_independent_of_categories(sample_data):
+    """测试绩效统计的 SQL 不随类别集合变化，可被语句缓存复用"""
+    tracker = sample_data
+    start_date, end_date = tracker.get_current_performance_cycle()
+
+    def summary_statements():
+        statements = []
+        conn = tracker.db.connection()
+        conn.set_trace_callback(statements.append)
+        _, categories = tracker.get_performance_summary(start_date, end_date)
+        conn.set_trace_callback(None)
+        return categories, [sql for sql in statements if 'aggregates' in sql]
+
+    _, before = summary_statements()
+    tracker.add_category("团队协作", "跨团队协作")
+    categories, after = summary_statements()
+    assert categories == ['团队协作', '技术能力']
+    assert after == before
+
+def test_iter_performance_records_keyset_pages(sample_data):
+    """测试表现记录按 (记录日期, ID) 键集分页，结果与一次读取一致"""
+    tracker = sample_data
+    tracker.add_category("团队协作", "跨团队协作")
+    with tracker.db.transaction() as conn:
+        conn.executemany(
+            "INSERT INTO performance_records (employee_id, category_id, description, score, record_date) "
+            "VALUES (1, ?, ?, ?, ?)",
+            [(1 + i % 2, f'记录{i}', i, f'2024-01-{1 + i // 3:02d}') for i in range(10)]
+        )
+
+    statements = []
+    conn = tracker.db.connection()
+    conn.set_trace_callback(statements.append)
+    records = list(tracker.iter_performance_records(page_size=3))
+    conn.set_trace_callback(None)
+
+    assert [r[5] for r in records] == [f'记录{i}' for i in (9, 8, 7, 6, 5, 4, 3, 2, 1, 0)]
+    assert len([s for s in statements if 'LIMIT 3' in s]) == 4
+    assert records == tracker.get_all_performance_records()
+    assert [r[5] for r in tracker.iter_performance_records('2024-01-02', '2024-01-03', page_size=2)] == \
+        ['记录8', '记录7', '记录6', '记录5', '记录4', '记录3']
+    assert [r[5] for r in tracker.iter_performance_records(category='团队协作', page_size=2)] == \
+        ['记录9', '记录7', '记录5', '记录3', '记录1']
+    assert list(tracker.iter_performance_records(employee_id=2)) == []
+    assert list(tracker.iter_performance_records(category='不存在')) == []
+
+def test_iter_workload_records_keyset_pages(sample_data):
+    """测试工作量记录按 (年份, 周数, ID) 键集分页"""
+    tracker = sample_data
+    for week in range(1, 8):
+        tracker.add_workload_score(1, week, 2024, 0.0, week, f'2024年第{week}周工作量评分')
+    records = list(tracker.iter_workload_records(page_size=2))
+    assert [r[0] for r in records] == [7, 6, 5, 4, 3, 2, 1]
+    assert records == tracker.get_all_workload_records()
+    # 第5周的周四是 02-01，不属于一月
+    assert [r[0] for r in tracker.iter_workload_records('2024-01-01', '2024-01-31', employee_id=1, page_size=2)] == \
+        [4, 3, 2, 1]
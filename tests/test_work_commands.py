@@ -0,0 +1,26 @@
+from datetime import datetime
+from src.cli.commands import cli
+
+def test_work_add_twice_overwrites(runner, sample_data):
+    """测试重复录入同一周的工作量排名会覆盖原记录"""
+    tracker = sample_data
+    result = runner.invoke(cli, ['work', 'add', '--week', '10'], input='张三\ny\n')
+    assert result.exit_code == 0
+    assert '评分结果已保存' in result.output
+
+    result = runner.invoke(cli, ['work', 'add', '--week', '10'], input='y\n张三\ny\n')
+    assert result.exit_code == 0
+    assert '评分结果已保存' in result.output
+
+    year = datetime.now().year
+    assert len(tracker.get_workload_records_by_week(10, year)) == 1
+
+def test_work_list_streams_pages(runner, sample_data):
+    """测试工作量记录按页输出"""
+    tracker = sample_data
+    for week in range(1, 6):
+        tracker.add_workload_score(1, week, 2024, 0.0, 10, f'2024年第{week}周工作量评分')
+    result = runner.invoke(cli, ['work', 'list', '--all', '--page-size', '2'])
+    assert result.exit_code == 0
+    assert result.output.count('排名百分比') == 3
+    assert result.output.index('2024年第5周') < result.output.index('2024年第1周')
@@ -0,0 +1,54 @@
+import sqlite3
+import pytest
+from src.db.database import PerformanceDB
+from src.utils.dates import cycle_week_range, iso_week_start
+
+@pytest.mark.parametrize('year, week, expected', [
+    (2024, 1, '2024-01-01'),
+    (2026, 1, '2025-12-29'),
+    (2020, 53, '2020-12-28'),
+    (2021, 1, '2021-01-04'),
+])
+def test_iso_week_start(year, week, expected):
+    """测试 ISO 周一日期计算"""
+    assert iso_week_start(year, week) == expected
+
+def test_cycle_week_range():
+    """测试周期对应的周一日期范围（周四落在周期内的周）"""
+    assert cycle_week_range('2026-01-01', '2026-03-31') == ('2025-12-29', '2026-03-28')
+
+def _weeks(tracker, start_date, end_date):
+    return sorted((row[3], row[0]) for row in tracker.get_employee_workload_detail(1, start_date, end_date))
+
+def test_workload_cycle_across_year_boundary(sample_data):
+    """测试跨年的 ISO 周只归入其周四所在的周期"""
+    tracker = sample_data
+    for year, week in [(2025, 52), (2026, 1), (2026, 2), (2020, 53), (2021, 1)]:
+        tracker.add_workload_score(1, week, year, 0.0, 10, f'{year}年第{week}周工作量评分')
+
+    # 2026年第1周（2025-12-29 至 2026-01-04）的周四是 2026-01-01
+    assert _weeks(tracker, '2025-12-01', '2025-12-31') == [(2025, 52)]
+    assert _weeks(tracker, '2026-01-01', '2026-01-31') == [(2026, 1), (2026, 2)]
+    assert _weeks(tracker, '2025-10-01', '2025-12-31') == [(2025, 52)]
+    # 2020年第53周的周四是 2020-12-31
+    assert _weeks(tracker, '2020-12-01', '2020-12-31') == [(2020, 53)]
+    assert _weeks(tracker, '2021-01-01', '2021-03-31') == [(2021, 1)]
+
+    # 汇总与列表使用相同的归属规则
+    summary, _ = tracker.get_performance_summary('2026-01-01', '2026-03-31')
+    assert summary[0][3] == 20
+    records = tracker.get_all_workload_records('2026-01-01', '2026-03-31')
+    assert sorted((r[3], r[0]) for r in records) == [(2026, 1), (2026, 2)]
+
+def test_migration_backfills_week_start(tmp_path):
+    """测试迁移为已有工作量记录回填周一日期"""
+    db_path = str(tmp_path / 'v2.db')
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE workload_scores (id INTEGER PRIMARY KEY AUTOINCREMENT, employee_id INTEGER, "
+                     "week_number INTEGER, year INTEGER, ranking_percentage REAL, score REAL, description TEXT, "
+                     "created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)")
+        conn.execute("INSERT INTO workload_scores (employee_id, week_number, year, score) VALUES (1, 1, 2026, 10)")
+    conn.close()
+    db = PerformanceDB(db_path)
+    assert db.connection().execute("SELECT week_start FROM workload_scores").fetchone()[0] == '2025-12-29'
+    db.close()